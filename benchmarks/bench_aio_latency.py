@@ -0,0 +1,134 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Event loop latency while serving concurrent parse requests.
+
+Clients call extract_datetime and normalize on long utterances, as fast
+as they can, while a probe sleeps 1ms at a time and records how late it
+wakes up: that is how long the event loop was blocked. The modes are:
+
+- inline: the synchronous functions, called in the coroutines
+- thread: lingua_franca.aio with the event loop's thread pool
+- process: lingua_franca.aio with a pool of --workers processes
+
+    python -m benchmarks.bench_aio_latency [--clients N] [--seconds S]
+                                           [--workers N] [--modes inline,..]
+"""
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca import aio, parse
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+UTTERANCES = [
+    "remind me to call mom and pick up the dry cleaning in two hours and "
+    "thirty minutes, or tomorrow at a quarter past seven in the evening if "
+    "the meeting on the third of next month runs late",
+    "what will the weather be like the day after tomorrow at 8 in the "
+    "morning, and next tuesday afternoon at three thirty",
+]
+PROBE_INTERVAL = 0.001
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def _probe(stop, lags):
+    loop = asyncio.get_event_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(loop.time() - start - PROBE_INTERVAL)
+
+
+async def _client(mode, stop, latencies, index):
+    loop = asyncio.get_event_loop()
+    while not stop.is_set():
+        text = UTTERANCES[index % len(UTTERANCES)]
+        index += 1
+        start = loop.time()
+        if mode == "inline":
+            parse.extract_datetime(text, ANCHOR, lang="en")
+            parse.normalize(text, lang="en")
+            # let the other coroutines run between requests
+            await asyncio.sleep(0)
+        else:
+            await asyncio.gather(aio.extract_datetime(text, ANCHOR,
+                                                      lang="en"),
+                                 aio.normalize(text, lang="en"))
+        latencies.append(loop.time() - start)
+
+
+async def _run(mode, clients, seconds):
+    stop = asyncio.Event()
+    lags, latencies = [], []
+    tasks = [asyncio.ensure_future(_probe(stop, lags))] + \
+        [asyncio.ensure_future(_client(mode, stop, latencies, idx))
+         for idx in range(clients)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return sorted(lags), sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=20,
+                        help="concurrent clients")
+    parser.add_argument("--seconds", type=float, default=3.0,
+                        help="duration of each mode")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="processes of the process mode")
+    parser.add_argument("--modes", default="inline,thread,process",
+                        help="comma separated modes")
+    args = parser.parse_args()
+
+    lingua_franca.load_language("en")
+    print("{:<8} {:>9} {:>13} {:>13} {:>13} {:>14}".format(
+        "mode", "requests", "lag p50 (ms)", "lag p99 (ms)", "lag max (ms)",
+        "req p99 (ms)"))
+    for mode in args.modes.split(","):
+        executor = ProcessPoolExecutor(args.workers) \
+            if mode == "process" else None
+        aio.set_executor(executor)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            if executor:
+                # start the processes before measuring
+                loop.run_until_complete(aio.extract_number("one",
+                                                           lang="en"))
+            lags, latencies = loop.run_until_complete(
+                _run(mode, args.clients, args.seconds))
+        finally:
+            loop.close()
+            if executor:
+                executor.shutdown()
+        print("{:<8} {:>9} {:>13.2f} {:>13.2f} {:>13.2f} {:>14.2f}".format(
+            mode, len(latencies), _percentile(lags, 0.5) * 1000,
+            _percentile(lags, 0.99) * 1000, (lags or [0])[-1] * 1000,
+            _percentile(latencies, 0.99) * 1000))
+    aio.set_executor(None)
+
+
+if __name__ == "__main__":
+    main()
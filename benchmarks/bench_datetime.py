@@ -0,0 +1,105 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Per-call cost of extract_datetime_en on typical utterances.
+
+Most of the time goes into converting number words to digits; the
+"cached numbers" column shares that conversion between calls (see
+parse_common.sharing_results) to time the date and time parsing alone.
+The "plan" column resolves a plan made by extract_datetime_plan_en, as
+done when one phrase is evaluated against many anchors.
+
+Then a batch of utterances goes through parse.extract_datetime one by
+one, and through parse.extract_datetimes, in this process and with a
+pool of worker processes.
+
+    python -m benchmarks.bench_datetime [--number N] [--batch N]
+                                        [--workers N]
+"""
+import argparse
+import time
+import timeit
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca.parse import extract_datetime, extract_datetimes
+
+from lingua_franca.lang.parse_common import sharing_results
+from lingua_franca.lang.parse_en import extract_datetime_en, \
+    extract_datetime_plan_en
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+
+UTTERANCES = [
+    "what is the weather like next tuesday",
+    "remind me to call mom in 10 minutes",
+    "set an alarm for 7 o'clock tomorrow morning",
+    "what's the forecast for the day after tomorrow",
+    "my birthday is on the 5th of june, 2025",
+    "the meeting is 2 weeks from next friday at 4pm",
+    "this sentence contains no date at all, does it?",
+]
+
+
+def _per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=500,
+                        help="calls per timing run")
+    parser.add_argument("--batch", type=int, default=20000,
+                        help="utterances in the batch")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="worker processes for extract_datetimes")
+    args = parser.parse_args()
+
+    totals = [0, 0, 0]
+    print("{:>12} {:>16} {:>12}".format("full (us)", "cached numbers",
+                                        "plan (us)"))
+    for text in UTTERANCES:
+        full = _per_call_us(lambda: extract_datetime_en(text, ANCHOR),
+                            args.number)
+        with sharing_results({}):
+            cached = _per_call_us(lambda: extract_datetime_en(text, ANCHOR),
+                                  args.number)
+        plan = extract_datetime_plan_en(text)
+        resolve = _per_call_us(lambda: plan.resolve(ANCHOR), args.number)
+        for idx, per_call in enumerate((full, cached, resolve)):
+            totals[idx] += per_call
+        print("{:>12.2f} {:>16.2f} {:>12.2f}  {}".format(full, cached,
+                                                         resolve, text))
+    print("{:>12.2f} {:>16.2f} {:>12.2f}  mean".format(
+        *[total / len(UTTERANCES) for total in totals]))
+
+    lingua_franca.load_language("en")
+    batch = (UTTERANCES * (args.batch // len(UTTERANCES) + 1))[:args.batch]
+    print()
+    for label, run in (
+            ("extract_datetime loop",
+             lambda: [extract_datetime(text, ANCHOR) for text in batch]),
+            ("extract_datetimes",
+             lambda: extract_datetimes(batch, ANCHOR)),
+            ("extract_datetimes, {} workers".format(args.workers),
+             lambda: extract_datetimes(batch, ANCHOR,
+                                       workers=args.workers))):
+        start = time.perf_counter()
+        run()
+        print("{:>10.2f} s  {}".format(time.perf_counter() - start, label))
+
+if __name__ == "__main__":
+    main()
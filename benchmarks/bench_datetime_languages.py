@@ -0,0 +1,96 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Per-call cost of extract_datetime_xx across languages.
+
+The number conversion is shared between calls (see
+parse_common.sharing_results), so the numbers reflect the date and time
+parsing itself. Languages marked with "*" run on the shared engine: they
+look their keywords up in a parse_common.DatetimeVocabulary and finish
+with parse_common.resolve_datetime.
+
+    python -m benchmarks.bench_datetime_languages [--number N]
+"""
+import argparse
+import importlib
+import timeit
+from datetime import datetime
+
+from lingua_franca.lang.parse_common import DatetimeVocabulary, \
+    sharing_results
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+
+# lang: utterances
+UTTERANCES = {
+    "ca": ["quin temps farà demà a les 8 del matí",
+           "recorda'm que truqui la mare d'aquí a 3 dies"],
+    "cs": ["jaké bude počasí příští úterý",
+           "připomeň mi zavolat mámě za 10 minut"],
+    "da": ["hvordan er vejret i morgen klokken 8",
+           "mind mig om at ringe til mor om 3 dage"],
+    "de": ["wie wird das Wetter nächsten Dienstag",
+           "erinnere mich in 10 Minuten an den Anruf"],
+    "en": ["what is the weather like next tuesday",
+           "remind me to call mom in 10 minutes"],
+    "es": ["qué tiempo hará el próximo martes",
+           "recuérdame llamar a mamá dentro de 3 días"],
+    "fa": ["هوا فردا چطور است",
+           "سه روز بعد به مامان زنگ بزن"],
+    "fr": ["quel temps fera-t-il mardi prochain",
+           "rappelle-moi d'appeler maman dans 10 minutes"],
+    "it": ["che tempo farà martedì prossimo",
+           "ricordami di chiamare la mamma tra 3 giorni"],
+    "nl": ["wat voor weer is het volgende dinsdag",
+           "herinner me over 10 minuten om mama te bellen"],
+    "pl": ["jaka będzie pogoda w następny wtorek",
+           "przypomnij mi zadzwonić do mamy za 10 minut"],
+    "pt": ["como vai estar o tempo na próxima terça",
+           "lembra-me de ligar à mãe daqui a 3 dias"],
+    "sv": ["hur blir vädret nästa tisdag",
+           "påminn mig att ringa mamma om 10 minuter"],
+}
+
+
+def _per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def _uses_vocabulary(module):
+    return any(isinstance(value, DatetimeVocabulary)
+               for value in vars(module).values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=500,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    print("{:<6} {:>14}".format("lang", "per call (us)"))
+    for lang, texts in sorted(UTTERANCES.items()):
+        module = importlib.import_module("lingua_franca.lang.parse_" + lang)
+        func = getattr(module, "extract_datetime_" + lang)
+        with sharing_results({}):
+            per_call = sum(_per_call_us(lambda: func(text, ANCHOR),
+                                        args.number)
+                           for text in texts) / len(texts)
+        print("{:<6} {:>14.2f}".format(
+            lang + ("*" if _uses_vocabulary(module) else ""), per_call))
+
+
+if __name__ == "__main__":
+    main()
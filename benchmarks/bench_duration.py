@@ -0,0 +1,76 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Per-call cost of extract_duration in every language that implements it.
+
+Each language matches its duration units with regexes compiled once;
+the "regex only" column times those passes on their own, on text that
+already has its numbers as digits, to separate them from the number
+conversion.
+
+    python -m benchmarks.bench_duration [--number N]
+"""
+import argparse
+import timeit
+
+from lingua_franca.lang import parse_cs, parse_de, parse_en, parse_fr, \
+    parse_nl, parse_pl
+from lingua_franca.lang.parse_common import consume_durations
+
+# (language, extract_duration, regex, units, utterance with digits)
+LANGUAGES = [
+    ("en", parse_en.extract_duration_en, parse_en._DURATION_REGEXES_EN,
+     parse_en._DURATION_UNITS_EN,
+     "remind me in 3 days 8 hours 10 minutes and 49 seconds"),
+    ("nl", parse_nl.extract_duration_nl, parse_nl._DURATION_REGEXES_NL,
+     parse_nl._DURATION_UNITS_NL,
+     "herinner me over 3 dagen 8 uur 10 minuten en 49 seconden"),
+    ("de", parse_de.extract_duration_de, parse_de._DURATION_REGEXES_DE,
+     parse_de._DURATION_UNITS_DE,
+     "erinnere mich in 3 tage 8 stunden 10 minuten und 49 sekunden"),
+    ("cs", parse_cs.extract_duration_cs, parse_cs._DURATION_REGEXES_CS,
+     parse_cs._TIME_UNITS_CONVERSION,
+     "připomeň mi za 3 dny 8 hodin 10 minut a 49 sekund"),
+    ("pl", parse_pl.extract_duration_pl, parse_pl._DURATION_REGEXES_PL,
+     parse_pl._TIME_UNITS_CONVERSION,
+     "przypomnij mi za 3 dni 8 godzin 10 minut i 49 sekund"),
+    ("fr", parse_fr.extract_duration_fr, parse_fr._DURATION_REGEXES_FR,
+     parse_fr._DURATION_UNITS_FR,
+     "rappelle-moi dans 3 jours 8 heures 10 minutes et 49 secondes"),
+]
+
+
+def _per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=1000,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    print("{:<6} {:>16} {:>16}".format("lang", "extract (us)",
+                                       "regex only (us)"))
+    for lang, extract_duration, regexes, units, text in LANGUAGES:
+        extract = _per_call_us(lambda: extract_duration(text), args.number)
+        regex_only = _per_call_us(
+            lambda: consume_durations(text, regexes, units), args.number)
+        print("{:<6} {:>16.2f} {:>16.2f}".format(lang, extract, regex_only))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#
+# Copyright 2018 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cost of formatting many quantities with nice_number and nice_numbers.
+
+Formats --count quantities, most of them simple fractions, the others
+without a fraction over 20, one nice_number() call at a time, then with
+nice_numbers(), with and without NumPy.
+
+    python -m benchmarks.bench_nice_numbers [--count N] [--lang en]
+"""
+import argparse
+import random
+import time
+from unittest.mock import patch
+
+import lingua_franca
+from lingua_franca.format import nice_number, nice_numbers
+from lingua_franca.lang import format_common
+
+
+def _quantities(count):
+    rng = random.Random(0)
+    quantities = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            quantities.append(rng.randrange(800) / 8)
+        else:
+            # no fraction is found, every denominator is tried
+            quantities.append(rng.randrange(100) + 0.05 + rng.random() * 0.9)
+    return quantities
+
+
+def _best(func, repeat=3):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000,
+                        help="quantities to format")
+    parser.add_argument("--lang", default="en", help="the language code")
+    args = parser.parse_args()
+
+    lingua_franca.load_language(args.lang)
+    quantities = _quantities(args.count)
+    cases = [("nice_number per value",
+              lambda: [nice_number(number, lang=args.lang)
+                       for number in quantities])]
+    if format_common._numpy() is not None:
+        cases.append(("nice_numbers, NumPy",
+                      lambda: nice_numbers(quantities, lang=args.lang)))
+
+    def without_numpy():
+        with patch.object(format_common, "_numpy", lambda: None):
+            nice_numbers(quantities, lang=args.lang)
+
+    cases.append(("nice_numbers, pure Python", without_numpy))
+    print("{:<28} {:>12} {:>15}".format("", "total (ms)", "per value (us)"))
+    for name, func in cases:
+        seconds = _best(func)
+        print("{:<28} {:>12.1f} {:>15.2f}".format(
+            name, seconds * 1000, seconds / args.count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Per-call cost of the number lexicons used by the number extractors.
+
+Each lexicon builder is cached with functools.lru_cache; the original,
+uncached builder is still reachable through `__wrapped__`, which lets us
+compare "rebuild on every call" against "look up the shared table".
+
+    python -m benchmarks.bench_number_lexicons [--number N]
+"""
+import argparse
+import timeit
+
+from lingua_franca.lang import parse_cs, parse_en, parse_it, parse_nl, \
+    parse_pl
+
+# (label, cached builder, positional args)
+LEXICONS = [
+    ("en number data", parse_en._initialize_number_data_en, (True, True)),
+    ("en fractions", parse_en._initialize_fraction_data_en, (True,)),
+    ("nl number data", parse_nl._initialize_number_data_nl, (True,)),
+    ("nl fractions", parse_nl._initialize_fraction_data_nl, (True,)),
+    ("cs number data", parse_cs._initialize_number_data, (True,)),
+    ("pl number data", parse_pl._initialize_number_data, (True,)),
+    ("it fractions", parse_it._initialize_fraction_data_it, (False,)),
+]
+
+# (label, callable) end-to-end extraction calls that use the lexicons
+EXTRACTIONS = [
+    ("extract_number_en", lambda: parse_en.extract_number_en(
+        "two million five hundred thousand and three fifths")),
+    ("is_fractional_en", lambda: parse_en.is_fractional_en("fifths")),
+    ("extract_number_nl", lambda: parse_nl.extract_number_nl(
+        "twee miljoen vijfhonderdduizend")),
+    ("is_fractional_nl", lambda: parse_nl.is_fractional_nl("vijfde")),
+    ("extract_number_cs", lambda: parse_cs.extract_number_cs(
+        "dva miliony pět set tisíc")),
+    ("extract_number_pl", lambda: parse_pl.extract_number_pl(
+        "dwa miliony pięćset tysięcy")),
+    ("extract_number_it", lambda: parse_it.extract_number_it(
+        "duemilionicinquecentomila")),
+]
+
+
+def _per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    print("{:<20} {:>14} {:>14} {:>8}".format(
+        "lexicon", "rebuild (us)", "cached (us)", "speedup"))
+    for label, builder, builder_args in LEXICONS:
+        rebuild = _per_call_us(lambda: builder.__wrapped__(*builder_args),
+                               args.number)
+        cached = _per_call_us(lambda: builder(*builder_args), args.number)
+        print("{:<20} {:>14.2f} {:>14.2f} {:>7.1f}x".format(
+            label, rebuild, cached, rebuild / cached))
+
+    print()
+    print("{:<20} {:>14}".format("extraction", "per call (us)"))
+    for label, func in EXTRACTIONS:
+        print("{:<20} {:>14.2f}".format(
+            label, _per_call_us(func, args.number // 10 or 1)))
+
+
+if __name__ == "__main__":
+    main()
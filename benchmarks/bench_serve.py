@@ -0,0 +1,128 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Latency of a request to the lingua_franca server, against a cold process.
+
+Each request extracts the datetime of an utterance, in one of three modes:
+
+- cold: a new Python process imports lingua_franca, loads the language
+  and makes the call, as a shell tool calling a script would
+- connect: a new connection to `python -m lingua_franca serve` for each
+  request, as a shell tool piping the request through socat would
+- client: one lingua_franca.serve.Client for all the requests
+
+    python -m benchmarks.bench_serve [--requests N] [--cold-requests N]
+                                     [--lang en]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from lingua_franca.serve import Client
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+UTTERANCE = "remind me to call mom tomorrow at a quarter past seven"
+COLD_SCRIPT = """
+import sys
+from datetime import datetime
+import lingua_franca
+from lingua_franca.parse import extract_datetime
+lingua_franca.load_language(sys.argv[1])
+print(extract_datetime(sys.argv[2], datetime(2017, 6, 27, 13, 4),
+                       lang=sys.argv[1]))
+"""
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _time(call, requests):
+    durations = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+    return sorted(durations)
+
+
+def _wait_for(path, process, seconds=30):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("the server exited")
+        try:
+            Client(path).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("the server didn't start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests of the connect and client modes")
+    parser.add_argument("--cold-requests", type=int, default=10,
+                        help="requests of the cold mode")
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args()
+
+    results = {}
+    results["cold"] = _time(lambda: subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPT, args.lang, UTTERANCE],
+        cwd=_ROOT, check=True, stdout=subprocess.DEVNULL),
+        args.cold_requests)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lingua_franca.sock")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "lingua_franca", "serve", "--socket",
+             path, "--langs", args.lang], cwd=_ROOT,
+            stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(path, server)
+
+            def connect():
+                with Client(path) as client:
+                    client.call("extract_datetime", UTTERANCE, ANCHOR,
+                                lang=args.lang)
+
+            results["connect"] = _time(connect, args.requests)
+            with Client(path) as client:
+                results["client"] = _time(
+                    lambda: client.call("extract_datetime", UTTERANCE,
+                                        ANCHOR, lang=args.lang),
+                    args.requests)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print("{:<8} {:>9} {:>10} {:>10} {:>10}".format(
+        "mode", "requests", "p50 (ms)", "p95 (ms)", "max (ms)"))
+    for mode, durations in results.items():
+        print("{:<8} {:>9} {:>10.2f} {:>10.2f} {:>10.2f}".format(
+            mode, len(durations), _percentile(durations, 0.5) * 1000,
+            _percentile(durations, 0.95) * 1000, durations[-1] * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cost of parsing the partial transcripts of a speech recognizer.
+
+A transcript of --words words grows by one word at a time, and each
+partial is parsed: from scratch with the functions of lingua_franca.parse,
+or with a lingua_franca.ParseSession. The table shows the total time over
+all the partials, and the time of the last one.
+
+    python -m benchmarks.bench_session [--words N]
+"""
+import argparse
+import time
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca import parse
+from lingua_franca.session import ParseSession
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+WORDS = ("remind me at five thirty tomorrow to call mom about the twenty "
+         "two tickets and the three hundred dollars we owe").split()
+
+
+def _run(parse_partial, partials):
+    durations = []
+    for partial in partials:
+        start = time.perf_counter()
+        parse_partial(partial)
+        durations.append(time.perf_counter() - start)
+    return sum(durations), durations[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=100,
+                        help="words of the whole transcript")
+    args = parser.parse_args()
+
+    lingua_franca.load_language("en")
+    words = (WORDS * (args.words // len(WORDS) + 1))[:args.words]
+    partials = [" ".join(words[:count]) for count in range(1, len(words) + 1)]
+    cases = [
+        ("extract_numbers", lambda text: parse.extract_numbers(text),
+         lambda session: session.extract_numbers()),
+        ("extract_datetime", lambda text: parse.extract_datetime(text, ANCHOR),
+         lambda session: session.extract_datetime(ANCHOR)),
+    ]
+    print("{:<18} {:>16} {:>14} {:>16} {:>14}".format(
+        "function", "scratch (ms)", "last (ms)", "session (ms)", "last (ms)"))
+    for name, from_scratch, incremental in cases:
+        session = ParseSession(lang="en")
+
+        def update(partial):
+            session.update(partial)
+            incremental(session)
+
+        scratch_total, scratch_last = _run(from_scratch, partials)
+        session_total, session_last = _run(update, partials)
+        print("{:<18} {:>16.1f} {:>14.2f} {:>16.1f} {:>14.2f}".format(
+            name, scratch_total * 1000, scratch_last * 1000,
+            session_total * 1000, session_last * 1000))
+
+
+if __name__ == "__main__":
+    main()
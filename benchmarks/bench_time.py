@@ -0,0 +1,82 @@
+#
+# Copyright 2018 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cost of the timezone conversions of lingua_franca.time.
+
+Times now_local(), which gives extract_datetime its default anchor,
+against a local timezone made on each call, then the conversion of
+--count UTC event times to local time: one to_local() call per time,
+to_local_many() on a list and, if NumPy is installed, on a datetime64
+array.
+
+    python -m benchmarks.bench_time [--count N]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from dateutil.tz import tzlocal
+
+from lingua_franca.time import now_local, to_local, to_local_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _best(func, repeat=5):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000,
+                        help="event times to convert")
+    args = parser.parse_args()
+
+    calls = 10000
+    print("{:<28} {:>12}".format("now", "per call (us)"))
+    for name, func in [("datetime.now(tzlocal())",
+                        lambda: datetime.now(tzlocal())),
+                       ("now_local()", now_local)]:
+        seconds = _best(lambda: [func() for _ in range(calls)])
+        print("{:<28} {:>12.2f}".format(name, seconds / calls * 1e6))
+
+    # a year of events
+    step = timedelta(days=365) / args.count
+    times = [datetime(2020, 1, 1) + step * i for i in range(args.count)]
+    cases = [("to_local() per time", lambda: [to_local(dt) for dt in times]),
+             ("to_local_many(list)", lambda: to_local_many(times))]
+    if numpy is not None:
+        array = numpy.array(times, dtype="datetime64[us]")
+        cases.append(("to_local_many(datetime64)",
+                      lambda: to_local_many(array)))
+    print("\n{:<28} {:>12} {:>14}".format("convert", "total (ms)",
+                                         "per time (us)"))
+    for name, func in cases:
+        seconds = _best(func, repeat=3)
+        print("{:<28} {:>12.1f} {:>14.3f}".format(
+            name, seconds * 1000, seconds / args.count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
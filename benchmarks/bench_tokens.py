@@ -0,0 +1,82 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Memory and throughput of tokenizing and number extraction on long texts.
+
+Peak memory is measured with tracemalloc, so it only counts allocations
+made by Python code while the call runs.
+
+    python -m benchmarks.bench_tokens [--words N] [--number N]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from lingua_franca.lang import parse_cs, parse_en, parse_nl, parse_pl
+from lingua_franca.lang.parse_common import tokenize
+
+# (language, sentence repeated to build the document, extract_numbers)
+DOCUMENTS = [
+    ("en", "I bought twenty two apples and three hundred five pears",
+     parse_en.extract_numbers_en),
+    ("nl", "ik kocht tweeëntwintig appels en driehonderd vijf peren",
+     parse_nl.extract_numbers_nl),
+    ("cs", "koupil jsem dvacet dva jablek a tři sta pět hrušek",
+     parse_cs.extract_numbers_cs),
+    ("pl", "kupiłem dwadzieścia dwa jabłka i trzysta pięć gruszek",
+     parse_pl.extract_numbers_pl),
+]
+
+
+def _document(sentence, words):
+    repeat = max(1, words // len(sentence.split()))
+    return " ".join([sentence] * repeat)
+
+
+def _peak_kib(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _per_call_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=2000,
+                        help="approximate words per document")
+    parser.add_argument("--number", type=int, default=5,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    print("{:<22} {:>12} {:>12}".format("call", "peak (KiB)",
+                                        "per call (ms)"))
+    for lang, sentence, extract_numbers in DOCUMENTS:
+        text = _document(sentence, args.words)
+        for label, func in (
+                ("tokenize " + lang, lambda: tokenize(text)),
+                ("extract_numbers " + lang, lambda: extract_numbers(text))):
+            print("{:<22} {:>12.1f} {:>12.2f}".format(
+                label, _peak_kib(func), _per_call_ms(func, args.number)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Compare two runs of benchmarks.suite and fail on performance regressions.
+
+A case (function and language) regresses when its fastest warm pass is
+slower than the baseline's by more than --threshold percent, by more
+than the noise of the two runs, and by more than --min-us microseconds.
+The noise of a run is how much slower its 90th percentile warm pass is
+than its fastest (benchmarks.suite pools the passes of several
+processes, so this covers the differences between processes); the
+noise of the noisier run is used, times --noise-factor. A
+case which worked in the baseline and fails or disappears in the
+candidate regresses too.
+
+Candidate times are first scaled by the ratio of the calibration
+workloads of the two runs, so that a busier or slower machine isn't
+taken for slower code (--no-calibration compares raw times).
+
+Exits with status 1 if any case regresses, gone cases included, so it
+can gate a CI job:
+
+    python -m benchmarks.suite --output baseline.json
+    (apply changes)
+    python -m benchmarks.suite --output candidate.json
+    python -m benchmarks.compare baseline.json candidate.json \\
+        [--threshold 10] [--noise-factor 1] [--min-us 1] [--all]
+        [--no-calibration]
+"""
+import argparse
+import json
+import re
+import sys
+
+# the functions gated by default
+DEFAULT_FUNCTIONS = r"^(extract_.*|normalize|nice_.*|pronounce_number)$"
+
+
+def _key(record):
+    return record["lang"], record["module"], record["function"]
+
+
+def _center_and_noise(record):
+    # the fastest pass is the least disturbed by the rest of the machine,
+    # how far the slow passes are from it tells how disturbed the run was
+    samples = sorted(record.get("warm_samples_us") or [record["warm_us"]])
+    fastest = samples[0]
+    slow = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+    noise = (slow - fastest) / fastest if fastest else 0.0
+    return fastest, noise
+
+
+def _speedups(baseline, candidate):
+    # lang -> how much faster the baseline's machine was, per the
+    # calibration workload of benchmarks.suite
+    before = {language["lang"]: language.get("calibration_us")
+              for language in baseline.get("languages", [])}
+    speedups = {}
+    for language in candidate.get("languages", []):
+        old, new = before.get(language["lang"]), \
+            language.get("calibration_us")
+        if old and new:
+            speedups[language["lang"]] = old / new
+    return speedups
+
+
+def compare(baseline, candidate, threshold=10.0, noise_factor=1.0,
+            min_us=1.0, functions=DEFAULT_FUNCTIONS, calibrate=True):
+    """ Compare two benchmark documents
+
+    Args:
+        baseline (dict): results of benchmarks.suite
+        candidate (dict): results of benchmarks.suite
+        threshold (float): tolerated slowdown, in percent
+        noise_factor (float): multiplier of the measured noise
+        min_us (float): tolerated slowdown, in microseconds per call
+        functions (str): regular expression of the compared functions
+        calibrate (bool): scale the candidate's times by the ratio of the
+                          calibration workloads of the two runs
+    Returns:
+        (list): one dict per case, with the lang, function, base_us,
+                candidate_us, change (%), noise (%) and verdict keys;
+                the verdict is 'regression', 'improvement', 'ok', 'new'
+                or 'gone'
+    """
+    pattern = re.compile(functions)
+    speedups = _speedups(baseline, candidate) if calibrate else {}
+    before = {_key(record): record for record in baseline["results"]
+              if pattern.match(record["function"])}
+    after = {_key(record): record for record in candidate["results"]
+             if pattern.match(record["function"])}
+    rows = []
+    for key in sorted(set(before) | set(after)):
+        old, new = before.get(key), after.get(key)
+        row = {"lang": key[0], "module": key[1], "function": key[2],
+               "base_us": None, "candidate_us": None, "change": None,
+               "noise": None}
+        old_ok = old is not None and old["status"] == "ok"
+        new_ok = new is not None and new["status"] == "ok"
+        if not old_ok and not new_ok:
+            continue
+        if not new_ok:
+            row["verdict"] = "gone" if new is None else "regression"
+            row["status"] = new["status"] if new else None
+        elif not old_ok:
+            row["verdict"] = "new"
+        if old_ok:
+            row["base_us"], old_noise = _center_and_noise(old)
+        if new_ok:
+            row["candidate_us"], new_noise = _center_and_noise(new)
+            row["candidate_us"] *= speedups.get(key[0], 1.0)
+        if old_ok and new_ok:
+            difference = row["candidate_us"] - row["base_us"]
+            change = difference / row["base_us"] * 100 \
+                if row["base_us"] else 0.0
+            noise = max(old_noise, new_noise) * 100 * noise_factor
+            row["change"], row["noise"] = change, noise
+            significant = abs(change) > max(threshold, noise) and \
+                abs(difference) > min_us
+            if significant and change > 0:
+                row["verdict"] = "regression"
+            elif significant:
+                row["verdict"] = "improvement"
+            else:
+                row["verdict"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def failures(rows):
+    """ The cases which fail the comparison
+
+    Args:
+        rows (list): as returned by compare()
+    Returns:
+        (list): the rows whose verdict is 'regression' or 'gone'
+    """
+    return [row for row in rows if row["verdict"] in ("regression", "gone")]
+
+
+def _format(value, spec):
+    return format(value, spec) if value is not None else "-"
+
+
+def print_table(rows, file=sys.stdout):
+    print("{:<5} {:<24} {:>11} {:>11} {:>9} {:>8}  {}".format(
+        "lang", "function", "base (us)", "cand (us)", "change", "noise",
+        "verdict"), file=file)
+    for row in rows:
+        verdict = row["verdict"]
+        if row.get("status"):
+            verdict += " ({})".format(row["status"])
+        print("{:<5} {:<24} {:>11} {:>11} {:>9} {:>8}  {}".format(
+            row["lang"], row["function"], _format(row["base_us"], ".1f"),
+            _format(row["candidate_us"], ".1f"),
+            _format(row["change"], "+.1f") + ("%" if row["change"]
+                                              is not None else ""),
+            _format(row["noise"], ".1f") + ("%" if row["noise"]
+                                            is not None else ""),
+            verdict), file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", help="JSON results of the baseline")
+    parser.add_argument("candidate", help="JSON results of the candidate")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="tolerated slowdown in percent (default 10)")
+    parser.add_argument("--noise-factor", type=float, default=1.0,
+                        help="multiplier of the measured noise (default 1)")
+    parser.add_argument("--min-us", type=float, default=1.0,
+                        help="tolerated slowdown in microseconds per call "
+                             "(default 1)")
+    parser.add_argument("--functions", default=DEFAULT_FUNCTIONS,
+                        help="regular expression of the compared functions")
+    parser.add_argument("--no-calibration", action="store_true",
+                        help="compare raw times, even if the runs were "
+                             "made on machines of different speeds")
+    parser.add_argument("--all", action="store_true",
+                        help="list every case, not only the changed ones")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as baseline, \
+            open(args.candidate) as candidate:
+        rows = compare(json.load(baseline), json.load(candidate),
+                       args.threshold, args.noise_factor, args.min_us,
+                       args.functions, not args.no_calibration)
+    failed = failures(rows)
+    shown = rows if args.all else [row for row in rows
+                                   if row["verdict"] != "ok"]
+    if shown:
+        print_table(shown)
+    print("{} cases compared, {} regressions".format(len(rows),
+                                                     len(failed)))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
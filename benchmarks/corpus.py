@@ -0,0 +1,205 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Benchmark inputs for the registered parse and format functions.
+
+Texts come from the test suite: the string passed first to a registered
+function (or to its localized version) in test/test_parse_<lang>.py. The
+datetimes come from res/text/<loc>/date_time_test.json. Numbers and
+durations are generated, with a fixed seed; languages without parser
+tests get the generated numbers, pronounced, as texts.
+"""
+import ast
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+from lingua_franca import format, parse
+from lingua_franca.internal import get_full_lang_code, resolve_resource_file
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = os.path.join(_ROOT, "test")
+
+# functions taking a text, whose corpus falls back on the one of another
+# function when the tests don't call them
+_TEXT_FALLBACKS = {
+    "extract_numbers": "extract_number",
+    "extract_numbers_spans": "extract_numbers",
+    "extract_number_spans": "extract_number",
+    "extract_duration_spans": "extract_duration",
+    "extract_datetime_spans": "extract_datetime",
+    "extract_datetime_plan": "extract_datetime",
+}
+
+
+def _string_constant(node):
+    # ast.Str before Python 3.8
+    value = node.value if isinstance(node, ast.Constant) else \
+        getattr(node, "s", None)
+    return value if isinstance(value, str) else None
+
+
+def _called_name(node, lang):
+    func = node.func
+    name = func.attr if isinstance(func, ast.Attribute) else \
+        getattr(func, "id", None)
+    if name and name.endswith("_" + lang):
+        name = name[:-len(lang) - 1]
+    return name
+
+
+def fixture_texts(lang):
+    """ The texts the tests of a language pass to registered functions
+
+    Args:
+        lang (str): a primary language code, such as 'en'
+    Returns:
+        (dict): function name -> list of texts, without duplicates
+    """
+    filename = "test_parse.py" if lang == "en" else \
+        "test_parse_{}.py".format(lang)
+    path = os.path.join(TEST_DIR, filename)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf8") as source:
+        tree = ast.parse(source.read(), path)
+    texts = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not node.args:
+            continue
+        name = _called_name(node, lang)
+        text = _string_constant(node.args[0])
+        if name in parse._REGISTERED_FUNCTIONS and text:
+            found = texts.setdefault(name, [])
+            if text not in found:
+                found.append(text)
+    return texts
+
+
+def fixture_datetimes(lang):
+    """ The datetimes of res/text/<loc>/date_time_test.json
+
+    Args:
+        lang (str): a primary language code, such as 'en'
+    Returns:
+        (list): datetime objects
+    """
+    path = resolve_resource_file("text/{}/date_time_test.json".format(
+        get_full_lang_code(lang)))
+    if not path:
+        return []
+    with open(path, encoding="utf8") as fixture:
+        tests = json.load(fixture)
+    found = []
+    for cases in tests.values():
+        for case in cases.values():
+            params = case.get("datetime_param")
+            if not params:
+                continue
+            dt = datetime(*[int(value) for value in params.split(",")])
+            if dt not in found:
+                found.append(dt)
+    return found
+
+
+def synthetic_numbers(count, seed=0):
+    """ Integers, negatives and decimals of various magnitudes """
+    rng = random.Random(seed)
+    numbers = []
+    for idx in range(count):
+        magnitude = 10 ** rng.randint(0, 9)
+        if idx % 4 == 3:
+            numbers.append(round(rng.uniform(-magnitude, magnitude), 2))
+        elif idx % 4 == 2:
+            numbers.append(-rng.randint(0, magnitude))
+        else:
+            numbers.append(rng.randint(0, magnitude))
+    return numbers
+
+
+def synthetic_datetimes(count, seed=0):
+    """ Datetimes within 2017 """
+    rng = random.Random(seed)
+    start = datetime(2017, 1, 1)
+    return [start + timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+            for _ in range(count)]
+
+
+def synthetic_durations(count, seed=0):
+    """ Durations in seconds, from seconds to months """
+    rng = random.Random(seed)
+    return [rng.randint(1, 10 ** rng.randint(1, 7)) for _ in range(count)]
+
+
+def spoken_numbers(lang, numbers):
+    """ Numbers as pronounced by format.pronounce_number()
+
+    Args:
+        lang (str): a loaded language
+        numbers (list): see synthetic_numbers()
+    Returns:
+        (list): texts, empty if the language can't pronounce numbers
+    """
+    texts = []
+    for number in numbers:
+        try:
+            texts.append(format.pronounce_number(number, lang=lang))
+        except Exception:
+            return texts
+    return texts
+
+
+def build_corpus(lang, max_items=50, seed=0):
+    """ The inputs of each registered function in a language
+
+    Args:
+        lang (str): a primary language code, loaded
+        max_items (int): the maximum number of inputs per function
+        seed (int): seed of the generated inputs
+    Returns:
+        (dict): (module, function) -> list of inputs
+    """
+    texts = fixture_texts(lang)
+    numbers = synthetic_numbers(max_items, seed)
+    if not texts:
+        # no parser tests, read the numbers out loud instead
+        texts = {"extract_number": spoken_numbers(lang, numbers)}
+    all_texts = [text for found in texts.values() for text in found]
+    words = sorted({word for text in all_texts for word in text.split()})
+
+    corpus = {}
+    for name in parse._REGISTERED_FUNCTIONS:
+        if name in ("get_gender", "is_fractional", "is_ordinal"):
+            found = texts.get(name) or words
+        else:
+            # the texts of the function, then those of its fallbacks
+            found = []
+            fallback = name
+            while fallback:
+                found += [text for text in texts.get(fallback, [])
+                          if text not in found]
+                fallback = _TEXT_FALLBACKS.get(fallback)
+        corpus[("parse", name)] = list(found or all_texts)[:max_items]
+
+    datetimes = (fixture_datetimes(lang) +
+                 synthetic_datetimes(max_items, seed))[:max_items]
+    corpus[("format", "nice_number")] = numbers
+    corpus[("format", "pronounce_number")] = numbers
+    corpus[("format", "nice_time")] = datetimes
+    corpus[("format", "nice_duration")] = synthetic_durations(max_items, seed)
+    corpus[("format", "nice_response")] = all_texts[:max_items]
+    return corpus
@@ -0,0 +1,159 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Search for the slowest inputs of the parsers, and check latency ceilings.
+
+For each language and parser, texts of --words words are drawn from the
+vocabulary of the language's test fixtures (see benchmarks.corpus): runs
+of one word, runs of number words and random sequences. The slowest are
+then mutated, a word at a time, as long as that makes them slower. Calls
+are stopped after --search-cap seconds during the search, which would
+otherwise take hours on the worst inputs.
+
+The worst inputs are run again within lingua_franca.budget(--max-chars,
+--seconds), and must return within --ceiling milliseconds. Exits with
+status 1 if any doesn't.
+
+    python -m benchmarks.fuzz_latency [--langs en,de] [--words N]
+                                      [--trials N] [--rounds N]
+                                      [--max-chars N] [--seconds S]
+                                      [--ceiling MS] [--search-cap S]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca import parse
+from lingua_franca.internal import _SUPPORTED_LANGUAGES
+
+from benchmarks.corpus import build_corpus, spoken_numbers, \
+    synthetic_numbers
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+PARSERS = ("extract_numbers", "extract_number", "extract_duration",
+           "extract_datetime", "normalize")
+
+
+def _duration(name, text, lang, max_chars=None, seconds=None):
+    func = getattr(parse, name)
+    args = (text, ANCHOR) if name == "extract_datetime" else (text,)
+    with lingua_franca.budget(max_chars, seconds):
+        start = time.perf_counter()
+        try:
+            func(*args, lang=lang)
+        except Exception:
+            pass
+        return time.perf_counter() - start
+
+
+def vocabulary(lang, seed=0):
+    """ The words of a language's fixtures, and its number words """
+    corpus = build_corpus(lang, seed=seed)
+    words = sorted({word for texts in corpus.values() for text in texts
+                    if isinstance(text, str) for word in text.split()})
+    numbers = sorted({word for text in spoken_numbers(
+        lang, synthetic_numbers(50, seed)) for word in text.split()})
+    return words, numbers or words
+
+
+def candidates(words, numbers, length, trials, rng):
+    """ Texts likely to be slow: runs of a word, number words, noise """
+    texts = []
+    for _ in range(trials):
+        kind = rng.randrange(3)
+        if kind == 0:
+            texts.append(" ".join([rng.choice(numbers)] * length))
+        elif kind == 1:
+            texts.append(" ".join(rng.choice(numbers)
+                                  for _ in range(length)))
+        else:
+            texts.append(" ".join(rng.choice(words) for _ in range(length)))
+    return texts
+
+
+def worst_input(name, lang, words, numbers, length, trials, rounds, rng,
+                cap=None):
+    """ The slowest text found for a parser, and its duration """
+    worst, worst_time = None, -1.0
+    for text in candidates(words, numbers, length, trials, rng):
+        duration = _duration(name, text, lang, seconds=cap)
+        if duration > worst_time:
+            worst, worst_time = text, duration
+    for _ in range(rounds):
+        mutated = worst.split()
+        mutated[rng.randrange(len(mutated))] = rng.choice(
+            numbers if rng.random() < 0.7 else words)
+        mutated = " ".join(mutated)
+        duration = _duration(name, mutated, lang, seconds=cap)
+        if duration > worst_time:
+            worst, worst_time = mutated, duration
+    return worst, worst_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--langs", default=",".join(_SUPPORTED_LANGUAGES),
+                        help="comma separated language codes")
+    parser.add_argument("--words", type=int, default=300,
+                        help="words per input")
+    parser.add_argument("--trials", type=int, default=12,
+                        help="random inputs per parser")
+    parser.add_argument("--rounds", type=int, default=8,
+                        help="mutations of the slowest input")
+    parser.add_argument("--max-chars", type=int, default=1000,
+                        help="max_chars of the budget")
+    parser.add_argument("--seconds", type=float, default=0.05,
+                        help="seconds of the budget")
+    parser.add_argument("--ceiling", type=float, default=250.0,
+                        help="maximum milliseconds per call in the budget")
+    parser.add_argument("--search-cap", type=float, default=1.0,
+                        help="seconds after which calls are stopped during "
+                             "the search")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("{:<5} {:<18} {:>12} {:>14}  {}".format(
+        "lang", "function", "worst (ms)", "budgeted (ms)", "input"))
+    failures = 0
+    for lang in [lang for lang in args.langs.split(",") if lang]:
+        lingua_franca.load_language(lang)
+        words, numbers = vocabulary(lang, args.seed)
+        for name in PARSERS:
+            text, unbounded = worst_input(name, lang, words, numbers,
+                                          args.words, args.trials,
+                                          args.rounds, rng, args.search_cap)
+            bounded = _duration(name, text, lang, args.max_chars,
+                                args.seconds)
+            over = bounded * 1000 > args.ceiling
+            failures += over
+            print("{:<5} {:<18} {:>12} {:>14.1f}  {}{}".format(
+                lang, name, "{}{:.1f}".format(
+                    ">" if unbounded >= args.search_cap else "",
+                    unbounded * 1000), bounded * 1000,
+                text[:40] + ("..." if len(text) > 40 else ""),
+                "  OVER CEILING" if over else ""))
+        lingua_franca.unload_language(lang)
+    print("{} calls over the ceiling of {} ms".format(failures,
+                                                      args.ceiling))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Time every registered parse and format function in every language.
+
+Each language runs in fresh processes (3 by default), so that "cold"
+numbers include the lazy initialization (imports, lexicons, compiled
+regexes). For each function, the inputs of benchmarks.corpus are run:
+
+- first_call_us: the first call, in a process where the language was
+  just loaded (functions run in order, so later ones may reuse what
+  earlier ones initialized)
+- cold_us: mean duration of the first pass over the inputs
+- warm_us: mean duration of the fastest of the following passes, and
+  warm_samples_us the means of all of them, in every process
+- peak_kib: peak memory allocated during a pass, as seen by tracemalloc
+
+Each language also records calibration_us, the time of a fixed pure
+Python workload, to tell a slower machine from slower code.
+
+Results are written as JSON, see benchmarks.compare for comparing runs.
+
+    python -m benchmarks.suite [--langs en,de] [--functions extract_number]
+                               [--max-items N] [--repeat N]
+                               [--processes N] [--output F]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from statistics import median
+
+import lingua_franca
+from lingua_franca import format, parse
+from lingua_franca.internal import _SUPPORTED_LANGUAGES
+
+from benchmarks.corpus import build_corpus
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# a fixed anchor, so that results don't depend on the day
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+EXTRA_KWARGS = {
+    "extract_datetime": {"anchorDate": ANCHOR},
+    "extract_datetime_spans": {"anchorDate": ANCHOR},
+}
+_MODULES = {"parse": parse, "format": format}
+
+
+def _time_pass(call, inputs):
+    start = time.perf_counter()
+    for item in inputs:
+        call(item)
+    return time.perf_counter() - start
+
+
+def _calibration_workload():
+    words = ["word{}".format(idx % 97) for idx in range(2000)]
+    counts = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+def calibrate(repeat=20):
+    """ Time a fixed pure Python workload, in microseconds
+
+    Comparing the calibration of two runs tells how much faster one
+    machine, or one moment of a shared machine, was than the other.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return min(samples)
+
+
+def benchmark_function(module, name, lang, inputs, repeat):
+    """ Time one function over its inputs
+
+    Returns:
+        (dict): a result record, see the module documentation
+    """
+    func = getattr(_MODULES[module], name)
+    kwargs = EXTRA_KWARGS.get(name, {})
+    record = {"lang": lang, "module": module, "function": name,
+              "inputs": len(inputs), "status": "ok"}
+
+    def call(item):
+        return func(item, lang=lang, **kwargs)
+
+    if not inputs:
+        record["status"] = "no input"
+        return record
+
+    # cold pass, keeping the inputs the function accepts
+    accepted = []
+    errors = []
+    durations = []
+    for item in inputs:
+        start = time.perf_counter()
+        try:
+            call(item)
+        except Exception as e:
+            errors.append(e)
+            continue
+        finally:
+            durations.append(time.perf_counter() - start)
+        accepted.append(item)
+    record["errors"] = len(errors)
+    if not accepted:
+        if all(isinstance(e, NotImplementedError) for e in errors):
+            record["status"] = "not localized"
+        else:
+            record["status"] = "error"
+            record["error"] = repr(errors[0])
+        return record
+    record["first_call_us"] = durations[0] * 1e6
+    record["cold_us"] = sum(durations) / len(durations) * 1e6
+
+    samples = [_time_pass(call, accepted) / len(accepted) * 1e6
+               for _ in range(repeat)]
+    record["warm_us"] = min(samples)
+    record["warm_samples_us"] = samples
+    tracemalloc.start()
+    _time_pass(call, accepted)
+    record["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return record
+
+
+def run_language(lang, functions=None, max_items=50, repeat=5, seed=0):
+    """ Benchmark a language in this process
+
+    Args:
+        lang (str): a primary language code
+        functions (list, optional): only benchmark these functions
+        max_items (int): the maximum number of inputs per function
+        repeat (int): the number of warm passes
+        seed (int): seed of the generated inputs
+    Returns:
+        (dict): the language's load time and memory, and the results
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    lingua_franca.load_language(lang)
+    load_s = time.perf_counter() - start
+    load_kib = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+
+    results = []
+    corpus = build_corpus(lang, max_items, seed)
+    calibration = [calibrate()]
+    for (module, name), inputs in corpus.items():
+        if functions and name not in functions:
+            continue
+        results.append(benchmark_function(module, name, lang, inputs,
+                                          repeat))
+    calibration.append(calibrate())
+    return {"lang": lang, "load_s": load_s, "load_kib": load_kib,
+            "calibration_us": min(calibration), "results": results}
+
+
+def _version():
+    try:
+        from importlib.metadata import version
+        return version("lingua_franca")
+    except Exception:
+        return None
+
+
+def _merge_runs(runs):
+    # one language benchmarked in several processes: the samples are
+    # pooled, the other figures are taken from the median process
+    merged = dict(runs[0], load_s=median(run["load_s"] for run in runs),
+                  load_kib=median(run["load_kib"] for run in runs),
+                  calibration_us=min(run["calibration_us"] for run in runs))
+    records = []
+    for same in zip(*(run["results"] for run in runs)):
+        record = dict(same[0])
+        if record["status"] == "ok":
+            for field in ("first_call_us", "cold_us", "peak_kib"):
+                record[field] = median(other[field] for other in same)
+            record["warm_samples_us"] = [
+                sample for other in same
+                for sample in other["warm_samples_us"]]
+            record["warm_us"] = min(record["warm_samples_us"])
+        records.append(record)
+    merged["results"] = records
+    return merged
+
+
+def run_suite(langs, functions=None, max_items=50, repeat=5, seed=0,
+              processes=3):
+    """ Benchmark languages, each in fresh Python processes
+
+    Args:
+        processes (int): the number of processes per language, their
+                         samples are pooled so that the noise between
+                         processes shows up in the results
+    Returns:
+        (dict): the JSON document written by main()
+    """
+    languages = []
+    for lang in langs:
+        command = [sys.executable, "-m", "benchmarks.suite", "--worker",
+                   lang, "--max-items", str(max_items), "--repeat",
+                   str(repeat), "--seed", str(seed)]
+        if functions:
+            command += ["--functions", ",".join(functions)]
+        # the same hash seed gives the same set and dict layouts
+        env = dict(os.environ, PYTHONHASHSEED="0")
+        runs = []
+        for _ in range(max(processes, 1)):
+            output = subprocess.run(command, cwd=_ROOT, env=env, check=True,
+                                    stdout=subprocess.PIPE).stdout
+            runs.append(json.loads(output.decode("utf8")))
+        languages.append(_merge_runs(runs))
+    return {
+        "meta": {
+            "lingua_franca": _version(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "max_items": max_items,
+            "repeat": repeat,
+            "processes": processes,
+            "seed": seed,
+        },
+        "languages": [{key: value for key, value in language.items()
+                       if key != "results"} for language in languages],
+        "results": [record for language in languages
+                    for record in language["results"]],
+    }
+
+
+def _print_table(document):
+    print("{:<5} {:<24} {:>6} {:>12} {:>10} {:>10} {:>9}  {}".format(
+        "lang", "function", "inputs", "first (us)", "cold (us)",
+        "warm (us)", "peak KiB", "status"), file=sys.stderr)
+    for record in document["results"]:
+        print("{:<5} {:<24} {:>6} {:>12.1f} {:>10.1f} {:>10.1f} {:>9.1f}  "
+              "{}".format(record["lang"], record["function"],
+                          record["inputs"],
+                          record.get("first_call_us", 0),
+                          record.get("cold_us", 0), record.get("warm_us", 0),
+                          record.get("peak_kib", 0), record["status"]),
+              file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--langs", default=",".join(_SUPPORTED_LANGUAGES),
+                        help="comma separated language codes")
+    parser.add_argument("--functions", default="",
+                        help="comma separated function names, default all")
+    parser.add_argument("--max-items", type=int, default=50,
+                        help="maximum number of inputs per function")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="warm passes over the inputs")
+    parser.add_argument("--processes", type=int, default=3,
+                        help="processes per language")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the generated inputs")
+    parser.add_argument("--output", help="write the JSON results to this "
+                                         "file instead of the standard "
+                                         "output")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    functions = [name for name in args.functions.split(",") if name]
+
+    if args.worker:
+        print(json.dumps(run_language(args.worker, functions,
+                                      args.max_items, args.repeat,
+                                      args.seed)))
+        return
+
+    document = run_suite([lang for lang in args.langs.split(",") if lang],
+                         functions, args.max_items, args.repeat, args.seed,
+                         args.processes)
+    _print_table(document)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(document, output, indent=2)
+    else:
+        print(json.dumps(document, indent=2))
+
+
+if __name__ == "__main__":
+    main()
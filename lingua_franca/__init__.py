@@ -1,6 +1,46 @@
+import sys
+from importlib import import_module
+
 from .internal import get_default_lang, set_default_lang, get_default_loc, \
     get_active_langs, _set_active_langs, get_primary_lang_code, \
     get_full_lang_code, resolve_resource_file, load_language, \
-    load_languages, unload_language, unload_languages, get_supported_langs
+    load_languages, unload_language, unload_languages, get_supported_langs, \
+    get_language_footprint
 
 from lingua_franca import config
+from lingua_franca.cache import cache_info, clear_cache
+from lingua_franca.instrumentation import enable_stats, disable_stats, \
+    stats, export_stats
+from lingua_franca.limits import budget
+
+# These import parse and format, or multiprocessing, which makes importing
+# lingua_franca several times slower. They are imported when first used.
+_LAZY_ATTRIBUTES = {
+    "profile": ("lingua_franca.profiling", "profile"),
+    "preload_for_fork": ("lingua_franca.preload", "preload_for_fork"),
+    "analyze": ("lingua_franca.analysis", "analyze"),
+    "ParseSession": ("lingua_franca.session", "ParseSession"),
+    "batch": ("lingua_franca.batch", None),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ (PEP 562), import everything now
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
@@ -0,0 +1,55 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Command line tools of lingua_franca.
+
+    python -m lingua_franca scan corpus.txt --lang en > results.jsonl
+    python -m lingua_franca serve --socket /tmp/lingua_franca.sock
+
+See `python -m lingua_franca <command> --help` for their arguments.
+"""
+import argparse
+
+from lingua_franca import scan, serve
+
+# command -> (module, help)
+_COMMANDS = {
+    "scan": (scan, "run parse functions over every utterance of a file"),
+    "serve": (serve, "serve the parse and format functions on a Unix "
+                     "socket"),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m lingua_franca",
+                                     description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command")
+    for name, (module, help_text) in _COMMANDS.items():
+        command = commands.add_parser(name, help=help_text,
+                                      description=module.__doc__.strip(),
+                                      formatter_class=argparse.
+                                      RawDescriptionHelpFormatter)
+        module.add_arguments(command)
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    _COMMANDS[args.command][0].main(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,205 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Async versions of the parse and format functions, for asyncio applications.
+
+Parsing a long utterance takes milliseconds, which called inline would
+block the event loop. The functions of this module take the same
+arguments as those of lingua_franca.parse and lingua_franca.format, and
+run them in an executor:
+
+    >>> from lingua_franca import aio
+    >>> await aio.extract_datetime("tomorrow at noon", lang='en')
+    [datetime.datetime(2017, 6, 28, 12, 0), '']
+    >>> await aio.nice_duration(90, lang='en', timeout=0.5)
+    'one minute thirty seconds'
+
+Concurrent calls to a function, made in the same iteration of the event
+loop or within config.aio_batch_delay seconds, are coalesced into batches
+of up to config.aio_max_batch calls, each run by the executor as one
+task. By default, this is the event loop's thread pool;
+set_executor() can replace it, for instance with a process pool:
+
+    >>> aio.set_executor(ProcessPoolExecutor(4))
+
+A call without `lang` uses the default language at the time of the call.
+The processes load the languages loaded in this process on their first
+batch; a thread pool leaves the languages, and the default one, to the
+application. A call taking longer than its timeout (config.aio_timeout by
+default) raises asyncio.TimeoutError; the executor still completes it,
+but its result is dropped.
+"""
+import asyncio
+import os
+import traceback
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, wraps
+from inspect import signature
+from multiprocessing.pool import RemoteTraceback
+
+from lingua_franca import config, format, parse
+from lingua_franca.batch import _picklable_error
+from lingua_franca.internal import get_active_langs, get_default_lang, \
+    load_languages, set_default_lang
+
+__all__ = ["set_executor", "get_executor"] + \
+    list(parse._REGISTERED_FUNCTIONS) + list(format._REGISTERED_FUNCTIONS)
+
+_MODULES = {"parse": parse, "format": format}
+_executor = None
+# event loop -> function name -> _Batcher
+_batchers = weakref.WeakKeyDictionary()
+
+
+def set_executor(executor):
+    """ Run the calls in this executor
+
+    Args:
+        executor (concurrent.futures.Executor): a thread or process pool,
+            or None for the default executor of the event loop
+    """
+    global _executor
+    _executor = executor
+
+
+def get_executor():
+    """ The executor set with set_executor(), None for the default one """
+    return _executor
+
+
+def _run_calls(module_name, name, calls, langs, default_lang, pid):
+    # runs in the executor: in another process, load the languages first.
+    # In this one (a thread pool), the languages are the application's to
+    # load and unload, and each call has its `lang`.
+    if os.getpid() != pid:
+        if not set(langs) <= set(get_active_langs()):
+            load_languages(langs)
+        if default_lang and get_default_lang() != default_lang:
+            set_default_lang(default_lang)
+    func = getattr(_MODULES[module_name], name)
+    results = []
+    for args, kwargs in calls:
+        try:
+            results.append((True, func(*args, **kwargs)))
+        except Exception as e:
+            results.append((False, _picklable_error(e),
+                            traceback.format_exc()))
+    return results
+
+
+class _Call:
+    __slots__ = ("args", "kwargs", "future")
+
+    def __init__(self, args, kwargs, future):
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+
+class _Batcher:
+    """ Coalesces the calls to one function into batches """
+
+    def __init__(self, loop, module_name, name):
+        self.loop = loop
+        self.module_name = module_name
+        self.name = name
+        self.pending = []
+        self.handle = None
+
+    def submit(self, args, kwargs):
+        future = self.loop.create_future()
+        self.pending.append(_Call(args, kwargs, future))
+        if len(self.pending) >= config.aio_max_batch:
+            self.flush()
+        elif self.handle is None:
+            delay = config.aio_batch_delay
+            self.handle = self.loop.call_later(delay, self.flush) \
+                if delay else self.loop.call_soon(self.flush)
+        return future
+
+    def flush(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        # calls which timed out while waiting aren't run
+        calls = [call for call in self.pending if not call.future.done()]
+        self.pending = []
+        if not calls:
+            return
+        task = self.loop.run_in_executor(
+            _executor, _run_calls, self.module_name, self.name,
+            [(call.args, call.kwargs) for call in calls],
+            get_active_langs(), get_default_lang(), os.getpid())
+        task.add_done_callback(partial(_set_results, calls))
+
+
+def _set_results(calls, task):
+    if task.cancelled():
+        for call in calls:
+            call.future.cancel()
+        return
+    error = task.exception()
+    results = task.result() if error is None else \
+        [(False, error, None)] * len(calls)
+    for call, result in zip(calls, results):
+        if call.future.done():
+            continue
+        if result[0]:
+            call.future.set_result(result[1])
+            continue
+        if result[2] and isinstance(_executor, ProcessPoolExecutor):
+            result[1].__cause__ = RemoteTraceback(result[2])
+        call.future.set_exception(result[1])
+
+
+def _batcher(module_name, name):
+    loop = asyncio.get_event_loop()
+    batchers = _batchers.get(loop)
+    if batchers is None:
+        batchers = _batchers[loop] = {}
+    batcher = batchers.get(name)
+    if batcher is None:
+        batcher = batchers[name] = _Batcher(loop, module_name, name)
+    return batcher
+
+
+def _async_function(module_name, name):
+    func = getattr(_MODULES[module_name], name)
+    lang_index = list(signature(func).parameters).index('lang')
+
+    @wraps(func)
+    async def call(*args, timeout=None, **kwargs):
+        if 'lang' not in kwargs and len(args) <= lang_index:
+            # the default language when the call is made, not when its
+            # batch runs
+            lang = get_default_lang()
+            if lang:
+                kwargs['lang'] = lang
+        future = _batcher(module_name, name).submit(args, kwargs)
+        if timeout is None:
+            timeout = config.aio_timeout
+        return await asyncio.wait_for(future, timeout)
+
+    call.__doc__ = "Async version of {}.{}, see lingua_franca.aio\n\n" \
+        "Takes the same arguments, and `timeout`, in seconds.\n".format(
+            module_name, name) + (func.__doc__ or "")
+    return call
+
+
+for _module_name, _module in _MODULES.items():
+    for _name in _module._REGISTERED_FUNCTIONS:
+        globals()[_name] = _async_function(_module_name, _name)
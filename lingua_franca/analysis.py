@@ -0,0 +1,120 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from lingua_franca import parse
+from lingua_franca.lang.parse_common import sharing_results, tokenize
+
+
+class Analysis:
+    """
+    Lazily computed parse results for a single utterance.
+
+    Running several extractors on the same text repeats a lot of work:
+    each of them tokenizes the text and converts number words to digits.
+    An Analysis runs the extractors with a shared cache, so this work is
+    done once, and remembers each result, so that asking twice costs
+    nothing.
+
+    Create one with lingua_franca.analyze():
+
+        >>> analysis = analyze("remind me in two hours to buy 3 apples")
+        >>> analysis.extract_duration()
+        (datetime.timedelta(seconds=7200), 'remind me in  to buy 3 apples')
+        >>> analysis.extract_numbers()
+        [2.0, 3.0]
+
+    Results are shared between callers, don't modify them.
+    """
+
+    def __init__(self, text, lang=''):
+        """
+        Args:
+            text (str): the utterance to analyze
+            lang (str, optional): an optional BCP-47 language code, if
+                                  omitted the default language will be used.
+        """
+        self.text = text
+        self.lang = lang
+        self._shared = {}
+        self._results = {}
+        self._tokens = None
+
+    def __repr__(self):
+        return "{n}({t!r}, lang={l!r})".format(n=self.__class__.__name__,
+                                               t=self.text, l=self.lang)
+
+    @property
+    def tokens(self):
+        """ The utterance split into words, see parse_common.tokenize()
+
+        Returns:
+            tuple(Token)
+        """
+        if self._tokens is None:
+            self._tokens = tuple(tokenize(self.text))
+        return self._tokens
+
+    def _get(self, func, **kwargs):
+        key = (func.__name__, tuple(sorted(kwargs.items())))
+        if key not in self._results:
+            with sharing_results(self._shared):
+                self._results[key] = func(self.text, lang=self.lang, **kwargs)
+        return self._results[key]
+
+    def normalize(self, remove_articles=True):
+        """ See lingua_franca.parse.normalize() """
+        return self._get(parse.normalize, remove_articles=remove_articles)
+
+    def extract_number(self, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_number() """
+        return self._get(parse.extract_number, short_scale=short_scale,
+                         ordinals=ordinals)
+
+    def extract_numbers(self, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_numbers() """
+        return self._get(parse.extract_numbers, short_scale=short_scale,
+                         ordinals=ordinals)
+
+    def extract_duration(self):
+        """ See lingua_franca.parse.extract_duration() """
+        return self._get(parse.extract_duration)
+
+    def extract_datetime(self, anchorDate=None, default_time=None):
+        """ See lingua_franca.parse.extract_datetime()
+
+        Without an anchorDate, the result depends on the current time, so
+        it is computed again on every call (the number conversion of the
+        text is still shared).
+        """
+        if anchorDate is None:
+            with sharing_results(self._shared):
+                return parse.extract_datetime(self.text, lang=self.lang,
+                                              default_time=default_time)
+        return self._get(parse.extract_datetime, anchorDate=anchorDate,
+                         default_time=default_time)
+
+
+def analyze(text, lang=''):
+    """ Analyze an utterance once, for use by several extractors.
+
+    Args:
+        text (str): the utterance to analyze
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        Analysis
+    """
+    return Analysis(text, lang)
@@ -0,0 +1,242 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Run a parse or format function over many inputs, in a pool of processes.
+
+    >>> from lingua_franca import batch
+    >>> list(batch.map("extract_number", ["twenty two", "one half"],
+    ...                lang='en', workers=4))
+    [22, 0.5]
+
+The language is loaded, and the function called once, before the workers
+start: on platforms which fork, they inherit the loaded modules and the
+filled lexicon caches instead of building them again. Workers started
+otherwise (spawn, forkserver) load the language and warm up once, when
+they start, not for every chunk.
+
+Results are returned in the order of the inputs, as they are computed.
+Only a few chunks per worker are read from the inputs ahead of the results
+yielded, so that an endless or very large iterable can be mapped.
+"""
+import os
+import pickle
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain, islice
+from multiprocessing import Pool
+from multiprocessing.pool import RemoteTraceback
+
+from lingua_franca import format, parse
+from lingua_franca.internal import get_active_langs, get_default_lang, \
+    get_primary_lang_code, load_language, unload_language
+
+_MODULES = {"parse": parse, "format": format}
+
+
+def _resolve_function(func_name):
+    # "extract_number", or "parse.extract_number" -> ("parse", name)
+    module_name, _, name = func_name.rpartition(".")
+    for candidate in ([module_name] if module_name else _MODULES):
+        module = _MODULES.get(candidate)
+        if module and name in module._REGISTERED_FUNCTIONS:
+            return candidate, name
+    raise ValueError("{} is not a parse or format function".format(
+        func_name))
+
+
+def _call(function, item, lang, kwargs):
+    module_name, name = function
+    return getattr(_MODULES[module_name], name)(item, lang=lang, **kwargs)
+
+
+def _picklable_error(error):
+    # the exception itself if it can go back to the parent process
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return RuntimeError("{}: {}".format(type(error).__name__, error))
+    return error
+
+
+def _run_chunk(function, items, lang, kwargs):
+    # (True, result) or (False, exception, formatted traceback) per item
+    results = []
+    for item in items:
+        try:
+            results.append((True, _call(function, item, lang, kwargs)))
+        except Exception as e:
+            results.append((False, _picklable_error(e),
+                            traceback.format_exc()))
+    return results
+
+
+def _run_chunk_task(task):
+    return _run_chunk(*task)
+
+
+def _warm_up(function, sample, lang, kwargs):
+    # the first call fills the lexicon caches and compiles the regexes
+    try:
+        _call(function, sample, lang, kwargs)
+    except Exception:
+        pass
+
+
+def _init_worker(lang, warm_up, args):
+    # loading is a no-op in forked workers, which inherit the language
+    load_language(lang)
+    warm_up(*args)
+
+
+@contextmanager
+def language_loaded(lang_code, load=True):
+    """ Load a language for the duration of the block, if it isn't loaded
+
+    It is unloaded afterwards, keeping its modules for the next time.
+
+    Args:
+        lang_code (str): a primary language code, such as 'en'
+        load (bool): False to leave the languages as they are
+    """
+    unload_language_afterward = load and lang_code not in get_active_langs()
+    if unload_language_afterward:
+        load_language(lang_code)
+    try:
+        yield
+    finally:
+        if unload_language_afterward:
+            unload_language(lang_code)
+
+
+@contextmanager
+def worker_pool(workers, lang_code, warm_up, args=()):
+    """ A pool of processes, with the language loaded and warmed up
+
+    warm_up(*args) is called here first, for forked workers to inherit the
+    filled lexicon caches, then in each worker once the language is loaded,
+    for workers started otherwise. The pool is terminated at the end of
+    the block.
+
+    Args:
+        workers (int): number of processes, with 1 or less no pool is
+                       started and None is given to the block
+        lang_code (str): a primary language code, loaded in this process
+        warm_up (callable): a module-level function, so that it can be
+                            sent to the workers
+        args (tuple): the arguments of warm_up
+    """
+    if not workers or workers <= 1:
+        yield None
+        return
+    warm_up(*args)
+    pool = Pool(workers, _init_worker, (lang_code, warm_up, args))
+    try:
+        yield pool
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _imap_bounded(pool, func, tasks, window):
+    # pool.imap reads all of `tasks` in a thread of its own; this takes a
+    # task only once fewer than `window` are waiting for their result
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _chunks(inputs, chunksize):
+    inputs = iter(inputs)
+    chunk = list(islice(inputs, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(inputs, chunksize))
+
+
+def map(func_name, inputs, lang='', workers=None, chunksize=100,
+        return_exceptions=False, **kwargs):
+    """ Call a parse or format function on every input
+
+    The inputs are read, and the results yielded, lazily: at most two
+    chunks per worker are read ahead of the results. An input whose
+    call raises an exception raises it here, when its result is reached,
+    with the worker's traceback as the cause; inputs before it are yielded
+    normally.
+
+    Args:
+        func_name (str): a registered function, such as 'extract_number'
+                         or 'format.nice_duration'
+        inputs (iterable): the first argument of each call
+        lang (str, optional): the BCP-47 code for the language to use,
+                              None uses default
+        workers (int, optional): number of processes, by default one per
+                                 CPU. With 1 or less, everything is done in
+                                 this process.
+        chunksize (int, optional): number of inputs sent to a process at a
+                                   time
+        return_exceptions (bool, optional): yield the exception raised by
+                                            an input as its result, rather
+                                            than raising it
+        **kwargs: other arguments of the function, the same for all calls;
+                  for extract_datetime, pass an anchorDate so that every
+                  worker uses the same one
+    Returns:
+        (iterator): the result of each call, in the order of the inputs
+    Raises:
+        ValueError: if func_name isn't a registered function
+    """
+    function = _resolve_function(func_name)
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    lang = lang or lang_code
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return _map(function, inputs, lang, lang_code, workers,
+                max(1, chunksize), return_exceptions, kwargs)
+
+
+def _map(function, inputs, lang, lang_code, workers, chunksize,
+         return_exceptions, kwargs):
+    chunks = _chunks(inputs, chunksize)
+    first = next(chunks, None)
+    if first is None:
+        return
+    with language_loaded(lang_code), \
+            worker_pool(workers, lang_code, _warm_up,
+                        (function, first[0], lang, kwargs)) as pool:
+        if pool is not None:
+            tasks = ((function, chunk, lang, kwargs)
+                     for chunk in chain([first], chunks))
+            results = _imap_bounded(pool, _run_chunk_task, tasks,
+                                    2 * workers)
+        else:
+            results = (_run_chunk(function, chunk, lang, kwargs)
+                       for chunk in chain([first], chunks))
+        for chunk in results:
+            for result in chunk:
+                if result[0]:
+                    yield result[1]
+                    continue
+                error = result[1]
+                if pool is not None:
+                    error.__cause__ = RemoteTraceback(result[2])
+                if not return_exceptions:
+                    raise error
+                yield error
@@ -0,0 +1,272 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Result cache for localized functions.
+
+Most of Lingua Franca's functions are pure: pronounce_number(5, lang='en')
+always says "five". Applications tend to make the same calls over and
+over, so the results of localized functions can be remembered.
+
+The cache is off by default. Turn it on through lingua_franca.config:
+
+    >>> lingua_franca.config.cache_results = True
+    >>> lingua_franca.config.cache_max_entries = 4096
+
+Calls are keyed on the function, the resolved language and the arguments
+as seen by the localized function, so extract_number("one") and
+extract_number("one", short_scale=True, lang='en-us') share an entry.
+Calls whose result depends on the current time (extract_datetime without
+an anchorDate) and calls with unhashable arguments are never cached.
+"""
+import sys
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from inspect import Parameter
+from threading import RLock
+
+# A call which leaves one of these parameters to None depends on the
+# current time
+_TIME_ANCHOR_PARAMS = frozenset(('anchorDate', 'now', 'relative_to'))
+
+_VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+# results which are stored and returned as they are
+_IMMUTABLE = (str, bytes, int, float, complex, type(None), date, datetime,
+              time, timedelta)
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions',
+                                     'uncached', 'entries', 'max_entries',
+                                     'size', 'max_size'])
+
+
+def approximate_size(obj):
+    """ Approximate memory footprint of a value, in bytes
+
+    Containers are measured with their items; other objects are measured
+    without what they refer to, as sys.getsizeof() does.
+
+    Args:
+        obj: any value
+    Returns:
+        (int): the size in bytes
+    """
+    if isinstance(obj, type):
+        # classes are shared, see make_key()
+        return 0
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approximate_size(key) + approximate_size(value)
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item) for item in obj)
+    return size
+
+
+def _isolated(value):
+    # a copy of value sharing nothing mutable with it
+    return value if isinstance(value, _IMMUTABLE) else deepcopy(value)
+
+
+class ResultCache:
+    """
+    A thread-safe LRU cache bounded by entry count and approximate size.
+
+    Results are deep-copied on the way in and out, so that callers can't
+    alter the cached value, not even a list in a tuple.
+    """
+
+    def __init__(self, max_entries=1024, max_size=8 * 1024 * 1024):
+        """
+        Args:
+            max_entries (int): the maximum number of results to keep
+            max_size (int): the maximum approximate size of the results and
+                            their keys, in bytes
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = RLock()
+        self.hits = self.misses = self.evictions = self.uncached = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """ Look a result up, marking it as recently used
+
+        Args:
+            key (tuple): see make_key()
+        Returns:
+            (bool, object): whether the result was found, and the result
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return True, _isolated(value)
+
+    def put(self, key, value):
+        """ Store a result, evicting the least recently used ones if needed
+
+        Args:
+            key (tuple): see make_key()
+            value: the result
+        """
+        size = approximate_size(key) + approximate_size(value)
+        if size > self.max_size or self.max_entries <= 0:
+            return
+        value = _isolated(value)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or \
+                    self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def skip(self):
+        """ Count a call which can't be cached """
+        with self._lock:
+            self.uncached += 1
+
+    def discard(self, predicate):
+        """ Forget the results whose key matches a predicate
+
+        Args:
+            predicate (callable): called with each key, see make_key()
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """ Forget all results and reset the counters """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.uncached = 0
+
+    def info(self):
+        """
+        Returns:
+            (CacheInfo): the counters and the current use of the cache
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.uncached, len(self._entries),
+                             self.max_entries, self._size, self.max_size)
+
+
+def _zone(value):
+    # the time zone of a datetime or time, as part of a key; dateutil's
+    # zones aren't hashable
+    zone = value.tzinfo
+    if zone is None:
+        return None
+    try:
+        hash(zone)
+    except TypeError:
+        return type(zone), repr(zone), value.utcoffset()
+    return zone
+
+
+def make_key(func_name, lang_code, loc_signature, args, kwargs):
+    """ Build the cache key of a call to a localized function
+
+    Arguments are matched to the localized function's parameters, and
+    those left to their default value are left out, so that equivalent
+    calls share a key.
+
+    Args:
+        func_name (str): the qualified name of the wrapped function
+        lang_code (str): the resolved language, such as 'en'
+        loc_signature (inspect.Signature): of the localized function
+        args (tuple): positional arguments, without the language
+        kwargs (dict): keyword arguments, without the language
+    Returns:
+        (tuple): the key, or None if the call can't be cached
+    """
+    parameters = loc_signature.parameters
+    if len(args) > len(parameters):
+        return None
+    arguments = dict(zip(parameters, args))
+    if len(arguments) + len(kwargs) > len(parameters):
+        # unknown or repeated arguments, let the call fail
+        return None
+    arguments.update(kwargs)
+    # 1, 1.0 and True are equal, but aren't pronounced the same, so the
+    # types are part of the key
+    key = []
+    for name, parameter in parameters.items():
+        if parameter.kind in _VARIADIC:
+            return None
+        if name in arguments:
+            value = arguments[name]
+            if value is None and name in _TIME_ANCHOR_PARAMS:
+                return None
+            if value is parameter.default or \
+                    type(value) is type(parameter.default) and \
+                    value == parameter.default:
+                continue
+            if isinstance(value, (datetime, time)):
+                # aware datetimes of different zones are equal if they are
+                # the same instant, but the results keep the zone
+                key.append((name, type(value), value, _zone(value)))
+            else:
+                key.append((name, type(value), value))
+        elif name in _TIME_ANCHOR_PARAMS and parameter.default is None:
+            return None
+    key = (func_name, lang_code, tuple(key))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+_result_cache = ResultCache()
+
+
+def cache_info():
+    """ Hit, miss and eviction counters of the result cache
+
+    Returns:
+        (CacheInfo)
+    """
+    return _result_cache.info()
+
+
+def clear_cache():
+    """ Forget all cached results and reset the counters """
+    _result_cache.clear()
+
+
+def forget_language(lang):
+    """ Forget the cached results of a language, when it is unloaded
+
+    Args:
+        lang (str): a primary language code
+    """
+    _result_cache.discard(lambda key: key[1] == lang)
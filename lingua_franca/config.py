@@ -1 +1,15 @@
 load_langs_on_demand = False
+
+# Remember the results of localized functions, see lingua_franca.cache
+cache_results = False
+cache_max_entries = 1024
+cache_max_size = 8 * 1024 * 1024  # bytes, approximate
+
+# Async functions, see lingua_franca.aio
+aio_batch_delay = 0  # seconds to wait for more calls before a batch runs
+aio_max_batch = 64  # calls per batch
+aio_timeout = None  # default timeout of a call, in seconds
+
+# Bounds on the parsers, see lingua_franca.limits
+max_input_chars = None  # longer texts are cut
+parse_time_budget = None  # seconds per call, then partial results
@@ -18,17 +18,24 @@ import json
 import os
 import re
 from collections import namedtuple
+from math import isfinite
 from warnings import warn
 from os.path import join
 
 
+from lingua_franca import config
 from lingua_franca.bracket_expansion import SentenceTreeParser
 from lingua_franca.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
     get_full_lang_code, get_default_lang, get_default_loc, \
     is_supported_full_lang, _raise_unsupported_language, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError
+    FunctionNotLocalizedError, get_localized_caller, \
+    get_primary_lang_code, get_supported_langs, load_language, \
+    unload_language
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    convert_to_mixed_fractions
+from lingua_franca.lang.parse_common import share_result, sharing_results
 
 
 _REGISTERED_FUNCTIONS = ("nice_number",
@@ -260,6 +267,61 @@ def nice_number(number, lang='', speech=True, denominators=None):
     return str(number)
 
 
+def nice_numbers(numbers, lang='', speech=True, denominators=None):
+    """Format many floats to human readable functions
+
+    Gives the same strings as nice_number() for each number. The mixed
+    fractions are found for all the numbers at once, see
+    lingua_franca.lang.format_common.convert_to_mixed_fractions(), and the
+    language's nice_number looked up once.
+
+    Args:
+        numbers (iter of numbers or numpy.ndarray): the floats to format
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        speech (bool): format for speech (True) or display (False)
+        denominators (iter of ints): denominators to use, default [1 .. 20]
+    Returns:
+        list(str): The formatted strings, in the order of the numbers
+    """
+    if hasattr(numbers, "tolist"):
+        # the values of a NumPy array, as Python numbers
+        numbers = numbers.tolist()
+    numbers = list(numbers)
+    denominators = tuple(denominators or range(1, 21))
+    try:
+        lang_code = get_primary_lang_code(lang) if lang else \
+            get_default_lang()
+    except ValueError:
+        lang_code = None
+    if lang and lang_code not in get_supported_langs():
+        # as nice_number, for languages which aren't supported
+        return [str(number) for number in numbers]
+    unload_language_afterward = config.load_langs_on_demand and \
+        lang_code not in get_active_langs()
+    if unload_language_afterward:
+        load_language(lang_code)
+    try:
+        format_number = get_localized_caller("format", "nice_number",
+                                             lang_code)
+        # the fractions of the other numbers are left to nice_number,
+        # which may raise for them
+        convertible = [number for number in numbers
+                       if isinstance(number, int) or
+                       isinstance(number, float) and isfinite(number)]
+        shared = {}
+        for number, fraction in zip(convertible, convert_to_mixed_fractions(
+                convertible, denominators)):
+            share_result(shared, convert_to_mixed_fraction,
+                         (number, denominators), fraction)
+        with sharing_results(shared):
+            return [format_number(number, speech, denominators)
+                    for number in numbers]
+    finally:
+        if unload_language_afterward:
+            unload_language(lang_code)
+
+
 @localized_function()
 def nice_time(dt, lang='', speech=True, use_24hour=False,
               use_ampm=False, variant=None):
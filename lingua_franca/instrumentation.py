@@ -0,0 +1,200 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Instrumentation of localized functions.
+
+Every call to a localized function (parse.extract_number,
+format.nice_duration...) can be reported to call hooks. A hook is called
+after the function returns or raises, as
+
+    hook(module, function, lang, seconds, error)
+
+where module is 'parse' or 'format', lang the requested language (such
+as 'en'), seconds the duration of the call and error the exception it
+raised, or None. Without hooks, the dispatcher doesn't time anything.
+
+The built-in hook collects latency statistics:
+
+    >>> lingua_franca.enable_stats()
+    >>> parse.extract_number("twenty two", lang='en')
+    22
+    >>> lingua_franca.stats()[('parse', 'extract_number', 'en')].calls
+    1
+    >>> print(lingua_franca.export_stats())
+"""
+import json
+from collections import deque, namedtuple
+from threading import Lock
+from warnings import warn
+
+_call_hooks = []
+
+CallStats = namedtuple('CallStats', ['calls', 'errors', 'total', 'mean',
+                                     'p50', 'p90', 'p99', 'max'])
+CallStats.__doc__ = """ Statistics of the calls to a localized function
+
+Durations are in seconds, percentiles are computed over the most recent
+calls (see StatsCollector). errors maps exception names to counts.
+"""
+
+
+def add_call_hook(hook):
+    """ Report the calls to localized functions to a hook
+
+    Args:
+        hook (callable): called as hook(module, function, lang, seconds,
+                         error) after each call
+    """
+    if hook not in _call_hooks:
+        _call_hooks.append(hook)
+
+
+def remove_call_hook(hook):
+    """ Stop reporting calls to a hook added with add_call_hook()
+
+    Args:
+        hook (callable)
+    """
+    if hook in _call_hooks:
+        _call_hooks.remove(hook)
+
+
+def notify_call_hooks(module, function, lang, seconds, error=None):
+    """ Report a call to every hook, see add_call_hook()
+
+    Hooks only observe the calls: an exception raised by a hook is turned
+    into a warning, and the call returns or raises as it would without it.
+    """
+    for hook in tuple(_call_hooks):
+        try:
+            hook(module, function, lang, seconds, error)
+        except Exception as e:
+            warn("call hook {!r} raised {}: {}".format(
+                hook, type(e).__name__, e), RuntimeWarning)
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class StatsCollector:
+    """
+    A call hook collecting counts, latencies and errors per
+    (module, function, lang).
+    """
+
+    def __init__(self, samples=1000):
+        """
+        Args:
+            samples (int): the number of recent durations kept per function
+                           and language to compute percentiles
+        """
+        self.samples = samples
+        self._lock = Lock()
+        self._records = {}
+
+    def __call__(self, module, function, lang, seconds, error=None):
+        key = (module, function, lang)
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                # calls, total, max, errors, recent durations
+                record = self._records[key] = \
+                    [0, 0.0, 0.0, {}, deque(maxlen=self.samples)]
+            record[0] += 1
+            record[1] += seconds
+            record[2] = max(record[2], seconds)
+            record[4].append(seconds)
+            if error is not None:
+                name = type(error).__name__
+                record[3][name] = record[3].get(name, 0) + 1
+
+    def snapshot(self, reset=False):
+        """ The statistics collected so far
+
+        Args:
+            reset (bool): start over after taking the snapshot
+        Returns:
+            (dict): (module, function, lang) -> CallStats
+        """
+        with self._lock:
+            records = self._records
+            if reset:
+                self._records = {}
+            else:
+                records = {key: (calls, total, longest, dict(errors),
+                                 tuple(recent))
+                           for key, (calls, total, longest, errors, recent)
+                           in records.items()}
+        snapshot = {}
+        for key, (calls, total, longest, errors, recent) in records.items():
+            ordered = sorted(recent)
+            snapshot[key] = CallStats(calls, errors, total, total / calls,
+                                      _percentile(ordered, 0.5),
+                                      _percentile(ordered, 0.9),
+                                      _percentile(ordered, 0.99), longest)
+        return snapshot
+
+    def reset(self):
+        """ Forget the statistics collected so far """
+        with self._lock:
+            self._records = {}
+
+
+_stats_collector = StatsCollector()
+
+
+def enable_stats():
+    """ Start collecting statistics, see stats() """
+    add_call_hook(_stats_collector)
+
+
+def disable_stats():
+    """ Stop collecting statistics, keeping those collected so far """
+    remove_call_hook(_stats_collector)
+
+
+def stats(reset=False):
+    """ Latency statistics of localized functions
+
+    Statistics are only collected after enable_stats().
+
+    Args:
+        reset (bool): start over after taking the snapshot
+    Returns:
+        (dict): (module, function, lang) -> CallStats, durations in seconds
+    """
+    return _stats_collector.snapshot(reset)
+
+
+def export_stats(snapshot=None, indent=2):
+    """ Export statistics to JSON, slowest functions first
+
+    Args:
+        snapshot (dict, optional): as returned by stats(), defaults to the
+                                   current statistics
+        indent (int, optional): see json.dumps()
+    Returns:
+        (str): a JSON list of objects with the module, function and lang
+               keys and the fields of CallStats
+    """
+    if snapshot is None:
+        snapshot = stats()
+    records = [dict(zip(('module', 'function', 'lang'), key),
+                    **call_stats._asdict())
+               for key, call_stats in snapshot.items()]
+    records.sort(key=lambda record: record['total'], reverse=True)
+    return json.dumps(records, indent=indent)
@@ -1,11 +1,16 @@
+import builtins
+import gc
 import os.path
+import sys
 from functools import wraps
 from importlib import import_module
 from inspect import signature
 from sys import version
+from time import perf_counter
+from types import FunctionType, ModuleType
 from warnings import warn
 
-from lingua_franca import config
+from lingua_franca import cache, config, instrumentation, limits
 
 _SUPPORTED_LANGUAGES = ("ca", "cs", "da", "de", "en", "es", "fr", "hu",
                         "it", "nl", "pl", "pt", "sl", "sv", "fa")
@@ -60,6 +65,8 @@ NoneLangWarning = \
     DeprecationWarning("Lingua Franca is dropping support"
                        " for 'lang=None' as an explicit"
                        " argument.")
+
+
 InvalidLangWarning = \
     DeprecationWarning("Invalid language code detected. Falling back on "
                        "default.\nThis behavior is deprecated. The 'lang' "
@@ -67,6 +74,10 @@ InvalidLangWarning = \
                        "language codes, beginning with Lingua Franca 0.3.0")
 
 
+class PartialResultWarning(UserWarning):
+    """ A parser hit config.max_input_chars or config.parse_time_budget """
+
+
 def _raise_unsupported_language(language):
     """
     Raise an error when a language is unsupported
@@ -198,7 +209,7 @@ def load_languages(langs):
         load_language(lang)
 
 
-def unload_language(lang):
+def unload_language(lang, release_modules=False):
     """Opposite of load_language()
        Unloading the default causes the next language in
        `lingua_franca.get_active_langs()` to become the default.
@@ -208,22 +219,152 @@ def unload_language(lang):
 
     Args:
         lang (str): language code to unload
+        release_modules (bool): also remove the language's modules
+                                (lingua_franca.lang.parse_xx, format_xx and
+                                common_data_xx) from sys.modules, so that
+                                their memory can be reclaimed; they are
+                                imported again when the language is loaded.
+                                Off by default, the modules are kept.
     """
     if lang in __loaded_langs:
         __loaded_langs.remove(lang)
         _set_active_langs(__loaded_langs)
+        if release_modules:
+            _release_language_modules([lang])
 
 
-def unload_languages(langs):
+def unload_languages(langs, release_modules=False):
     """Opposite of load_languages()
        Simple for loop using unload_language()
 
     Args:
         langs (list[str])
+        release_modules (bool): see unload_language()
     """
     for lang in langs:
         __loaded_langs.remove(lang)
     _set_active_langs(__loaded_langs)
+    if release_modules:
+        _release_language_modules(langs)
+
+
+def _language_module_names(lang):
+    """ The imported modules of a language, parse_xx, format_xx...
+
+    Args:
+        lang (str): a primary language code
+    Returns:
+        list(str): module names, as in sys.modules
+    """
+    prefix = "lingua_franca.lang."
+    suffix = "_" + lang
+    return sorted(name for name in list(sys.modules)
+                  if name.startswith(prefix) and name.endswith(suffix) and
+                  "." not in name[len(prefix):])
+
+
+def _imports_from(module, names):
+    # does the module hold modules, or objects defined in modules, named
+    # in names?
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            if value.__name__ in names:
+                return True
+        elif getattr(value, "__module__", None) in names:
+            return True
+    return False
+
+
+def _release_language_modules(langs):
+    """ Remove the modules of unloaded languages from sys.modules
+
+    Modules still used by a module of the package which is kept, such as
+    format_de by parse_de when only 'de' parsing would stay, are kept.
+    The results cached for these languages are forgotten.
+
+    Args:
+        langs (list(str)): primary language codes, no longer loaded
+    Returns:
+        list(str): the names of the removed modules
+    """
+    released = set()
+    for lang in langs:
+        if lang not in __loaded_langs:
+            released.update(_language_module_names(lang))
+    changed = True
+    while changed and released:
+        changed = False
+        for name, module in list(sys.modules.items()):
+            if module is None or name in released or \
+                    not name.startswith("lingua_franca.lang."):
+                continue
+            kept = {other for other in released
+                    if _imports_from(module, {other})}
+            if kept:
+                released -= kept
+                changed = True
+    package = sys.modules.get("lingua_franca.lang")
+    for name in released:
+        del sys.modules[name]
+        attribute = name.rsplit(".", 1)[1]
+        if package is not None and attribute in vars(package):
+            delattr(package, attribute)
+    for lang in langs:
+        cache.forget_language(lang)
+    if released:
+        # module globals and functions refer to each other
+        gc.collect()
+    return sorted(released)
+
+
+def _deep_sizeof(module_names):
+    # Size of the objects reachable from the modules, without entering
+    # other modules, or the classes and functions they define
+    modules = [sys.modules[name] for name in module_names]
+    seen = {id(vars(module)) for module in modules}
+    seen.add(id(vars(builtins)))
+    total = sum(sys.getsizeof(vars(module)) for module in modules)
+    stack = [value for module in modules
+             for key, value in vars(module).items() if key != "__builtins__"]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, ModuleType):
+            continue
+        if isinstance(obj, (type, FunctionType)) or callable(obj) and \
+                hasattr(obj, "__wrapped__"):
+            if getattr(obj, "__module__", None) not in module_names:
+                continue
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+def get_language_footprint(langs=None):
+    """ Approximate memory used by the modules of each language
+
+    Counts what the language's modules (parse_xx, format_xx and
+    common_data_xx) hold: functions, tables, compiled regular expressions
+    and cached lexicons. Objects shared with other modules may be counted
+    for several languages.
+
+    Args:
+        langs (list(str), optional): primary language codes, defaults to
+                                     the languages with imported modules
+    Returns:
+        dict: language code -> {"modules": list(str), "bytes": int}
+    """
+    if langs is None:
+        langs = [lang for lang in _SUPPORTED_LANGUAGES
+                 if _language_module_names(lang)]
+    report = {}
+    for lang in langs:
+        names = _language_module_names(lang)
+        report[lang] = {"modules": names,
+                        "bytes": _deep_sizeof(set(names)) if names else 0}
+    return report
 
 
 def get_default_lang():
@@ -448,14 +589,13 @@ def localized_function(run_own_code_on=[type(None)]):
 
     # Begin wrapper
     def localized_function_decorator(func):
+        lang_param_index = list(signature(func).parameters).index('lang')
+
         # Wrapper's logic
         def _call_localized_function(func, *args, **kwargs):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
             unload_language_afterward = False
-            func_signature = signature(func)
-            func_params = list(func_signature.parameters)
-            lang_param_index = func_params.index('lang')
             full_lang_code = None
 
             # Check if we're passing a lang as a kwarg
@@ -520,10 +660,6 @@ def localized_function(run_own_code_on=[type(None)]):
 
             # Here comes the ugly business.
             _module_name = func.__module__.split('.')[-1]
-            _module = import_module(".lang." + _module_name +
-                                    "_" + lang_code, "lingua_franca")
-            # The nonsense above gets you from lingua_franca.parse
-            # to lingua_franca.lang.parse_xx
             if _module_name not in _localized_functions.keys():
                 raise ModuleNotFoundError("Module lingua_franca." +
                                           _module_name + " not recognized")
@@ -536,6 +672,12 @@ def localized_function(run_own_code_on=[type(None)]):
                                               " module of language '" +
                                               lang_code +
                                               "' is not currently loaded.")
+            # Only import once the language is known to be loaded, not to
+            # bring back the modules of an unloaded language
+            _module = import_module(".lang." + _module_name +
+                                    "_" + lang_code, "lingua_franca")
+            # The nonsense above gets you from lingua_franca.parse
+            # to lingua_franca.lang.parse_xx
             func_name = func.__name__.split('.')[-1]
             # At some point in the past, both the module and the language
             # were imported/loaded, respectively.
@@ -570,10 +712,10 @@ def localized_function(run_own_code_on=[type(None)]):
 
             # Now we call the function, ignoring any kwargs from the
             # wrapped function that aren't in the localized function.
-            r_val = localized_func(*args,
-                                   **{arg: val for arg, val
-                                      in kwargs.items()
-                                      if arg in loc_signature.parameters})
+            kwargs = {arg: val for arg, val in kwargs.items()
+                      if arg in loc_signature.parameters}
+            r_val = _call_localized(localized_func, _module_name, func_name,
+                                    lang_code, loc_signature, args, kwargs)
 
             # Unload all the stuff we just assembled and imported
             del localized_func
@@ -582,9 +724,7 @@ def localized_function(run_own_code_on=[type(None)]):
                 unload_language(lang_code)
             return r_val
 
-        # Actual wrapper
-        @wraps(func)
-        def call_localized_function(*args, **kwargs):
+        def _dispatch(*args, **kwargs):
             if run_own_code_on != [type(None)]:
                 try:
                     return _call_localized_function(func, *args, **kwargs)
@@ -595,6 +735,34 @@ def localized_function(run_own_code_on=[type(None)]):
                         raise e
             else:  # don't intercept any exceptions
                 return _call_localized_function(func, *args, **kwargs)
+
+        module_name = func.__module__.split('.')[-1]
+
+        def _dispatch_instrumented(*args, **kwargs):
+            # Report the call to the hooks of lingua_franca.instrumentation
+            lang = kwargs.get('lang')
+            if lang is None and lang_param_index < len(args):
+                lang = args[lang_param_index]
+            if not isinstance(lang, str) or not lang:
+                lang = get_default_lang() or ''
+            error = None
+            start = perf_counter()
+            try:
+                return _dispatch(*args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                instrumentation.notify_call_hooks(
+                    module_name, func.__name__, lang.split('-')[0].lower(),
+                    perf_counter() - start, error)
+
+        # Actual wrapper
+        @wraps(func)
+        def call_localized_function(*args, **kwargs):
+            if instrumentation._call_hooks:
+                return _dispatch_instrumented(*args, **kwargs)
+            return _dispatch(*args, **kwargs)
         return call_localized_function
     try:
         return localized_function_decorator
@@ -603,6 +771,193 @@ def localized_function(run_own_code_on=[type(None)]):
         return
 
 
+def _call_localized(localized_func, lf_module, func_name, lang_code,
+                    loc_signature, args, kwargs):
+    """ Call a localized function within the limits of the configuration,
+    through the result cache
+
+    Args:
+        localized_func (function): e.g. parse_en.extract_datetime_en
+        lf_module (str): the name of the top-level module, e.g. "parse"
+        func_name (str): the name of the function, e.g. "extract_datetime"
+        lang_code (str): the primary language code, e.g. "en"
+        loc_signature (inspect.Signature): of the localized function
+        args (tuple): positional arguments, without the language
+        kwargs (dict): keyword arguments, without the language
+    """
+    cached = None
+    if config.cache_results:
+        cached = ("lingua_franca." + lf_module + "." + func_name, lang_code,
+                  loc_signature)
+    if lf_module == 'parse' and (
+            config.max_input_chars or config.parse_time_budget or
+            limits.current_budget() is not None):
+        return _call_within_budget(localized_func, func_name, args, kwargs,
+                                   cached)
+    if cached:
+        return _call_cached(localized_func, *cached, args, kwargs)
+    return localized_func(*args, **kwargs)
+
+
+def _call_cached(localized_func, qualified_name, lang_code, loc_signature,
+                 args, kwargs, complete=None):
+    """ Call a localized function through the result cache
+
+    See lingua_franca.cache. If given, complete() tells after the call
+    whether its result can be kept.
+    """
+    result_cache = cache._result_cache
+    result_cache.max_entries = config.cache_max_entries
+    result_cache.max_size = config.cache_max_size
+    key = cache.make_key(qualified_name, lang_code, loc_signature, args,
+                         kwargs)
+    if key is None:
+        result_cache.skip()
+        return localized_func(*args, **kwargs)
+    found, r_val = result_cache.get(key)
+    if not found:
+        r_val = localized_func(*args, **kwargs)
+        if complete is None or complete():
+            result_cache.put(key, r_val)
+    return r_val
+
+
+def _call_within_budget(localized_func, func_name, args, kwargs,
+                        cached=None):
+    """ Call a localized parser within the limits of limits.budget(), or
+    else those of the configuration
+
+    See lingua_franca.limits. Only complete results go through the result
+    cache: when the text isn't cut and the call doesn't run out of time,
+    the result is the same as without limits.
+
+    Args:
+        cached (tuple): the qualified name, language code and signature
+                        for _call_cached(), None not to cache the result
+    """
+    budget = limits.current_budget()
+    if budget is None:
+        with limits.budget(config.max_input_chars,
+                           config.parse_time_budget) as budget:
+            r_val = _call_within_budget(localized_func, func_name, args,
+                                        kwargs, cached)
+        if budget.partial:
+            warn(PartialResultWarning(
+                "{}: the {} was partially parsed".format(
+                    func_name, "text" if budget.truncated else
+                    "time budget ran out and the text")))
+        return r_val
+    # whether this call is partial, earlier calls of the budget aside
+    truncated, timed_out = budget.truncated, budget.timed_out
+    budget.truncated = budget.timed_out = False
+    if args and isinstance(args[0], str):
+        args = (budget.limit_text(args[0]),) + args[1:]
+    elif isinstance(kwargs.get('text'), str):
+        kwargs = dict(kwargs, text=budget.limit_text(kwargs['text']))
+    budget.start_call()
+    try:
+        if cached is None:
+            return localized_func(*args, **kwargs)
+        if budget.truncated:
+            cache._result_cache.skip()
+            return localized_func(*args, **kwargs)
+        return _call_cached(localized_func, *cached, args, kwargs,
+                            complete=lambda: not budget.partial)
+    finally:
+        budget.end_call()
+        budget.truncated = budget.truncated or truncated
+        budget.timed_out = budget.timed_out or timed_out
+
+
+def get_localized_function(lf_module, func_name, lang=''):
+    """Find the localized implementation of a function
+
+    @localized_function looks the implementation up on every call. Code
+    calling the same function many times can look it up once with this
+    instead. Calls to the returned function skip the result cache, the
+    parsing limits and the instrumentation hooks; the batch APIs use
+    get_localized_caller(), which applies them.
+
+    Arguments:
+        lf_module(str) - - the name of the top-level module, e.g. "parse"
+        func_name(str) - - the name of the function, e.g. "extract_datetime"
+        lang(str, optional) - - a BCP-47 language code, if omitted the
+                                default language will be used
+
+    Returns:
+        function - - e.g. lingua_franca.lang.parse_en.extract_datetime_en
+
+    Raises:
+        ModuleNotFoundError: if the language is not loaded
+        FunctionNotLocalizedError: if the language doesn't implement it
+    """
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    if not lang_code:
+        raise ModuleNotFoundError("No language module loaded.")
+    if lang_code not in _SUPPORTED_LANGUAGES:
+        _raise_unsupported_language(lang_code)
+    try:
+        loc_signature = _localized_functions[lf_module][lang_code][func_name]
+    except KeyError:
+        raise ModuleNotFoundError(lf_module + " module of language '" +
+                                  lang_code + "' is not currently loaded.")
+    if isinstance(loc_signature, type(NotImplementedError())):
+        raise loc_signature
+    _module = import_module(".lang." + lf_module + "_" + lang_code,
+                            "lingua_franca")
+    try:
+        return getattr(_module, func_name + "_" + lang_code)
+    except AttributeError:
+        raise FunctionNotLocalizedError(func_name, lang_code)
+
+
+def get_localized_caller(lf_module, func_name, lang=''):
+    """Find the localized implementation of a function, to call it as
+    @localized_function does
+
+    The localized function is looked up once, as by
+    get_localized_function(), but each call goes through the result cache
+    (config.cache_results), the parsing limits (config.max_input_chars,
+    config.parse_time_budget, limits.budget()) and the hooks of
+    lingua_franca.instrumentation, as a call to the public function does.
+
+    Arguments:
+        lf_module(str) - - the name of the top-level module, e.g. "parse"
+        func_name(str) - - the name of the function, e.g. "extract_datetime"
+        lang(str, optional) - - a BCP-47 language code, if omitted the
+                                default language will be used
+
+    Returns:
+        function - - taking the arguments of the localized function, e.g.
+                     those of lingua_franca.lang.parse_en.extract_datetime_en
+
+    Raises:
+        ModuleNotFoundError: if the language is not loaded
+        FunctionNotLocalizedError: if the language doesn't implement it
+    """
+    localized_func = get_localized_function(lf_module, func_name, lang)
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    loc_signature = _localized_functions[lf_module][lang_code][func_name]
+
+    def call_localized(*args, **kwargs):
+        if not instrumentation._call_hooks:
+            return _call_localized(localized_func, lf_module, func_name,
+                                   lang_code, loc_signature, args, kwargs)
+        error = None
+        start = perf_counter()
+        try:
+            return _call_localized(localized_func, lf_module, func_name,
+                                   lang_code, loc_signature, args, kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            instrumentation.notify_call_hooks(
+                lf_module, func_name, lang_code, perf_counter() - start,
+                error)
+    return call_localized
+
+
 def populate_localized_function_dict(lf_module, langs=get_active_langs()):
     """Returns a dictionary of dictionaries, containing localized functions.
 
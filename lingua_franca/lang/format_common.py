@@ -13,8 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from functools import lru_cache
 
+from lingua_franca.lang.parse_common import shared_result
 
+# rows of the numbers x denominators matrix searched at a time
+_FRACTION_BLOCK = 65536
+
+
+@shared_result
 def convert_to_mixed_fraction(number, denominators=range(1, 21)):
     """
     Convert floats to components of a mixed fraction representation
@@ -45,3 +52,72 @@ def convert_to_mixed_fraction(number, denominators=range(1, 21)):
         return None
 
     return int_number, int(round(numerator)), denominator
+
+
+@lru_cache()
+def _numpy():
+    # NumPy is optional
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def convert_to_mixed_fractions(numbers, denominators=range(1, 21)):
+    """
+    Convert many floats to components of mixed fractions
+
+    Gives the same results as convert_to_mixed_fraction() for each number.
+    If NumPy is installed, the denominators are tried on all the numbers
+    at once.
+
+    Args:
+        numbers (iter of numbers): numbers to convert
+        denominators (iter of ints): denominators to use, default [1 .. 20]
+    Returns:
+        list: for each number, the whole number, the numerator and the
+              denominator, or None
+    """
+    numbers = list(numbers)
+    numpy = _numpy()
+    if numpy is None:
+        return [convert_to_mixed_fraction(number, denominators)
+                for number in numbers]
+
+    results = []
+    fractional = []  # the indexes of the numbers which aren't whole
+    for number in numbers:
+        int_number = int(number)
+        if int_number == number:
+            results.append((int_number, 0, 1))  # whole number, no fraction
+        else:
+            fractional.append(len(results))
+            results.append(int_number)
+    if not fractional:
+        return results
+    denominators = list(denominators or range(1, 21))
+    if not denominators:
+        for index in fractional:
+            results[index] = None
+        return results
+
+    # the same floating point operations as convert_to_mixed_fraction
+    den_array = numpy.array(denominators, dtype=float)
+    for start in range(0, len(fractional), _FRACTION_BLOCK):
+        block = fractional[start:start + _FRACTION_BLOCK]
+        values = numpy.array([numbers[index] for index in block],
+                             dtype=float)
+        wholes = numpy.array([results[index] for index in block],
+                             dtype=float)
+        numerators = numpy.abs(values - wholes)[:, None] * den_array
+        close = numpy.abs(numerators - numpy.round(numerators)) < 0.01
+        rows = numpy.arange(len(block))
+        first = close.argmax(axis=1)
+        found = close[rows, first].tolist()
+        chosen = numpy.rint(numerators[rows, first]).astype(int).tolist()
+        for index, is_found, numerator, column in zip(block, found, chosen,
+                                                      first.tolist()):
+            results[index] = (results[index], numerator,
+                              denominators[column]) if is_found else None
+    return results
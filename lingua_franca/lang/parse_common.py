@@ -14,7 +14,16 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from types import MappingProxyType
 import re
+import threading
+
+from dateutil.relativedelta import relativedelta
+
+from lingua_franca.limits import out_of_time
 
 
 class Normalizer:
@@ -189,10 +198,76 @@ class Normalizer:
         return utterance
 
 
+_SHARED_RESULTS = threading.local()
+
+
+@contextmanager
+def sharing_results(cache):
+    """
+    Within this context, helpers decorated with @shared_result store their
+    results in `cache`, and reuse them when called again with the same
+    arguments.
+
+    This is how lingua_franca.analyze() lets every extractor run on one
+    utterance share its tokenization and number conversion.
+
+    Args:
+        cache (dict): where results are stored
+    """
+    previous = getattr(_SHARED_RESULTS, "cache", None)
+    _SHARED_RESULTS.cache = cache
+    try:
+        yield cache
+    finally:
+        _SHARED_RESULTS.cache = previous
+
+
+def shared_result(func):
+    """
+    Decorator for pure helpers whose result can be shared by all the
+    functions parsing the same text. See sharing_results().
+
+    Outside of sharing_results() the helper is simply called. Results must
+    not be modified by callers, as they may be returned again.
+    """
+    @wraps(func)
+    def call_shared(*args, **kwargs):
+        cache = getattr(_SHARED_RESULTS, "cache", None)
+        if cache is None:
+            return func(*args, **kwargs)
+        key = (func, args,
+               tuple(sorted(kwargs.items())) if kwargs else ())
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+    return call_shared
+
+
+def share_result(cache, helper, args, result):
+    """
+    Store a result of a @shared_result helper worked out by other means,
+    so that calls to the helper with `args` within sharing_results(cache)
+    return it.
+
+    This is how lingua_franca.session hands its incrementally extracted
+    numbers to the extractors.
+
+    Args:
+        cache (dict): as passed to sharing_results()
+        helper (callable): a function decorated with @shared_result
+        args (tuple): the positional arguments of the call
+        result: what the helper would return
+    """
+    cache[(helper.__wrapped__, tuple(args), ())] = result
+
+
 # Token is intended to be used in the number processing functions in
 # this module. The parsing requires slicing and dividing of the original
 # text. To ensure things parse correctly, we need to know where text came
 # from in the original input, hence this nametuple.
+#
+# Being a namedtuple, a Token is a plain tuple without an instance __dict__,
+# which keeps the one-Token-per-word lists produced by tokenize() small.
 Token = namedtuple('Token', 'word index')
 
 
@@ -204,34 +279,38 @@ class ReplaceableNumber:
     the info about the value, and where it came from in the original text.
     In other words, it is the text, and the number that can replace it in
     the string.
+
+    Instances are immutable. They use __slots__, their indexes are worked
+    out once on creation and their text is only joined when first needed.
     """
+    __slots__ = ('value', 'tokens', 'start_index', 'end_index', '_text')
 
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        set_attribute = super().__setattr__
+        set_attribute('value', value)
+        set_attribute('tokens', tokens)
+        set_attribute('start_index', tokens[0].index if tokens else None)
+        set_attribute('end_index', tokens[-1].index if tokens else None)
+        set_attribute('_text', None)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
 
-    @property
-    def start_index(self):
-        return self.tokens[0].index
-
-    @property
-    def end_index(self):
-        return self.tokens[-1].index
-
     @property
     def text(self):
-        return ' '.join([t.word for t in self.tokens])
+        if self._text is None:
+            super().__setattr__('_text', ' '.join([t.word
+                                                   for t in self.tokens]))
+        return self._text
 
     def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
+        raise Exception("Immutable!")
+
+    def __delattr__(self, key):
+        raise Exception("Immutable!")
+
+    def __reduce__(self):
+        return self.__class__, (self.value, self.tokens)
 
     def __str__(self):
         return "({v}, {t})".format(v=self.value, t=self.tokens)
@@ -241,6 +320,96 @@ class ReplaceableNumber:
                                       t=self.tokens)
 
 
+class IncrementalNumbers:
+    """
+    The numbers of a list of tokens which grows at its end, such as the
+    partial transcripts of a speech recognizer.
+
+    The numbers are always those the helper finds in the whole text, so
+    that the extractors given them return what they return on their own.
+    The helper runs again when the tokens change, except when the only
+    change is new tokens which can't be part of a number: the extractor
+    leaves these alone, and the numbers found before still hold. Appending
+    words to a transcript without saying a number costs time in proportion
+    to the new words, not to the whole transcript.
+
+    A language supports lingua_franca.session by providing a function
+    _incremental_numbers_xx(short_scale, ordinals) returning an
+    IncrementalNumbers, see parse_en.
+
+    Args:
+        is_number_word (callable): whether a word can be part of a number,
+                                   or change how the extractor reads one
+        helper (callable): the @shared_result helper returning the tokens
+                           and numbers of a text, as (tuple, tuple)
+        helper_args (tuple): the arguments of the helper after the text
+    """
+
+    def __init__(self, is_number_word, helper, helper_args=()):
+        self._is_number_word = is_number_word
+        self._helper = helper
+        self._helper_args = tuple(helper_args)
+        self.tokens = []
+        # the tokens and numbers returned by the helper, for the tokens
+        # before _parsed; None if they were never found or the tokens were
+        # truncated since
+        self._result = ((), ())
+        self._parsed = None
+
+    @property
+    def numbers(self):
+        """ [ReplaceableNumber]: the numbers of the tokens, in order """
+        self._update()
+        return list(self._result[1])
+
+    def _update(self):
+        if self._parsed is not None:
+            while self._parsed < len(self.tokens) and \
+                    not self._is_number_word(self.tokens[self._parsed].word):
+                self._parsed += 1
+            if self._parsed == len(self.tokens):
+                return
+        text = " ".join(token.word for token in self.tokens)
+        self._result = self._helper(text, *self._helper_args)
+        self._parsed = len(self.tokens)
+
+    def extend(self, words):
+        """ Append tokens
+
+        Args:
+            words ([str]): the words of the new tokens
+        """
+        start = len(self.tokens)
+        self.tokens.extend(map(Token, words, range(start, start + len(words))))
+
+    def truncate(self, length):
+        """ Keep the first `length` tokens only
+
+        Args:
+            length (int): the number of tokens to keep
+        """
+        if length >= len(self.tokens):
+            return
+        del self.tokens[length:]
+        if self._parsed is not None and length < self._parsed:
+            self._parsed = None
+
+    def share(self, cache, text):
+        """ Make the helper return the tokens and numbers for `text`
+
+        Args:
+            cache (dict): as passed to sharing_results()
+            text (str): the tokens, joined by spaces
+        """
+        self._update()
+        tokens, numbers = self._result
+        # the helper may blank out the tokens it consumed, the new ones are
+        # as they were given
+        tokens = tuple(tokens) + tuple(self.tokens[len(tokens):])
+        share_result(cache, self._helper, (text,) + self._helper_args,
+                     (tokens, numbers))
+
+
 def tokenize(text):
     """
     Generate a list of token object, given a string.
@@ -251,8 +420,477 @@ def tokenize(text):
         [Token]
 
     """
-    return [Token(word, index)
-            for index, word in enumerate(Normalizer.tokenize(text))]
+    words = Normalizer.tokenize(text)
+    return list(map(Token, words, range(len(words))))
+
+
+def tokenize_with_offsets(text, lowercase=False):
+    """
+    Tokenize a string, also returning where each token is in the text.
+
+    Every token produced by tokenize() is a substring of the input, so the
+    offsets are found while walking the string once.
+
+    Lowercasing can change the length of a string ('İ'.lower() is two
+    characters), so with `lowercase` the offsets are still taken from
+    `text` and only the words of the tokens are lowercased.
+
+    Args:
+        text str: Text to tokenize.
+        lowercase bool: lowercase the words of the tokens
+
+    Returns:
+        ([Token], [(int, int)]): the tokens, and the (start, end) character
+                                 offsets of each token in `text`
+
+    """
+    tokens = tokenize(text)
+    offsets = []
+    position = 0
+    for token in tokens:
+        start = text.index(token.word, position)
+        position = start + len(token.word)
+        offsets.append((start, position))
+    if lowercase:
+        tokens = [Token(token.word.lower(), token.index) for token in tokens]
+    return tokens, offsets
+
+
+# Span is returned by the extract_*_spans functions. `start` and `end` are
+# character offsets into the text that was passed in, so that
+# text[start:end] is the part of the text the value was extracted from.
+Span = namedtuple('Span', 'value start end')
+
+
+def number_spans(numbers, offsets):
+    """
+    Convert ReplaceableNumbers into Spans.
+
+    Args:
+        numbers [ReplaceableNumber]: numbers found in a list of tokens
+        offsets [(int, int)]: character offsets of those tokens, as
+                              returned by tokenize_with_offsets()
+
+    Returns:
+        [Span]
+
+    """
+    return [Span(number.value, offsets[number.start_index][0],
+                 offsets[number.end_index][1])
+            for number in numbers if number.tokens]
+
+
+def consumed_spans(value, original_words, words, offsets):
+    """
+    Find the Spans of the words a parser has consumed.
+
+    The datetime parsers blank out the words they use ("" in `words`).
+    Runs of consecutive blanked words are merged into a single Span.
+
+    Args:
+        value: the value of each Span, e.g. the extracted datetime
+        original_words [str]: the words before parsing
+        words [str]: the words after parsing
+        offsets [(int, int)]: character offsets of each word
+
+    Returns:
+        [Span]
+
+    """
+    spans = []
+    previous = None
+    for idx, word in enumerate(original_words):
+        if not word or words[idx]:
+            continue
+        start, end = offsets[idx]
+        if previous == idx - 1:
+            spans[-1] = spans[-1]._replace(end=end)
+        else:
+            spans.append(Span(value, start, end))
+        previous = idx
+    return spans
+
+
+class TrackedText:
+    """
+    A string which remembers where each of its characters came from.
+
+    Parsers rewrite their input before looking for dates and durations
+    (numbers are substituted for words, punctuation is dropped, etc.).
+    TrackedText applies the same edits while keeping, for every
+    character, the (start, end) offsets of the original text it stands
+    for, so that whatever is found in the rewritten text can be mapped
+    back to the user's input.
+    """
+
+    def __init__(self, text, starts=None, ends=None):
+        self.text = text
+        self.starts = list(range(len(text))) if starts is None else starts
+        self.ends = list(range(1, len(text) + 1)) if ends is None else ends
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Join words with single spaces.
+
+        Args:
+            words [(str, int, int)]: each word, and the offsets of the
+                                     original text it replaces. If the word
+                                     is as long as that text, it is mapped
+                                     character by character.
+
+        Returns:
+            TrackedText
+        """
+        text = []
+        starts = []
+        ends = []
+        for idx, (word, start, end) in enumerate(words):
+            if idx:
+                text.append(' ')
+                starts.append(ends[-1] if ends else start)
+                ends.append(start)
+            text.append(word)
+            if len(word) == end - start:
+                starts.extend(range(start, end))
+                ends.extend(range(start + 1, end + 1))
+            else:
+                starts.extend([start] * len(word))
+                ends.extend([end] * len(word))
+        return cls(''.join(text), starts, ends)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return "{n}({t!r})".format(n=self.__class__.__name__, t=self.text)
+
+    def span(self, start, end):
+        """ Original (start, end) offsets of self.text[start:end] """
+        return self.starts[start], self.ends[end - 1]
+
+    def lower(self):
+        if len(self.text.lower()) == len(self.text):
+            return TrackedText(self.text.lower(), self.starts, self.ends)
+        text, starts, ends = [], [], []
+        for char, start, end in zip(self.text, self.starts, self.ends):
+            char = char.lower()
+            text.append(char)
+            starts.extend([start] * len(char))
+            ends.extend([end] * len(char))
+        return TrackedText(''.join(text), starts, ends)
+
+    def replace(self, old, new):
+        """ Same as str.replace, keeping track of the offsets """
+        if not old or old not in self.text:
+            return self
+        matches = []
+        position = self.text.find(old)
+        while position != -1:
+            matches.append((position, position + len(old)))
+            position = self.text.find(old, position + len(old))
+        return self._replace_spans(matches, new)
+
+    def sub(self, pattern, repl):
+        """ Same as pattern.sub(repl, text), keeping track of the offsets
+
+        Args:
+            pattern: a compiled regex
+            repl (callable): returns the replacement of each match
+        """
+        edits = [(match.start(), match.end(), repl(match))
+                 for match in pattern.finditer(self.text)]
+        if not edits:
+            return self
+        return self._edit(edits)
+
+    def remove(self, spans):
+        """ Remove the given non-overlapping (start, end) slices """
+        return self._replace_spans(spans, '')
+
+    def _replace_spans(self, spans, new):
+        return self._edit([(start, end, new) for start, end in spans])
+
+    def _edit(self, edits):
+        """ Replace each of the non-overlapping (start, end) slices by a
+        new string, given as (start, end, new) """
+        text, starts, ends = [], [], []
+        position = 0
+        for start, end, new in edits:
+            text.append(self.text[position:start])
+            starts.extend(self.starts[position:start])
+            ends.extend(self.ends[position:start])
+            if new:
+                text.append(new)
+                starts.extend([self.starts[start]] * len(new))
+                ends.extend([self.ends[end - 1]] * len(new))
+            position = end
+        text.append(self.text[position:])
+        starts.extend(self.starts[position:])
+        ends.extend(self.ends[position:])
+        return TrackedText(''.join(text), starts, ends)
+
+    def split(self):
+        """
+        Same as str.split(), also returning the original offsets
+        of each word.
+
+        Returns:
+            ([str], [(int, int)])
+        """
+        words = []
+        offsets = []
+        for match in re.finditer(r'\S+', self.text):
+            words.append(match.group())
+            offsets.append(self.span(match.start(), match.end()))
+        return words, offsets
+
+
+class DatetimeVocabulary:
+    """
+    The words a language's extract_datetime acts on, indexed once.
+
+    The extract_datetime_xx parsers share their structure: they walk the
+    words of the text, looking for weekdays, months, markers ("at", "on"),
+    time qualifiers ("morning") and relative words. A vocabulary holds
+    these tables as sets, and an index mapping each word to its token
+    class, so that a parser can dispatch on one dict lookup per word
+    instead of scanning lists.
+
+    Token classes are WEEKDAY and MONTH (the value is the 0-based index of
+    the weekday or month), MONTH_SHORT for abbreviations which aren't
+    also a full month name, and DATE_WORD for the other words the date
+    parsing acts on (the value is None).
+
+    Once the words are walked, resolve_datetime and datetime_remainder
+    turn what was found into the result.
+    """
+    WEEKDAY = 'weekday'
+    MONTH = 'month'
+    MONTH_SHORT = 'month_short'
+    DATE_WORD = 'date_word'
+    NO_KEYWORD = (None, None)
+
+    def __init__(self, weekdays, months, months_short=(), markers=(),
+                 qualifiers_am=(), qualifiers_pm=(), year_multiples=None,
+                 day_multiples=(), recur_markers=(), followups=(),
+                 date_words=(), time_words=(), conjunction=''):
+        """
+        Args:
+            weekdays ([str]): from monday to sunday
+            months ([str]): from january to december
+            months_short ([str]): abbreviations, in the same order
+            markers ([str]): words consumed before a date, "at", "on"...
+            qualifiers_am ([str]): parts of the day before noon
+            qualifiers_pm ([str]): parts of the day after noon
+            year_multiples (dict): word -> number of years, "decade": 10
+            day_multiples ([str]): "weeks", "months", "years"
+            recur_markers ([str]): words of recurring dates, "mondays"
+            followups ([str]): besides weekdays and months, the words after
+                               "from"/"after" that make them part of a date
+            date_words ([str]): other words the date parsing acts on
+            time_words ([str]): besides time qualifiers and numbers, the
+                                words the time parsing acts on
+            conjunction (str): "and", dropped from the remaining text when
+                               it joined two consumed words
+        """
+        self.weekdays = tuple(weekdays)
+        self.months = tuple(months)
+        self.months_short = tuple(months_short)
+        self.markers = frozenset(markers)
+        self.qualifiers_am = frozenset(qualifiers_am)
+        self.qualifiers_pm = frozenset(qualifiers_pm)
+        self.qualifiers = self.qualifiers_am | self.qualifiers_pm
+        self.year_multiples = MappingProxyType(dict(year_multiples or {}))
+        self.day_multiples = frozenset(day_multiples)
+        self.recur_markers = frozenset(recur_markers)
+        self.followups = frozenset(self.weekdays + self.months +
+                                   self.months_short + tuple(followups))
+        self.time_words = frozenset(time_words) | self.qualifiers
+        self.conjunction = conjunction
+
+        index = dict.fromkeys(tuple(date_words) + tuple(self.qualifiers),
+                              (self.DATE_WORD, None))
+        index.update((word, (self.MONTH_SHORT, idx))
+                     for idx, word in enumerate(self.months_short))
+        index.update((word, (self.MONTH, idx))
+                     for idx, word in enumerate(self.months))
+        index.update((word, (self.WEEKDAY, idx))
+                     for idx, word in enumerate(self.weekdays))
+        self.index = MappingProxyType(index)
+
+    def lookup(self, word):
+        """
+        Args:
+            word (str): a word of the text
+
+        Returns:
+            (str, int): the token class and value of word, (None, None) if
+                        it isn't in the index
+        """
+        return self.index.get(word, self.NO_KEYWORD)
+
+
+def resolve_datetime(anchorDate, default_time=None, found=False,
+                     datestr="", hasYear=False, daySpecified=False,
+                     dayOffset=False, monthOffset=0, yearOffset=0,
+                     hrOffset=0, minOffset=0, secOffset=0, hrAbs=None,
+                     minAbs=None, replace_time=False):
+    """
+    Apply what a datetime parser found in the text to the anchor date.
+
+    This is the stage the extract_datetime_xx parsers share once they have
+    walked the words: the arguments are the state they build up, under the
+    names they use for it.
+
+    Args:
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found
+        found (bool): whether the parser consumed date or time words
+        datestr (str): an explicit date, "june 5" or "june 5 2017", with
+                       english month names
+        hasYear (bool): whether datestr includes the year
+        daySpecified (bool): the day is explicit, "this evening" doesn't
+                             move to tomorrow when it is already past
+        dayOffset (int or bool): days from the anchor date, True for a day
+                                 found without offset
+        monthOffset (int): months from the anchor date
+        yearOffset (int): years from the anchor date
+        hrOffset (int): hours from the anchor time
+        minOffset (int): minutes from the anchor time
+        secOffset (int): seconds from the anchor time
+        hrAbs (int): hour of the day, None if not given, -1 to keep the
+                     time of the anchor date
+        minAbs (int): minute of the hour, as hrAbs
+        replace_time (bool): set hrAbs and minAbs as the time of the day,
+                             instead of adding them to the date
+
+    Returns:
+        datetime: the datetime the text refers to, or None if nothing was
+                  found
+    """
+    if not (found or datestr != "" or
+            yearOffset != 0 or monthOffset != 0 or
+            dayOffset is True or hrOffset != 0 or
+            hrAbs or minOffset != 0 or
+            minAbs or secOffset != 0):
+        return None
+
+    if dayOffset is False:
+        dayOffset = 0
+
+    extractedDate = anchorDate.replace(microsecond=0)
+    if datestr != "":
+        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
+        try:
+            temp = datetime.strptime(datestr, "%B %d")
+        except ValueError:
+            # Try again, allowing the year
+            temp = datetime.strptime(datestr, "%B %d %Y")
+        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
+        if not hasYear:
+            temp = temp.replace(year=extractedDate.year,
+                                tzinfo=extractedDate.tzinfo)
+            year = anchorDate.year
+            if extractedDate >= temp:
+                year += 1
+        else:
+            year = temp.year
+        extractedDate = extractedDate.replace(year=year,
+                                              month=temp.month,
+                                              day=temp.day,
+                                              tzinfo=extractedDate.tzinfo)
+    else:
+        # ignore the current HH:MM:SS if relative using days or greater
+        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
+            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
+
+    if yearOffset != 0:
+        extractedDate = extractedDate + relativedelta(years=yearOffset)
+    if monthOffset != 0:
+        extractedDate = extractedDate + relativedelta(months=monthOffset)
+    if dayOffset != 0:
+        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    if hrAbs != -1 and minAbs != -1:
+        # If no time was supplied in the string set the time to default
+        # time if it's available
+        if hrAbs is None and minAbs is None and default_time is not None:
+            hrAbs, minAbs = default_time.hour, default_time.minute
+        else:
+            hrAbs = hrAbs or 0
+            minAbs = minAbs or 0
+
+        if replace_time:
+            extractedDate = extractedDate.replace(hour=hrAbs, minute=minAbs)
+        else:
+            extractedDate = extractedDate + relativedelta(hours=hrAbs,
+                                                          minutes=minAbs)
+        if (hrAbs != 0 or minAbs != 0) and datestr == "":
+            if not daySpecified and anchorDate > extractedDate:
+                extractedDate = extractedDate + relativedelta(days=1)
+    if hrOffset != 0:
+        extractedDate = extractedDate + relativedelta(hours=hrOffset)
+    if minOffset != 0:
+        extractedDate = extractedDate + relativedelta(minutes=minOffset)
+    if secOffset != 0:
+        extractedDate = extractedDate + relativedelta(seconds=secOffset)
+    return extractedDate
+
+
+def datetime_remainder(words, conjunction):
+    """
+    The text a datetime parser didn't consume.
+
+    Consumed words are empty strings in words. A conjunction between two
+    consumed words ("monday and tuesday") is consumed as well, in place.
+
+    Args:
+        words ([str]): the words of the text
+        conjunction (str): the language's "and"
+
+    Returns:
+        str: the remaining words, joined by single spaces
+    """
+    for idx, word in enumerate(words):
+        if word == conjunction and \
+                words[idx - 1] == "" and words[idx + 1] == "":
+            words[idx] = ""
+    return ' '.join(" ".join(words).split())
+
+
+class DatetimePlan:
+    """
+    The result of parsing a date or time reference, before it is anchored.
+
+    Most of the work of extract_datetime (number words to digits, cleanup,
+    splitting) doesn't depend on the anchor date. A plan does that work
+    once; resolve() finishes it for a given anchor, with the same result
+    as extract_datetime(text, anchorDate, default_time).
+
+    Languages create plans in extract_datetime_plan_xx, from the words
+    their parser works on and a resolver(words, anchorDate, default_time)
+    function.
+    """
+
+    def __init__(self, text, words, resolver):
+        self.text = text
+        self.words = tuple(words)
+        self._resolver = resolver
+
+    def __repr__(self):
+        return "{n}({t!r})".format(n=self.__class__.__name__, t=self.text)
+
+    def resolve(self, anchorDate=None, default_time=None):
+        """
+        Args:
+            anchorDate (datetime): A reference date/time for "tommorrow", etc
+            default_time (time): Time to set if no time was found
+
+        Returns:
+            [datetime, str]: the datetime and the remaining text, or None
+                             if no date or time related text was found.
+        """
+        return self._resolver(list(self.words), anchorDate, default_time)
 
 
 def partition_list(items, split_on):
@@ -300,6 +938,84 @@ def invert_dict(original):
     return {value: key for key, value in original.items()}
 
 
+def compile_duration_regexes(unit_words, separator=r"(?:\s+|\-)",
+                             suffix="", tail=""):
+    """
+    Compile a regex per unit word, matching "<number> <unit>".
+
+    The regexes are compiled once, rather than on every call. They are
+    applied one after the other by consume_durations(), as removing a
+    duration can bring a number next to the following unit.
+
+    Args:
+        unit_words (iterable): unit words, in the order they are tried
+        separator (str): pattern between the number and the unit
+        suffix (str): pattern for the optional ending of a unit word
+        tail (str): pattern matched, and consumed, after the unit
+
+    Returns:
+        tuple: (unit word, compiled regex with the group "value") pairs
+    """
+    return tuple(
+        (word, re.compile(r"(?P<value>\d+(?:\.?\d+)?){sep}{unit}"
+                          r"{suffix}{tail}".format(
+                              sep=separator, unit=re.escape(word),
+                              suffix=suffix, tail=tail)))
+        for word in unit_words)
+
+
+def consume_durations(text, regexes, units, spans=None):
+    """
+    Remove all durations matched by regexes from text, adding them up.
+
+    Each regex removes its durations from what the previous ones left.
+    A regex is only run if its unit word is in the text.
+
+    Args:
+        text (str or TrackedText): text with numbers as digits
+        regexes: the pairs returned by compile_duration_regexes()
+        units (dict): maps each unit word to a timedelta() keyword
+        spans (list, optional): if given, with a TrackedText, the
+                                (timedelta() keyword, value, start, end)
+                                of every duration in the original text
+                                are appended to it
+
+    Returns:
+        (dict, str or TrackedText): timedelta() keyword arguments, and the
+                                    remaining text
+    """
+    time_units = {
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
+    }
+    tracked = not isinstance(text, str)
+    for word, regex in regexes:
+        if word not in (text.text if tracked else text):
+            continue
+        unit = units[word]
+        matches = []
+
+        def repl(match):
+            time_units[unit] += float(match.group('value'))
+            matches.append(match)
+            return ''
+
+        if not tracked:
+            text = regex.sub(repl, text)
+            continue
+        remaining = text.sub(regex, repl)
+        if spans is not None:
+            spans.extend((unit, float(match.group('value'))) +
+                         text.span(*match.span()) for match in matches)
+        text = remaining
+    return time_units, text
+
+
 def is_numeric(input_str):
     """
     Takes in a string and tests to see if it is a number.
@@ -381,6 +1097,8 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
             # ie pronounce(0.5) != half and extract(half) == 0.5
             extract = False
             # TODO fix this
+        elif out_of_time():
+            extract = False
         else:
             extract = extract_handler(to_parse, short_scale, ordinals)
     numbers.reverse()
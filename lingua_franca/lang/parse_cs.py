@@ -13,18 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
-
-from dateutil.relativedelta import relativedelta
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, tokenize_with_offsets, number_spans, shared_result, \
+    compile_duration_regexes, consume_durations, DatetimeVocabulary, \
+    out_of_time, resolve_datetime, datetime_remainder
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  # _ARTICLES_CS
 
-import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
@@ -82,6 +84,7 @@ _STRING_SHORT_ORDINAL_CS = invert_dict(_SHORT_ORDINAL_CS)
 _STRING_LONG_ORDINAL_CS = invert_dict(_LONG_ORDINAL_CS)
 
 
+@shared_result
 def _convert_words_to_numbers_cs(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -140,7 +143,7 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
     results = []
-    while True:
+    while not out_of_time():
         to_replace = \
             _extract_number_with_text_cs(tokens, short_scale,
                                          ordinals, fractional_numbers)
@@ -333,6 +336,9 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     next_val = None
     to_sum = []
     for idx, token in enumerate(tokens):
+        # a run of scale words multiplies the value, over and over
+        if number_words and out_of_time():
+            break
         current_val = None
         if next_val:
             next_val = None
@@ -553,17 +559,19 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache()
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The tables are
+    built once per scale and shared read-only between calls.
 
     Args:
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mappingproxy(str, number), mappingproxy(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -576,7 +584,8 @@ def _initialize_number_data(short_scale):
     string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
     string_num_scale_cs = invert_dict(string_num_scale_cs)
     string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
-    return multiplies, string_num_ordinal_cs, string_num_scale_cs
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_cs), \
+        MappingProxyType(string_num_scale_cs)
 
 
 def extract_number_cs(text, short_scale=True, ordinals=False):
@@ -599,6 +608,31 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+def extract_number_spans_cs(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_number_cs, also returning where the number was found.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    Returns:
+        [Span]: the extracted number and its character offsets in `text`,
+                or an empty list if no number was found
+    """
+    tokens, offsets = tokenize_with_offsets(text, lowercase=True)
+    number = _extract_number_with_text_cs(tokens, short_scale, ordinals)
+    if not number:
+        return []
+    return number_spans([number], offsets)
+
+
+# Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
+# For day: den, dny, dnů - short patern not applicable, list all
+_DURATION_REGEXES_CS = compile_duration_regexes(_TIME_UNITS_CONVERSION,
+                                                suffix="[ay]?")
+
+
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -628,29 +662,9 @@ def extract_duration_cs(text):
     if not text:
         return None
 
-    # Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
-    # For day: den, dny, dnů - short patern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = _convert_words_to_numbers_cs(text)
-
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    time_units, text = consume_durations(text, _DURATION_REGEXES_CS,
+                                         _TIME_UNITS_CONVERSION)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -658,6 +672,26 @@ def extract_duration_cs(text):
     return (duration, text)
 
 
+_WEEKDAYS_CS = ('pondělí', 'úterý', 'středa', 'čtvrtek', 'pátek', 'sobota',
+                'neděle')
+_DATETIME_VOCABULARY_CS = DatetimeVocabulary(
+    weekdays=_WEEKDAYS_CS,
+    months=_MONTHS_CZECH,
+    months_short=('led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
+                  'zář', 'říj', 'lis', 'pro'),
+    markers=('na', 'v', 'do', 'tento', 'okolo', 'toto', 'během', 'za',
+             'této'),
+    qualifiers_am=('ráno', 'dopoledne'),
+    qualifiers_pm=('odpoledne', 'večer', 'noc', 'noci'),
+    year_multiples={'desetiletí': 10, 'století': 100, 'tisíciletí': 1000},
+    day_multiples=('týden', 'měsíc', 'rok'),
+    recur_markers=_WEEKDAYS_CS + tuple(d + 'ho' for d in _WEEKDAYS_CS) +
+    ('víkend', 'všední'),  # Check this
+    followups=('dnes', 'zítra', 'včera', 'další', 'příští', 'poslední', 'teď',
+               'toto', 'této', 'tento'),
+    conjunction='a')
+
+
 def extract_datetime_cs(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -750,16 +784,6 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
         return wordList
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if text == "" or not anchorDate:
         return None
 
@@ -769,26 +793,19 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
     monthOffset = 0
     yearOffset = 0
     today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ráno', 'dopoledne']
-    timeQualifiersPM = ['odpoledne', 'večer', 'noc', 'noci']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['na', 'v', 'do', 'na', 'tento',
-               'okolo', 'toto', 'během', 'za', 'této']
-    days = ['pondělí', 'úterý', 'středa',
-            'čtvrtek', 'pátek', 'sobota', 'neděle']
-    months = _MONTHS_CZECH
-    recur_markers = days + [d + 'ho' for d in days] + \
-        ['víkend', 'všední']  # Check this
-    monthsShort = ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
-                   'zář', 'říj', 'lis', 'pro']
-    year_multiples = ["desetiletí", "století", "tisíciletí"]
-    day_multiples = ["týden", "měsíc", "rok"]
+    vocabulary = _DATETIME_VOCABULARY_CS
+    timeQualifiersAM = vocabulary.qualifiers_am
+    timeQualifiersPM = vocabulary.qualifiers_pm
+    timeQualifiersList = vocabulary.qualifiers
+    markers = vocabulary.markers
+    recur_markers = vocabulary.recur_markers
+    year_multiples = vocabulary.year_multiples
+    day_multiples = vocabulary.day_multiples
 
     words = clean_string(text)
 
@@ -810,6 +827,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
         #word = word.rstrip('s')
         start = idx
         used = 0
+        kind, value = vocabulary.lookup(word)
         # save timequalifier for later
         # if word == "před" and dayOffset:
         #    dayOffset = - dayOffset
@@ -826,23 +844,13 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
             multiplier = multiplier or 1
             multiplier = int(multiplier)
             used += 2
-            if wordNext == "desetiletí":
-                yearOffset = multiplier * 10
-            elif wordNext == "století":
-                yearOffset = multiplier * 100
-            elif wordNext == "tisíciletí":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNext]
         # couple of
         elif word == "2" and wordNext == "krát" and \
                 wordNextNext in year_multiples:
             multiplier = 2
             used += 3
-            if wordNextNext == "desetiletí":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "století":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "tisíciletí":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNextNext]
         elif word == "2" and wordNext == "krát" and \
                 wordNextNext in day_multiples:
             multiplier = 2
@@ -935,9 +943,8 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+        elif kind == vocabulary.WEEKDAY and not fromFlag:
+            dayOffset = (value + 1) - int(today)
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -951,14 +958,11 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif kind == vocabulary.MONTH or \
+                kind == vocabulary.MONTH_SHORT and not fromFlag:
             used += 1
             # Convert czech months to english
-            datestr = _MONTHS_CONVERSION.get(m)
+            datestr = _MONTHS_CONVERSION.get(value)
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == " " and wordPrevPrev[0].isdigit())):
                 if wordPrev == " " and wordPrevPrev[0].isdigit():
@@ -994,33 +998,24 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("dnes")
-        validFollowups.append("zítra")
-        validFollowups.append("včera")
-        validFollowups.append("další")
-        validFollowups.append("příští")
-        validFollowups.append("poslední")
-        validFollowups.append("teď")
-        validFollowups.append("toto")
-        validFollowups.append("této")
-        validFollowups.append("tento")
-        if (word == "od" or word == "po" or word == "do") and wordNext in validFollowups:
+        if (word == "od" or word == "po" or word == "do") and \
+                wordNext in vocabulary.followups:
             used = 2
             fromFlag = True
             if wordNext == "zítra":
                 dayOffset += 1
             elif wordNext == "včera":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif vocabulary.lookup(wordNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNext)[1]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and \
+                    vocabulary.lookup(wordNextNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNextNext)[1]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "další" or wordPrev == "příští":
@@ -1453,84 +1448,23 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
             idx += used - 1
             found = True
-    # check that we found a date
-    if not date_found():
+    extractedDate = resolve_datetime(
+        anchorDate, default_time, found=found, datestr=datestr,
+        hasYear=hasYear, daySpecified=daySpecified, dayOffset=dayOffset,
+        monthOffset=monthOffset, yearOffset=yearOffset, hrOffset=hrOffset,
+        minOffset=minOffset, secOffset=secOffset, hrAbs=hrAbs,
+        minAbs=minAbs)
+    if extractedDate is None:
         return None
+    resultStr = datetime_remainder(words, vocabulary.conjunction)
+    return [extractedDate, resultStr]
 
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrAbs != -1 and minAbs != -1:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "a" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+_FRACTIONS_CS = {"celá": 1}  # first four numbers have little different format
+# Numbers from 2 to 1 hundret, more is not usualy used in common speech
+_FRACTIONS_CS.update({_FRACTION_STRING_CS[num]: num
+                      for num in _FRACTION_STRING_CS if num > 1})
+_FRACTIONS_CS = MappingProxyType(_FRACTIONS_CS)
 
 
 def isFractional_cs(input_str, short_scale=True):
@@ -1548,14 +1482,8 @@ def isFractional_cs(input_str, short_scale=True):
         # Normalize to format of one (třetiny > třetina)
         input_str = input_str[:len(input_str) - 1] + "a"
 
-    fracts = {"celá": 1}  # first four numbers have little different format
-
-    for num in _FRACTION_STRING_CS:  # Numbers from 2 to 1 hundret, more is not usualy used in common speech
-        if num > 1:
-            fracts[_FRACTION_STRING_CS[num]] = num
-
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
+    if input_str.lower() in _FRACTIONS_CS:
+        return 1.0 / _FRACTIONS_CS[input_str.lower()]
     return False
 
 
@@ -1578,6 +1506,23 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
     return [float(result.value) for result in results]
 
 
+def extract_numbers_spans_cs(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_numbers_cs, also returning where each number was found.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        [Span]: the numbers, as floats, with their character offsets in `text`
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    results = _extract_numbers_with_text_cs(tokens, short_scale, ordinals)
+    return [span._replace(value=float(span.value))
+            for span in number_spans(results, offsets)]
+
+
 class CzechNormalizer(Normalizer):
     with open(resolve_resource_file("text/cs-cz/normalize.json"), encoding='utf8') as f:
         _default_config = json.load(f)
@@ -13,11 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import re
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, compile_duration_regexes, \
+    consume_durations
 from lingua_franca.lang.common_data_de import _DE_NUMBERS
 from lingua_franca.lang.format_de import pronounce_number_de
 
@@ -84,6 +84,21 @@ de_numbers = {
 # reasons.
 
 
+# Einzahl ohne Endung -> timedelta() keyword
+_DURATION_UNITS_DE = {
+    'mikrosekunde': 'microseconds',
+    'millisekunde': 'milliseconds',
+    'sekunde': 'seconds',
+    'minute': 'minutes',
+    'stunde': 'hours',
+    'tag': 'days',
+    'woche': 'weeks'
+}
+# Einzahl und Mehrzahl
+_DURATION_REGEXES_DE = compile_duration_regexes(_DURATION_UNITS_DE,
+                                                suffix="[ne]?")
+
+
 def extract_duration_de(text):
     """
     Convert an german phrase into a number of seconds
@@ -108,32 +123,11 @@ def extract_duration_de(text):
         return None
 
     text = text.lower()
-    # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
-    time_units = {
-        'microseconds': 'mikrosekunden',
-        'milliseconds': 'millisekunden',
-        'seconds': 'sekunden',
-        'minutes': 'minuten',
-        'hours': 'stunden',
-        'days': 'tage',
-        'weeks': 'wochen'
-    }
-
-    # Einzahl und Mehrzahl
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ne]?"
-
     # TODO Einstiegspunkt für Text-zu-Zahlen Konversion
     #text = _convert_words_to_numbers_de(text)
 
-    for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    time_units, text = consume_durations(text, _DURATION_REGEXES_DE,
+                                         _DURATION_UNITS_DE)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -14,11 +14,15 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
-
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache, partial
+from types import MappingProxyType
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, tokenize_with_offsets, number_spans, consumed_spans, \
+    TrackedText, Span, shared_result, compile_duration_regexes, \
+    consume_durations, DatetimePlan, DatetimeVocabulary, out_of_time, \
+    IncrementalNumbers, resolve_datetime, datetime_remainder
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
     _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
@@ -44,26 +48,84 @@ def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
         str
         The original text, with numbers subbed in where appropriate.
 
+    """
+    tokens, numbers = \
+        _extract_numbers_from_text_en(text, short_scale, ordinals)
+    words = _substitute_numbers_en(tokens, numbers)
+    return ' '.join(word for word, _, _ in words)
+
+
+def _convert_words_to_numbers_tracked_en(text, short_scale=True,
+                                         ordinals=False):
+    """
+    Same as _convert_words_to_numbers_en, but the result remembers which
+    part of `text` each of its characters came from.
+
+    Returns:
+        TrackedText
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    numbers = _extract_numbers_with_text_en(tokens, short_scale, ordinals)
+    words = _substitute_numbers_en(tokens, numbers)
+    return TrackedText.from_words([(word, offsets[first][0], offsets[last][1])
+                                   for word, first, last in words])
+
+
+@shared_result
+def _extract_numbers_from_text_en(text, short_scale=True, ordinals=False):
+    """
+    Tokenize a string and extract all of its numbers.
+
+    The result is shared by the extractors parsing the same utterance
+    within lingua_franca.analyze(), and must not be modified.
+
+    Args:
+        text str:
+        short_scale boolean: True if short scale numbers should be used.
+        ordinals boolean: True if ordinals (e.g. first, second, third) should
+                          be parsed to their number values (1, 2, 3...)
+
+    Returns:
+        (tuple(Token), tuple(ReplaceableNumber)): the tokens, and the numbers
+                                                  found in them, in order
+
     """
     tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_en(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
+    numbers = _extract_numbers_with_text_en(tokens, short_scale, ordinals)
+    return tuple(tokens), tuple(numbers)
+
+
+def _substitute_numbers_en(tokens, numbers):
+    """
+    Replace the tokens representing a number with the number itself.
+
+    Args:
+        tokens [Token]:
+        numbers [ReplaceableNumber]: the numbers found in tokens, sorted
+
+    Returns:
+        [(str, int, int)]
+        Each resulting word, with the indexes of the first and last tokens
+        it replaces.
+
+    """
+    numbers_to_replace = list(numbers)
 
     results = []
     for token in tokens:
         if not numbers_to_replace or \
                 token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
+            results.append((token.word, token.index, token.index))
         else:
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
+                results.append((str(numbers_to_replace[0].value),
+                                token.index, numbers_to_replace[0].end_index))
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].end_index:
                 numbers_to_replace.pop(0)
 
-    return ' '.join(results)
+    return results
 
 
 def _extract_numbers_with_text_en(tokens, short_scale=True,
@@ -88,7 +150,7 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
     results = []
-    while True:
+    while not out_of_time():
         to_replace = \
             _extract_number_with_text_en(tokens, short_scale,
                                          ordinals, fractional_numbers)
@@ -281,6 +343,9 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     next_val = None
     to_sum = []
     for idx, token in enumerate(tokens):
+        # a run of scale words multiplies the value, over and over
+        if number_words and out_of_time():
+            break
         current_val = None
         if next_val:
             next_val = None
@@ -499,18 +564,21 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache()
 def _initialize_number_data_en(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The tables only
+    depend on the arguments, so they are built once and shared read-only
+    between calls.
 
     Args:
         short_scale (bool):
         speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_EN) to be numbers
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mappingproxy(str, number), mappingproxy(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -526,7 +594,53 @@ def _initialize_number_data_en(short_scale, speech=True):
 
     if speech:
         string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_en), \
+        MappingProxyType(string_num_scale_en)
+
+
+@lru_cache()
+def _number_vocabulary_en(short_scale):
+    """
+    Every word _extract_numbers_with_text_en can make part of a number,
+    besides digits and fractions such as "3/4".
+
+    Args:
+        short_scale (bool):
+
+    Returns:
+        frozenset(str)
+    """
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data_en(short_scale)
+    return frozenset().union(multiplies, string_num_ordinal,
+                             string_num_scale, _STRING_NUM_EN, _SUMS_EN,
+                             _ARTICLES_EN, _NEGATIVES_EN, _FRACTION_MARKER_EN,
+                             _DECIMAL_MARKER_EN, _SPOKEN_EXTRA_NUM_EN)
+
+
+def _is_number_word_en(word, short_scale=True):
+    word = word.lower()
+    return word in _number_vocabulary_en(short_scale) or \
+        any(char.isdigit() for char in word) or is_numeric(word) or \
+        bool(is_fractional_en(word, short_scale=short_scale))
+
+
+def _incremental_numbers_en(short_scale=True, ordinals=False):
+    """
+    Extract numbers from a growing transcript, for lingua_franca.session.
+
+    Args:
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+
+    Returns:
+        IncrementalNumbers: whose numbers are those of
+                            _extract_numbers_from_text_en(text, short_scale,
+                            ordinals)
+    """
+    return IncrementalNumbers(
+        partial(_is_number_word_en, short_scale=short_scale),
+        _extract_numbers_from_text_en, (short_scale, ordinals))
 
 
 def extract_number_en(text, short_scale=True, ordinals=False):
@@ -549,6 +663,26 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+def extract_number_spans_en(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_number_en, also returning where the number was found.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    Returns:
+        [Span]: the extracted number and its character offsets in `text`,
+                or an empty list if no number was found
+
+    """
+    tokens, offsets = tokenize_with_offsets(text, lowercase=True)
+    number = _extract_number_with_text_en(tokens, short_scale, ordinals)
+    if not number:
+        return []
+    return number_spans([number], offsets)
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -575,34 +709,139 @@ def extract_duration_en(text):
                     be None if no duration is found. The text returned
                     will have whitespace stripped from the ends.
     """
-    if not text:
-        return None
+    result = _extract_duration_en(text)
+    return result[:2] if result else result
+
+
+def extract_duration_spans_en(text):
+    """
+    Same as extract_duration_en, also returning where each part of the
+    duration was found.
+
+    Args:
+        text (str): string containing a duration
+
+    Returns:
+        (timedelta, str, [Span]):
+                    The duration and remaining text, as returned by
+                    extract_duration_en, and a Span for each expression
+                    ("5 minutes", "two hours") which was consumed. The
+                    value of each Span is the timedelta it represents.
+    """
+    return _extract_duration_en(text, track_spans=True)
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = _convert_words_to_numbers_en(text)
+# unit word (without the plural 's') -> timedelta() keyword
+_DURATION_UNITS_EN = MappingProxyType({
+    'microsecond': 'microseconds',
+    'millisecond': 'milliseconds',
+    'second': 'seconds',
+    'minute': 'minutes',
+    'hour': 'hours',
+    'day': 'days',
+    'week': 'weeks'
+})
+_DURATION_REGEXES_EN = compile_duration_regexes(_DURATION_UNITS_EN,
+                                                suffix="s?")
+
+
+def _extract_duration_en(text, track_spans=False):
+    """
+    Shared implementation of extract_duration_en and
+    extract_duration_spans_en
+
+    Args:
+        text (str): string containing a duration
+        track_spans (bool): find where the duration came from in `text`
+
+    Returns:
+        (timedelta, str, [Span])
+    """
+    if not text:
+        return None
 
-    for unit_en in time_units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
+    if track_spans:
+        text = _convert_words_to_numbers_tracked_en(text)
+    else:
+        text = _convert_words_to_numbers_en(text)
 
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    found = []
+    time_units, text = consume_durations(text, _DURATION_REGEXES_EN,
+                                         _DURATION_UNITS_EN, found)
+    spans = sorted((Span(timedelta(**{unit: value}), start, end)
+                    for unit, value, start, end in found),
+                   key=lambda span: span.start)
 
-    text = text.strip()
+    text = str(text).strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
 
-    return (duration, text)
+    return (duration, text, spans)
+
+
+# Rewrites done by extract_datetime_en's clean_string, in the order of
+# the str.replace calls they replace: punctuation is dropped, then each
+# article in its own pass, then the spellings of "o'clock" and plurals are
+# normalized in a single pass, as none of them overlap.
+_DATETIME_PUNCTUATION_EN = str.maketrans('', '', '?.,')
+_DATETIME_PUNCTUATION_REGEX_EN = re.compile('[?.,]')
+_DATETIME_ARTICLES_EN = (' the ', ' a ', ' an ')
+_DATETIME_CLEANUP_EN = MappingProxyType({
+    "o' clock": "o'clock", "o clock": "o'clock",
+    "o ' clock": "o'clock", "o 'clock": "o'clock",
+    "oclock": "o'clock", "couple": "2",
+    "centuries": "century", "decades": "decade",
+    "millenniums": "millennium"
+})
+_DATETIME_CLEANUP_REGEX_EN = re.compile("|".join(
+    map(re.escape, sorted(_DATETIME_CLEANUP_EN, key=len, reverse=True))))
+
+_WEEKDAYS_EN = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+                'saturday', 'sunday')
+_DATETIME_VOCABULARY_EN = DatetimeVocabulary(
+    weekdays=_WEEKDAYS_EN,
+    months=('january', 'february', 'march', 'april', 'may', 'june',
+            'july', 'august', 'september', 'october', 'november',
+            'december'),
+    months_short=('jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                  'sept', 'oct', 'nov', 'dec'),
+    markers=('at', 'in', 'on', 'by', 'this', 'around', 'for', 'of',
+             'within'),
+    qualifiers_am=('morning',),
+    qualifiers_pm=('afternoon', 'evening', 'night', 'tonight'),
+    year_multiples={'decade': 10, 'century': 100, 'millennium': 1000},
+    day_multiples=('weeks', 'months', 'years'),
+    recur_markers=_WEEKDAYS_EN + tuple(d + 's' for d in _WEEKDAYS_EN) +
+    ('weekend', 'weekday', 'weekends', 'weekdays'),
+    followups=('today', 'tomorrow', 'yesterday', 'next', 'last', 'now',
+               'this'),
+    # Words (without a trailing 's') missing from the index are skipped
+    # by the date parsing, unless followed by a year multiple.
+    date_words=('ago', 'now', '2', 'today', 'tomorrow', 'day', 'before',
+                'yesterday', 'week', 'month', 'year', 'from', 'after'),
+    time_words=('noon', 'midnight', '2', 'hour', 'minute', 'second'),
+    conjunction='and')
+_ORDINAL_SUFFIXES_EN = ("rd", "st", "nd", "th")
+
+
+def _clean_datetime_match_en(match):
+    return _DATETIME_CLEANUP_EN[match.group()]
+
+
+def _drop_match(match):
+    return ''
+
+
+def _clean_datetime_string_en(s):
+    # s is a str, or a TrackedText when spans are tracked
+    if isinstance(s, str):
+        s = s.translate(_DATETIME_PUNCTUATION_EN)
+    else:
+        s = s.sub(_DATETIME_PUNCTUATION_REGEX_EN, _drop_match)
+    for article in _DATETIME_ARTICLES_EN:
+        s = s.replace(article, ' ')
+    if isinstance(s, str):
+        return _DATETIME_CLEANUP_REGEX_EN.sub(_clean_datetime_match_en, s)
+    return s.sub(_DATETIME_CLEANUP_REGEX_EN, _clean_datetime_match_en)
 
 
 def extract_datetime_en(text, anchorDate=None, default_time=None):
@@ -635,76 +874,146 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    return _extract_datetime_en(text, anchorDate, default_time)[0]
+
+
+def extract_datetime_spans_en(text, anchorDate=None, default_time=None):
+    """ Same as extract_datetime_en, also returning where the date was found
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [datetime, str, [Span]]: The datetime and remaining text, as returned
+                                 by extract_datetime_en, and a Span for each
+                                 run of words which was consumed. The value
+                                 of each Span is the extracted datetime.
+                                 None if no date or time related text was
+                                 found.
+    """
+    result, spans = _extract_datetime_en(text, anchorDate, default_time,
+                                         track_spans=True)
+    if result is None:
+        return None
+    return result + [spans]
+
+
+def extract_datetime_plan_en(text):
+    """ Parse text once, for extract_datetime_en against many anchors
+
+    Args:
+        text (str): string containing date words
+
+    Returns:
+        DatetimePlan: plan.resolve(anchorDate, default_time) returns the
+                      same as extract_datetime_en(text, anchorDate,
+                      default_time)
+    """
+    words, _ = _clean_datetime_text_en(text) if text else ([], None)
+    return DatetimePlan(text, words, _resolve_datetime_plan_en)
+
+
+def _resolve_datetime_plan_en(words, anchorDate, default_time):
+    return _resolve_datetime_en(words, anchorDate, default_time)[0]
+
+
+def _extract_datetime_en(text, anchorDate=None, default_time=None,
+                         track_spans=False):
+    """ Shared implementation of extract_datetime_en and
+    extract_datetime_spans_en
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+        track_spans (bool): find where the date came from in `text`
+
+    Returns:
+        ([datetime, str] or None, [Span])
+    """
+    if text == "":
+        return None, []
+    words, word_offsets = _clean_datetime_text_en(text, track_spans)
+    return _resolve_datetime_en(words, anchorDate, default_time, word_offsets)
+
+
+def _clean_datetime_text_en(text, track_spans=False):
+    """ Split text into the words extract_datetime_en works on
+
+    Numbers are converted to digits, punctuation and articles dropped, etc.
+    None of this depends on the anchor date.
+
+    Args:
+        text (str): string containing date words
+        track_spans (bool): find where each word came from in `text`
+
+    Returns:
+        ([str], [(int, int)] or None): the words, and their offsets in
+                                        text if track_spans is set
+    """
+    # normalize and lowercase utt  (replaces words with numbers)
+    if track_spans:
+        s = _convert_words_to_numbers_tracked_en(text, ordinals=None)
+    else:
+        s = _convert_words_to_numbers_en(text, ordinals=None)
+    # clean unneeded punctuation and capitalization among other things.
+    s = _clean_datetime_string_en(s.lower())
+
+    if track_spans:
+        wordList, offsets = s.split()
+    else:
+        wordList, offsets = s.split(), None
+    for idx, word in enumerate(wordList):
+        word = word.replace("'s", "")
+
+        if word[0].isdigit():
+            for ordinal in _ORDINAL_SUFFIXES_EN:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        wordList[idx] = word
+
+    return wordList, offsets
+
+
+def _resolve_datetime_en(words, anchorDate=None, default_time=None,
+                         word_offsets=None):
+    """ Find the date and time in words cleaned by _clean_datetime_text_en
+
+    Args:
+        words ([str]): the cleaned words, this list is modified
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+        word_offsets ([(int, int)]): where each word came from in the
+                                     original text, to find the spans
+
+    Returns:
+        ([datetime, str] or None, [Span])
+    """
 
-    def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-            .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-            .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-            .replace("oclock", "o'clock").replace("couple", "2") \
-            .replace("centuries", "century").replace("decades", "decade") \
-            .replace("millenniums", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
-
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
     if not anchorDate:
         anchorDate = datetime.now()
-    if text == "":
-        return None
+    track_spans = word_offsets is not None
 
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
+    today = (anchorDate.weekday() + 1) % 7  # as strftime("%w")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-
-    words = clean_string(text)
+    vocabulary = _DATETIME_VOCABULARY_EN
+    timeQualifiersAM = vocabulary.qualifiers_am
+    timeQualifiersPM = vocabulary.qualifiers_pm
+    markers = vocabulary.markers
+
+    original_words = list(words) if track_spans else None
 
     for idx, word in enumerate(words):
         if word == "":
@@ -716,6 +1025,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # this isn't in clean string because I don't want to save back to words
         word = word.rstrip('s')
+        kind, value = vocabulary.lookup(word)
+        if kind is None and wordNext not in vocabulary.year_multiples:
+            continue
         start = idx
         used = 0
         # save timequalifier for later
@@ -726,33 +1038,28 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+            spans = []
+            if track_spans:
+                spans = consumed_spans(extractedDate, original_words,
+                                       [""] * (idx + 1) + words[idx + 1:],
+                                       word_offsets)
+            return [extractedDate, resultStr], spans
+        elif wordNext in vocabulary.year_multiples:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_en(word)
             multiplier = multiplier or 1
             multiplier = int(multiplier)
             used += 2
-            if wordNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * vocabulary.year_multiples[wordNext]
         # couple of
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in year_multiples:
+                wordNextNext in vocabulary.year_multiples:
             multiplier = 2
             used += 3
-            if wordNextNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * vocabulary.year_multiples[wordNextNext]
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
+                wordNextNext in vocabulary.day_multiples:
             multiplier = 2
             used += 3
             if wordNextNext == "years":
@@ -761,7 +1068,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "weeks":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in vocabulary.qualifiers:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "today" and not fromFlag:
@@ -838,9 +1145,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+        elif kind == vocabulary.WEEKDAY and not fromFlag:
+            dayOffset = (value + 1) - today
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -854,13 +1160,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif kind == vocabulary.MONTH or \
+                kind == vocabulary.MONTH_SHORT and not fromFlag:
             used += 1
-            datestr = months[m]
+            datestr = vocabulary.months[value]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -896,31 +1199,25 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if (word == "from" or word == "after") and \
+                wordNext in vocabulary.followups:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext == "yesterday":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+            elif vocabulary.lookup(wordNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNext)[1]
+                tmpOffset = (d + 1) - today
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+            elif wordNextNext and \
+                    vocabulary.lookup(wordNextNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNextNext)[1]
+                tmpOffset = (d + 1) - today
                 used = 3
                 if wordNext == "next":
                     if dayOffset <= 2:
@@ -954,7 +1251,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     military = False
 
     for idx, word in enumerate(words):
-        if word == "":
+        if word == "" or \
+                not word[0].isdigit() and word not in vocabulary.time_words:
             continue
 
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -1159,9 +1457,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in vocabulary.recur_markers or
+                        wordNext in vocabulary.recur_markers or
+                        wordNextNext in vocabulary.recur_markers):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1339,85 +1637,40 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
             idx += used - 1
             found = True
-    # check that we found a date
-    if not date_found():
-        return None
+    extractedDate = resolve_datetime(
+        anchorDate, default_time, found=found, datestr=datestr,
+        hasYear=hasYear, daySpecified=daySpecified, dayOffset=dayOffset,
+        monthOffset=monthOffset, yearOffset=yearOffset, hrOffset=hrOffset,
+        minOffset=minOffset, secOffset=secOffset, hrAbs=hrAbs,
+        minAbs=minAbs)
+    if extractedDate is None:
+        return None, []
+    resultStr = datetime_remainder(words, vocabulary.conjunction)
+    spans = []
+    if track_spans:
+        spans = consumed_spans(extractedDate, original_words, words,
+                               word_offsets)
+    return [extractedDate, resultStr], spans
+
+
+@lru_cache()
+def _initialize_fraction_data_en(short_scale):
+    """
+    Generate the dictionary of fraction words to denominators used by
+    is_fractional_en, e.g. "fifth" -> 5. Built once per scale.
 
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrAbs != -1 and minAbs != -1:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "and" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
+    Args:
+        short_scale (bool):
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    Returns:
+        mappingproxy(str, number)
+    """
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    ordinals = _SHORT_ORDINAL_EN if short_scale else _LONG_ORDINAL_EN
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return MappingProxyType(fracts)
 
 
 def is_fractional_en(input_str, short_scale=True, spoken=True):
@@ -1435,15 +1688,7 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
+    fracts = _initialize_fraction_data_en(short_scale)
 
     if input_str.lower() in fracts and spoken:
         return 1.0 / fracts[input_str.lower()]
@@ -1464,11 +1709,30 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_en(tokenize(text),
-                                            short_scale, ordinals)
+    _, results = _extract_numbers_from_text_en(text, short_scale, ordinals)
     return [float(result.value) for result in results]
 
 
+def extract_numbers_spans_en(text, short_scale=True, ordinals=False):
+    """
+        Same as extract_numbers_en, also returning where each number was found.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        [Span]: the numbers, as floats, with their character offsets in `text`
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    results = _extract_numbers_with_text_en(tokens, short_scale, ordinals)
+    return [span._replace(value=float(span.value))
+            for span in number_spans(results, offsets)]
+
+
 class EnglishNormalizer(Normalizer):
     with open(resolve_resource_file("text/en-us/normalize.json")) as f:
         _default_config = json.load(f)
@@ -13,15 +13,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import re
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, compile_duration_regexes, \
+    consume_durations
 from lingua_franca.lang.format_fr import pronounce_number_fr
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
 
+# unit word (without the plural 's') -> timedelta() keyword
+_DURATION_UNITS_FR = {
+    'microseconde': 'microseconds',
+    'milliseconde': 'milliseconds',
+    'seconde': 'seconds',
+    'minute': 'minutes',
+    'heure': 'hours',
+    'jour': 'days',
+    'semaine': 'weeks'
+}
+_DURATION_REGEXES_FR = compile_duration_regexes(_DURATION_UNITS_FR,
+                                                suffix="[s]?",
+                                                tail=r"(\s+|,|$)")
+
+
 def extract_duration_fr(text):
     """
     Convert an french phrase into a number of seconds
@@ -47,26 +62,8 @@ def extract_duration_fr(text):
 
     text = normalize_fr(text)
 
-    time_units = {
-        'microseconds': 'microsecondes',
-        'milliseconds': 'millisecondes',
-        'seconds': 'secondes',
-        'minutes': 'minutes',
-        'hours': 'heures',
-        'days': 'jours',
-        'weeks': 'semaines'
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)"
-
-    for (unit_en, unit_fr) in time_units.items():
-        unit_pattern = pattern.format(unit=unit_fr[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    time_units, text = consume_durations(text, _DURATION_REGEXES_FR,
+                                         _DURATION_UNITS_FR)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -357,7 +354,8 @@ def _number_ordinal_fr(words, i):
                     word = word + "e"
                     result = _number_parse_fr([word], 0)
                 if result:
-                    val2, i = result
+                    # the index is the one in [word], not in words
+                    val2 = result[0]
                 if val2 is not None:
                     strOrd = str(val1 + val2) + "e"
         if strOrd:
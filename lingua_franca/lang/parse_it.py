@@ -19,6 +19,8 @@
 """
 
 import collections
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
@@ -29,6 +31,93 @@ from lingua_franca.lang.common_data_it import _SHORT_ORDINAL_STRING_IT, \
     _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT
 
 
+# Tables used by _extract_number_long_it, built once at import time
+_UNITS_IT = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
+             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
+
+_TENS_IT = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
+            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
+            'novanta': 90}
+
+_TENS_SHORT_IT = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
+                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
+
+_NUMS_LONG_IT = {'undici': 11, 'dodici': 12, 'tredici': 13,
+                 'quattordici': 14, 'quindici': 15, 'sedici': 16,
+                 'diciassette': 17, 'diciotto': 18, 'diciannove': 19}
+
+_MULTIPLI_IT = collections.OrderedDict([
+    # (1e63, 'deciliardi'),
+    # (1e60, 'decilioni'),
+    # (1e57, 'noviliardi'),
+    # (1e54, 'novilioni'),
+    # (1e51, 'ottiliardi'),
+    # (1e48, 'ottilioni'),
+    # (1e45, 'settiliardi'),
+    # (1e42, 'settilioni'),
+    # (1e39, 'sestiliardi'),
+    # (1e36, 'sestilioni'),
+    # (1e33, 'quintiliardi'),
+    # (1e30, 'quintilioni'),
+    # (1e27, 'quadriliardi'),
+    # (1e24, 'quadrilioni'),    # yotta
+    (1e21, 'triliardi'),  # zetta
+    (1e18, 'trilioni'),  # exa
+    (1e15, 'biliardi'),  # peta
+    (1e12, 'bilioni'),  # tera
+    (1e9, 'miliardi'),  # giga
+    (1e6, 'milioni')  # mega
+])
+
+
+def _generate_multipliers_it(multipli_it):
+    """
+    Build the plural and singular ("un" + x) lookup tables of the
+    large multipliers, e.g. milioni -> 1e6, unmilione -> 1e6
+
+    Args:
+        multipli_it (OrderedDict): {value: plural word}
+    Returns:
+        (mappingproxy, mappingproxy): multiplier, un_multiplier
+    """
+    multiplier = {}
+    un_multiplier = {}
+
+    for num in multipli_it:
+        if num > 1000 and num <= 1e21:
+            # plurali
+            multiplier[multipli_it[num]] = int(num)
+            # singolari - modificare per eccezioni *liardo
+            if multipli_it[num][-5:-1] == 'iard':
+                un_multiplier['un' + multipli_it[num][:-1] + 'o'] = int(num)
+            else:
+                un_multiplier['un' + multipli_it[num][:-1] + 'e'] = int(num)
+    return MappingProxyType(multiplier), MappingProxyType(un_multiplier)
+
+
+_MULTIPLIER_IT, _UN_MULTIPLIER_IT = _generate_multipliers_it(_MULTIPLI_IT)
+
+
+@lru_cache()
+def _initialize_fraction_data_it(short_scale):
+    """
+    Generate the dictionary of fraction words to denominators used by
+    is_fractional_it. Built once per scale.
+
+    Args:
+        short_scale (bool):
+    Returns:
+        mappingproxy(str, number)
+    """
+    fracts_it = {"intero": 1, "mezza": 2, "mezzo": 2}
+    ordinals = _SHORT_ORDINAL_STRING_IT if short_scale \
+        else _LONG_ORDINAL_STRING_IT
+    for num in ordinals:
+        if num > 2:
+            fracts_it[ordinals[num]] = num
+    return MappingProxyType(fracts_it)
+
+
 def is_fractional_it(input_str, short_scale=False):
     """
     This function takes the given text and checks if it is a fraction.
@@ -45,16 +134,7 @@ def is_fractional_it(input_str, short_scale=False):
     if input_str.endswith('i', -1) and len(input_str) > 2:
         input_str = input_str[:-1] + "o"  # normalizza plurali
 
-    fracts_it = {"intero": 1, "mezza": 2, "mezzo": 2}
-
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[_SHORT_ORDINAL_STRING_IT[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[_LONG_ORDINAL_STRING_IT[num]] = num
+    fracts_it = _initialize_fraction_data_it(short_scale)
 
     if input_str in fracts_it:
         return 1.0 / fracts_it[input_str]
@@ -78,56 +158,6 @@ def _extract_number_long_it(word):
                                    was found
     """
 
-    units = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
-             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
-
-    tens = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
-            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
-            'novanta': 90}
-
-    tens_short = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
-                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
-
-    nums_long = {'undici': 11, 'dodici': 12, 'tredici': 13, 'quattordici': 14,
-                 'quindici': 15, 'sedici': 16, 'diciassette': 17,
-                 'diciotto': 18, 'diciannove': 19}
-
-    multipli_it = collections.OrderedDict([
-        # (1e63, 'deciliardi'),
-        # (1e60, 'decilioni'),
-        # (1e57, 'noviliardi'),
-        # (1e54, 'novilioni'),
-        # (1e51, 'ottiliardi'),
-        # (1e48, 'ottilioni'),
-        # (1e45, 'settiliardi'),
-        # (1e42, 'settilioni'),
-        # (1e39, 'sestiliardi'),
-        # (1e36, 'sestilioni'),
-        # (1e33, 'quintiliardi'),
-        # (1e30, 'quintilioni'),
-        # (1e27, 'quadriliardi'),
-        # (1e24, 'quadrilioni'),    # yotta
-        (1e21, 'triliardi'),  # zetta
-        (1e18, 'trilioni'),  # exa
-        (1e15, 'biliardi'),  # peta
-        (1e12, 'bilioni'),  # tera
-        (1e9, 'miliardi'),  # giga
-        (1e6, 'milioni')  # mega
-    ])
-
-    multiplier = {}
-    un_multiplier = {}
-
-    for num in multipli_it:
-        if num > 1000 and num <= 1e21:
-            # plurali
-            multiplier[multipli_it[num]] = int(num)
-            # singolari - modificare per eccezioni *liardo
-            if multipli_it[num][-5:-1] == 'iard':
-                un_multiplier['un' + multipli_it[num][:-1] + 'o'] = int(num)
-            else:
-                un_multiplier['un' + multipli_it[num][:-1] + 'e'] = int(num)
-
     value = False
 
     # normalizza ordinali singoli o plurali -esimo -esimi
@@ -144,47 +174,47 @@ def _extract_number_long_it(word):
 
         word = base
 
-    for item in un_multiplier:
+    for item in _UN_MULTIPLIER_IT:
         components = word.split(item, 1)
         if len(components) == 2:
             if not components[0]:  # inizia con un1^x
                 if not components[1]:  # unmilione
-                    word = str(int(un_multiplier[item]))
+                    word = str(int(_UN_MULTIPLIER_IT[item]))
                 else:  # unmilione + x
-                    word = str(int(un_multiplier[item]) +
+                    word = str(int(_UN_MULTIPLIER_IT[item]) +
                                _extract_number_long_it(components[1]))
 
-    for item in multiplier:
+    for item in _MULTIPLIER_IT:
         components = word.split(item, 1)
         if len(components) == 2:
             if not components[0]:  # inizia con un1^x
-                word = str(int(multiplier[item]) +
+                word = str(int(_MULTIPLIER_IT[item]) +
                            _extract_number_long_it(components[1]))
             else:
                 if not components[1]:
                     word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item]))
+                        + str(int(_MULTIPLIER_IT[item]))
                 else:
                     word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item])) + '+' \
+                        + str(int(_MULTIPLIER_IT[item])) + '+' \
                         + str(_extract_number_long_it(components[1]))
 
-    for item in tens:
-        word = word.replace(item, '+' + str(tens[item]))
+    for item in _TENS_IT:
+        word = word.replace(item, '+' + str(_TENS_IT[item]))
 
-    for item in tens_short:
-        word = word.replace(item, '+' + str(tens_short[item]))
+    for item in _TENS_SHORT_IT:
+        word = word.replace(item, '+' + str(_TENS_SHORT_IT[item]))
 
-    for item in nums_long:
-        word = word.replace(item, '+' + str(nums_long[item]))
+    for item in _NUMS_LONG_IT:
+        word = word.replace(item, '+' + str(_NUMS_LONG_IT[item]))
 
     word = word.replace('cento', '+1xx')
     word = word.replace('cent', '+1xx')
     word = word.replace('mille', '+1000')  # unmilionemille
     word = word.replace('mila', '*1000')  # unmilioneduemila
 
-    for item in units:
-        word = word.replace(item, '+' + str(units[item]))
+    for item in _UNITS_IT:
+        word = word.replace(item, '+' + str(_UNITS_IT[item]))
 
     # normalizzo i cento
     occorrenze = word.count('+1xx')
@@ -13,20 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
-
-from dateutil.relativedelta import relativedelta
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
+    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict, \
+    tokenize_with_offsets, number_spans, shared_result, \
+    compile_duration_regexes, consume_durations, DatetimeVocabulary, \
+    out_of_time, resolve_datetime, datetime_remainder
 from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
     _NEGATIVES_NL, _SHORT_SCALE_NL, _STRING_LONG_ORDINAL_NL, _STRING_NUM_NL, \
     _STRING_SHORT_ORDINAL_NL, _SUMS_NL
-import re
 
 
+@shared_result
 def _convert_words_to_numbers_nl(text, short_scale=True, ordinals=False):
     """Convert words in a string into their equivalent numbers.
     Args:
@@ -80,7 +83,7 @@ def _extract_numbers_with_text_nl(tokens, short_scale=True,
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
     results = []
-    while True:
+    while not out_of_time():
         to_replace = \
             _extract_number_with_text_nl(tokens, short_scale,
                                          ordinals, fractional_numbers)
@@ -264,6 +267,9 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     next_val = None
     to_sum = []
     for idx, token in enumerate(tokens):
+        # a run of scale words multiplies the value, over and over
+        if number_words and out_of_time():
+            break
         current_val = None
         if next_val:
             next_val = None
@@ -389,16 +395,18 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache()
 def _initialize_number_data_nl(short_scale):
     """Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The tables are
+    built once per scale and shared read-only between calls.
 
     Args:
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mappingproxy(str, number), mappingproxy(str, number))
         multiplies, string_num_ordinal, string_num_scale
     """
     multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
@@ -410,7 +418,8 @@ def _initialize_number_data_nl(short_scale):
     string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
     string_num_scale_nl = invert_dict(string_num_scale_nl)
 
-    return multiplies, string_num_ordinal_nl, string_num_scale_nl
+    return frozenset(multiplies), MappingProxyType(string_num_ordinal_nl), \
+        MappingProxyType(string_num_scale_nl)
 
 
 def extract_number_nl(text, short_scale=True, ordinals=False):
@@ -432,6 +441,47 @@ def extract_number_nl(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+def extract_number_spans_nl(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_number_nl, also returning where the number was found.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    Returns:
+        [Span]: the extracted number and its character offsets in `text`,
+                or an empty list if no number was found
+    """
+    tokens, offsets = tokenize_with_offsets(text, lowercase=True)
+    number = _extract_number_with_text_nl(tokens, short_scale, ordinals)
+    if not number:
+        return []
+    return number_spans([number], offsets)
+
+
+_DURATION_TRANSLATIONS_NL = {
+    'microseconds': ["microsecond", "microseconde", "microseconden",
+                     "microsecondje", "microsecondjes"],
+    'milliseconds': ["millisecond", "milliseconde", "milliseconden",
+                     "millisecondje", "millisecondjes"],
+    'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
+    'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
+    'hours': ["uur", "uren", "uurtje", "uurtjes"],
+    'days': ["dag", "dagen", "dagje", "dagjes"],
+    'weeks': ["week", "weken", "weekje", "weekjes"]
+}
+# unit word -> timedelta() keyword
+_DURATION_UNITS_NL = MappingProxyType(
+    {word: unit for unit, words in _DURATION_TRANSLATIONS_NL.items()
+     for word in words})
+# unit by unit, longest words first, so that "seconden" is not matched as
+# "seconde"
+_DURATION_REGEXES_NL = compile_duration_regexes(
+    [word for words in _DURATION_TRANSLATIONS_NL.values()
+     for word in sorted(words, key=len, reverse=True)], separator=r"\s+")
+
+
 def extract_duration_nl(text):
     """Convert an english phrase into a number of seconds
 
@@ -460,38 +510,9 @@ def extract_duration_nl(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    nl_translations = {
-        'microseconds': ["microsecond", "microseconde", "microseconden", "microsecondje", "microsecondjes"],
-        'milliseconds': ["millisecond", "milliseconde", "milliseconden", "millisecondje", "millisecondjes"],
-        'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
-        'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
-        'hours': ["uur", "uren", "uurtje", "uurtjes"],
-        'days': ["dag", "dagen", "dagje", "dagjes"],
-        'weeks': ["week", "weken", "weekje", "weekjes"]
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
     text = _convert_words_to_numbers_nl(text)
-
-    for unit in time_units:
-        unit_nl_words = nl_translations[unit]
-        unit_nl_words.sort(key=len, reverse=True)
-        for unit_nl in unit_nl_words:
-            unit_pattern = pattern.format(unit=unit_nl)
-            matches = re.findall(unit_pattern, text)
-            value = sum(map(float, matches))
-            time_units[unit] = time_units[unit] + value
-            text = re.sub(unit_pattern, '', text)
+    time_units, text = consume_durations(text, _DURATION_REGEXES_NL,
+                                         _DURATION_UNITS_NL)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -499,6 +520,30 @@ def extract_duration_nl(text):
     return (duration, text)
 
 
+_WEEKDAYS_NL = ("maandag", "dinsdag", "woensdag", "donderdag", "vrijdag",
+                "zaterdag", "zondag")
+# in this order, their index is used to work out the weekday of day parts
+_TIME_QUALIFIERS_NL = ('ochtend', 'middag', 'avond', 'nacht')
+_DAY_PARTS_NL = tuple(a + b for a in _WEEKDAYS_NL for b in _TIME_QUALIFIERS_NL)
+_DATETIME_VOCABULARY_NL = DatetimeVocabulary(
+    weekdays=_WEEKDAYS_NL,
+    months=('januari', 'februari', 'maart', 'april', 'mei', 'juni',
+            'juli', 'augustus', 'september', 'oktober', 'november',
+            'december'),
+    months_short=('jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug',
+                  'sep', 'okt', 'nov', 'dec'),
+    markers=('op', 'in', 'om', 'tegen', 'over', 'deze', 'rond', 'voor',
+             'van', 'binnen'),
+    qualifiers_am=('ochtend',),
+    qualifiers_pm=('middag', 'avond', 'nacht'),
+    year_multiples={'decennium': 10, 'eeuw': 100, 'millennium': 1000},
+    day_multiples=('dagen', 'weken', 'maanden', 'jaren'),
+    recur_markers=_WEEKDAYS_NL + tuple(d + 'en' for d in _WEEKDAYS_NL) +
+    ('weekeinde', 'werkdag', 'weekeinden', 'werkdagen'),
+    followups=('vandaag', 'morgen', 'volgende', 'vorige', 'nu'),
+    conjunction='en')
+
+
 def extract_datetime_nl(text, anchorDate=None, default_time=None):
     """Convert a human date reference into an exact datetime
 
@@ -550,16 +595,6 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
 
         return wordList
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if text == "" or not anchorDate:
         return None
 
@@ -569,30 +604,18 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
     monthOffset = 0
     yearOffset = 0
     today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ochtend']
-    timeQualifiersPM = ['middag', 'avond', 'nacht']
-    timeQualifiersList = timeQualifiersAM + timeQualifiersPM
-    timeQualifierOffsets = [8, 15, 19, 0]
-    markers = ['op', 'in', 'om', 'tegen', 'over',
-               'deze', 'rond', 'voor', 'van', "binnen"]
-    days = ["maandag", "dinsdag", "woensdag", "donderdag", "vrijdag",
-            "zaterdag", "zondag"]
-    day_parts = [a + b for a in days for b in timeQualifiersList]
-    months = ['januari', 'februari', 'maart', 'april', 'mei', 'juni',
-              'juli', 'augustus', 'september', 'oktober', 'november',
-              'december']
-    recur_markers = days + [d+'en' for d in days] + ['weekeinde', 'werkdag',
-                                                     'weekeinden', 'werkdagen']
-    months_short = ['jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug',
-                    'sep', 'okt', 'nov', 'dec']
-    year_multiples = ["decennium", "eeuw", "millennium"]
-    day_multiples = ["dagen", "weken", "maanden", "jaren"]
+    vocabulary = _DATETIME_VOCABULARY_NL
+    timeQualifiersAM = vocabulary.qualifiers_am
+    timeQualifiersPM = vocabulary.qualifiers_pm
+    timeQualifiersList = _TIME_QUALIFIERS_NL
+    markers = vocabulary.markers
+    year_multiples = vocabulary.year_multiples
+    day_multiples = vocabulary.day_multiples
 
     words = clean_string(text)
 
@@ -604,6 +627,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
         wordNext = words[idx + 1] if idx + 1 < len(words) else ""
         wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
 
+        kind, value = vocabulary.lookup(word)
         start = idx
         used = 0
         # save timequalifier for later
@@ -620,12 +644,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
             multiplier = multiplier or 1
             multiplier = int(multiplier)
             used += 2
-            if wordNext == "decennium":
-                yearOffset = multiplier * 10
-            elif wordNext == "eeuw":
-                yearOffset = multiplier * 100
-            elif wordNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNext]
         # paar
         elif word == "2" and \
                 wordNextNext in year_multiples:
@@ -708,9 +727,8 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+        elif kind == vocabulary.WEEKDAY and not fromFlag:
+            dayOffset = (value + 1) - int(today)
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -723,19 +741,16 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used += 1
                 start -= 1
-        elif word in day_parts and not fromFlag:
-            d = day_parts.index(word) / len(timeQualifiersList)
+        elif word in _DAY_PARTS_NL and not fromFlag:
+            d = _DAY_PARTS_NL.index(word) / len(timeQualifiersList)
             dayOffset = (d + 1) - int(today)
             if dayOffset < 0:
                 dayOffset += 7
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in months_short and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = months_short.index(word)
+        elif kind == vocabulary.MONTH or \
+                kind == vocabulary.MONTH_SHORT and not fromFlag:
             used += 1
-            datestr = months[m]
+            datestr = vocabulary.months[value]
             if wordPrev and \
                     (wordPrev[0].isdigit() or (wordPrev == "van" and
                                                wordPrevPrev[0].isdigit())):
@@ -766,28 +781,24 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + months_short
-        validFollowups.append("vandaag")
-        validFollowups.append("morgen")
-        validFollowups.append("volgende")
-        validFollowups.append("vorige")
-        validFollowups.append("nu")
-        if (word == "van" or word == "na") and wordNext in validFollowups:
+        if (word == "van" or word == "na") and \
+                wordNext in vocabulary.followups:
             used = 2
             fromFlag = True
             if wordNext == "morgen":
                 dayOffset += 1
             elif wordNext == "overmorgen":
                 dayOffset += 2
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif vocabulary.lookup(wordNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNext)[1]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and \
+                    vocabulary.lookup(wordNextNext)[0] == vocabulary.WEEKDAY:
+                d = vocabulary.lookup(wordNextNext)[1]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "volgende":
@@ -1025,9 +1036,9 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in vocabulary.recur_markers or
+                        wordNext in vocabulary.recur_markers or
+                        wordNextNext in vocabulary.recur_markers):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1187,85 +1198,36 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
 
             idx += used - 1
             found = True
-    # check that we found a date
-    if not date_found():
+    extractedDate = resolve_datetime(
+        anchorDate, default_time, found=found, datestr=datestr,
+        hasYear=hasYear, daySpecified=daySpecified, dayOffset=dayOffset,
+        monthOffset=monthOffset, yearOffset=yearOffset, hrOffset=hrOffset,
+        minOffset=minOffset, secOffset=secOffset, hrAbs=hrAbs,
+        minAbs=minAbs, replace_time=True)
+    if extractedDate is None:
         return None
+    resultStr = datetime_remainder(words, vocabulary.conjunction)
+    return [extractedDate, resultStr]
 
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrAbs != -1 and minAbs != -1:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate.replace(hour=hrAbs,
-                                              minute=minAbs)
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "en" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+@lru_cache()
+def _initialize_fraction_data_nl(short_scale):
+    """Generate the dictionary of fraction words to denominators used by
+    is_fractional_nl. Built once per scale.
+
+    Args:
+        short_scale (bool):
+
+    Returns:
+        mappingproxy(str, number)
+    """
+    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
+    ordinals = _SHORT_ORDINAL_STRING_NL if short_scale \
+        else _LONG_ORDINAL_STRING_NL
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return MappingProxyType(fracts)
 
 
 def is_fractional_nl(input_str, short_scale=True):
@@ -1277,16 +1239,7 @@ def is_fractional_nl(input_str, short_scale=True):
     Returns:
         (bool) or (float): False if not a fraction, otherwise the fraction
     """
-    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_STRING_NL[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_LONG_ORDINAL_STRING_NL[num]] = num
-
+    fracts = _initialize_fraction_data_nl(short_scale)
     if input_str.lower() in fracts:
         return 1.0 / fracts[input_str.lower()]
     return False
@@ -1310,6 +1263,23 @@ def extract_numbers_nl(text, short_scale=True, ordinals=False):
     return [float(result.value) for result in results]
 
 
+def extract_numbers_spans_nl(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_numbers_nl, also returning where each number was found.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        [Span]: the numbers, as floats, with their character offsets in `text`
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    results = _extract_numbers_with_text_nl(tokens, short_scale, ordinals)
+    return [span._replace(value=float(span.value))
+            for span in number_spans(results, offsets)]
+
+
 def normalize_nl(text, remove_articles=True):
     """Dutch string normalization."""
 
@@ -14,18 +14,20 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    tokenize_with_offsets, number_spans, shared_result, \
+    compile_duration_regexes, consume_durations, out_of_time
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
     _ALT_ORDINALS_PL
 
-import re
-
 
 def generate_plurals_pl(originals):
     """
@@ -109,6 +111,7 @@ _STRING_SHORT_ORDINAL_PL = invert_dict(_SHORT_ORDINAL_PL)
 _REV_FRACTITONS = generate_fractions_pl(invert_dict(_FRACTION_STRING_PL))
 
 
+@shared_result
 def _convert_words_to_numbers_pl(text, short_scale=True, ordinals=False):
     """
     Convert words in a string into their equivalent numbers.
@@ -167,7 +170,7 @@ def _extract_numbers_with_text_pl(tokens, short_scale=True,
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
     results = []
-    while True:
+    while not out_of_time():
         to_replace = \
             _extract_number_with_text_pl(tokens, short_scale,
                                          ordinals, fractional_numbers)
@@ -358,6 +361,9 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     next_val = None
     to_sum = []
     for idx, token in enumerate(tokens):
+        # a run of scale words multiplies the value, over and over
+        if number_words and out_of_time():
+            break
         current_val = None
         if next_val:
             next_val = None
@@ -555,17 +561,19 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache()
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The tables are
+    built once and shared read-only between calls.
 
     Args:
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), mappingproxy(str, number), mappingproxy(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
@@ -573,7 +581,8 @@ def _initialize_number_data(short_scale):
 
     string_num_scale = invert_dict(_SHORT_SCALE_PL)
     string_num_scale.update(generate_plurals_pl(string_num_scale))
-    return multiplies, _STRING_SHORT_ORDINAL_PL, string_num_scale
+    return frozenset(multiplies), MappingProxyType(_STRING_SHORT_ORDINAL_PL), \
+        MappingProxyType(string_num_scale)
 
 
 def extract_number_pl(text, short_scale=True, ordinals=False):
@@ -596,6 +605,29 @@ def extract_number_pl(text, short_scale=True, ordinals=False):
                                         True, ordinals).value
 
 
+def extract_number_spans_pl(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_number_pl, also returning where the number was found.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    Returns:
+        [Span]: the extracted number and its character offsets in `text`,
+                or an empty list if no number was found
+    """
+    tokens, offsets = tokenize_with_offsets(text, lowercase=True)
+    number = _extract_number_with_text_pl(tokens, True, ordinals)
+    if not number:
+        return []
+    return number_spans([number], offsets)
+
+
+_DURATION_REGEXES_PL = compile_duration_regexes(_TIME_UNITS_CONVERSION,
+                                                suffix="[ayeę]?")
+
+
 def extract_duration_pl(text):
     """
     Convert an english phrase into a number of seconds
@@ -625,27 +657,9 @@ def extract_duration_pl(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': None,
-        'milliseconds': None,
-        'seconds': None,
-        'minutes': None,
-        'hours': None,
-        'days': None,
-        'weeks': None
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
     text = _convert_words_to_numbers_pl(text)
-
-    for unit in _TIME_UNITS_CONVERSION:
-        unit_pattern = pattern.format(unit=unit)
-        matches = re.findall(unit_pattern, text)
-        value = sum(map(float, matches))
-        unit_en = _TIME_UNITS_CONVERSION.get(unit)
-        if time_units[unit_en] is None or time_units.get(unit_en) == 0:
-            time_units[unit_en] = value
-        text = re.sub(unit_pattern, '', text)
+    time_units, text = consume_durations(text, _DURATION_REGEXES_PL,
+                                         _TIME_UNITS_CONVERSION)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1351,6 +1365,23 @@ def extract_numbers_pl(text, short_scale=True, ordinals=False):
     return [float(result.value) for result in results]
 
 
+def extract_numbers_spans_pl(text, short_scale=True, ordinals=False):
+    """
+    Same as extract_numbers_pl, also returning where each number was found.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        [Span]: the numbers, as floats, with their character offsets in `text`
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    results = _extract_numbers_with_text_pl(tokens, short_scale, ordinals)
+    return [span._replace(value=float(span.value))
+            for span in number_spans(results, offsets)]
+
+
 def normalize_word_pl(word):
     if word.startswith('jedn'):
         suffix = 'ą', 'ej', 'ym'
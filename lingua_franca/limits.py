@@ -0,0 +1,125 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Bounds on the latency of the parsers.
+
+Some parsers take time quadratic in the length of their input: a long
+transcript, or a long run of number words, can keep extract_numbers or
+extract_datetime busy for seconds. Within budget(), or with
+config.max_input_chars and config.parse_time_budget, long texts are cut
+and the parsers stop early, returning what they have found so far.
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+_BUDGET = threading.local()
+
+
+class Budget:
+    """
+    Limits on the work of each parser call, see budget().
+
+    Attributes:
+        max_chars (int): texts longer than this are cut, at a word boundary
+        seconds (float): time allowed to each call
+        truncated (bool): a text was cut
+        timed_out (bool): a call ran out of time, and returned what it had
+                          found until then
+    """
+
+    def __init__(self, max_chars=None, seconds=None):
+        self.max_chars = max_chars
+        self.seconds = seconds
+        self.truncated = False
+        self.timed_out = False
+        self._deadline = None
+        self._depth = 0
+
+    @property
+    def partial(self):
+        """ True if a result may be missing something found in the text """
+        return self.truncated or self.timed_out
+
+    def limit_text(self, text):
+        """ The text, cut after max_chars characters if longer """
+        if not self.max_chars or len(text) <= self.max_chars:
+            return text
+        self.truncated = True
+        cut = text[:self.max_chars]
+        if not text[self.max_chars].isspace():
+            # drop the word which was cut
+            words = cut.rsplit(None, 1)
+            if len(words) == 2:
+                cut = words[0]
+        return cut.rstrip()
+
+    def start_call(self):
+        # calls made by a parser share the time of the outermost one
+        self._depth += 1
+        if self._depth == 1 and self.seconds is not None:
+            self._deadline = perf_counter() + self.seconds
+
+    def end_call(self):
+        self._depth -= 1
+        if not self._depth:
+            self._deadline = None
+
+
+def current_budget():
+    """ The Budget of the enclosing budget() block, None outside of one """
+    return getattr(_BUDGET, "budget", None)
+
+
+@contextmanager
+def budget(max_chars=None, seconds=None):
+    """
+    Bound the latency of the parsers called within this context.
+
+    Long texts are cut to max_chars, and a parser running for more than
+    seconds returns what it has found so far. Only the loops which can
+    take long on long inputs check the time, so a call may overrun a
+    little. The returned Budget tells whether any result is partial:
+
+        >>> with lingua_franca.budget(max_chars=500, seconds=0.05) as b:
+        ...     numbers = extract_numbers(transcript)
+        >>> b.partial
+        True
+
+    Args:
+        max_chars (int, optional): maximum length of the texts
+        seconds (float, optional): time allowed to each call
+    """
+    previous = current_budget()
+    _BUDGET.budget = Budget(max_chars, seconds)
+    try:
+        yield _BUDGET.budget
+    finally:
+        _BUDGET.budget = previous
+
+
+def out_of_time():
+    """
+    True once the parser call running in this thread has used the time of
+    its budget(). Loops whose work grows with the input check it, and stop
+    with what they have found.
+    """
+    limits = getattr(_BUDGET, "budget", None)
+    if limits is None or limits._deadline is None or \
+            perf_counter() < limits._deadline:
+        return False
+    limits.timed_out = True
+    return True
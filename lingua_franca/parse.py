@@ -14,17 +14,30 @@
 # limitations under the License.
 #
 
+import re
+from datetime import datetime
 from difflib import SequenceMatcher
+from functools import partial
+from itertools import chain
 from warnings import warn
+from lingua_franca import config
 from lingua_franca.time import now_local
+from lingua_franca.lang.parse_common import Span
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, get_full_lang_code, get_primary_lang_code, \
-    get_default_lang, localized_function, _raise_unsupported_language
+    get_default_lang, localized_function, _raise_unsupported_language, \
+    get_localized_function, get_localized_caller, \
+    FunctionNotLocalizedError
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
                          "extract_duration",
                          "extract_datetime",
+                         "extract_numbers_spans",
+                         "extract_number_spans",
+                         "extract_duration_spans",
+                         "extract_datetime_spans",
+                         "extract_datetime_plan",
                          "normalize",
                          "get_gender",
                          "is_fractional",
@@ -197,6 +210,376 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+@localized_function()
+def extract_numbers_spans(text, short_scale=True, ordinals=False, lang=''):
+    """
+        Same as extract_numbers(), but also returns where each number was
+        found, so that callers don't need to search the text again.
+
+        >>> extract_numbers_spans("two dogs and 3 cats")
+        [Span(value=2.0, start=0, end=3), Span(value=3.0, start=13, end=14)]
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        list(Span): (value, start, end) for each number, where `start` and
+                    `end` are character offsets into `text`
+    """
+
+
+@localized_function()
+def extract_number_spans(text, short_scale=True, ordinals=False, lang=''):
+    """Same as extract_number(), but also returns where the number was found.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        list(Span): a list containing the (value, start, end) of the number
+                    extract_number() would return, or an empty list if the
+                    text contains no numbers
+    """
+
+
+@localized_function()
+def extract_duration_spans(text, lang=''):
+    """ Same as extract_duration(), but also returns where each part of the
+    duration was found.
+
+        >>> extract_duration_spans("set a timer for 5 minutes")
+        (datetime.timedelta(seconds=300), 'set a timer for',
+         [Span(value=datetime.timedelta(seconds=300), start=16, end=25)])
+
+    Args:
+        text (str): string containing a duration
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        (timedelta, str, list(Span)):
+                    The duration and remaining text, as returned by
+                    extract_duration(), and a Span for each expression
+                    which was consumed. The value of each Span is the
+                    timedelta that expression represents.
+    """
+
+
+@localized_function()
+def extract_datetime_spans(text, anchorDate=None, lang='', default_time=None):
+    """
+    Same as extract_datetime(), but also returns where the date and time
+    were found.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+
+    Returns:
+        [:obj:`datetime`, :obj:`str`, list(Span)]: the datetime and
+            leftover string, as returned by extract_datetime(), and a Span
+            for each run of words that was consumed. The value of each
+            Span is the extracted datetime.
+
+            Returns 'None' if no date or time related text is found.
+    """
+
+
+@localized_function()
+def extract_datetime_plan(text, lang=''):
+    """
+    Parse a date or time reference once, to resolve it against many
+    anchor dates.
+
+    The plan only keeps what doesn't depend on the anchor date, so that
+    plan.resolve(anchorDate, default_time) returns the same as
+    extract_datetime(text, anchorDate, lang=lang,
+    default_time=default_time), at a fraction of the cost.
+
+        >>> plan = extract_datetime_plan("every tuesday at 4pm")
+        >>> plan.resolve(datetime(2017, 6, 27, 13, 4))
+        [datetime.datetime(2017, 6, 27, 16, 0), 'every']
+        >>> plan.resolve(datetime(2017, 6, 28, 13, 4))
+        [datetime.datetime(2017, 7, 4, 16, 0), 'every']
+
+    Args:
+        text (str): the text to be interpreted
+        lang (str): the BCP-47 code for the language to use, None uses default
+
+    Returns:
+        DatetimePlan
+    """
+
+
+def extract_datetimes(texts, anchorDate=None, lang='', default_time=None,
+                      workers=None, chunksize=1000):
+    """
+    Run extract_datetime() on many texts, against the same anchor date.
+
+    The localized function is looked up once for the whole batch rather
+    than on every call; each text is still parsed under the result cache,
+    parsing limits and instrumentation hooks of extract_datetime(). With
+    `workers`, batches of more than `chunksize` texts are split into
+    chunks and spread over a pool of processes, each of which loads the
+    language once.
+
+        >>> extract_datetimes(["tomorrow at noon", "no date"],
+        ...                   datetime(2017, 6, 27, 13, 4))
+        [[datetime.datetime(2017, 6, 28, 12, 0), ''], None]
+
+    Args:
+        texts (list(str)): the texts to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating. Defaults to the current local date/time,
+            taken once for the whole batch.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+        workers (int, optional): number of processes to use, by default
+            everything is done in this process
+        chunksize (int): number of texts sent to a process at a time
+
+    Returns:
+        list: the result of extract_datetime() for each text, in order
+    """
+    from lingua_franca.batch import language_loaded, worker_pool
+    texts = list(texts)
+    anchorDate = anchorDate or datetime.now()
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    with language_loaded(lang_code, config.load_langs_on_demand), \
+            worker_pool(workers if len(texts) > chunksize else None,
+                        lang_code, _warm_up, (lang_code,)) as pool:
+        if pool is not None:
+            chunks = [texts[i:i + chunksize]
+                      for i in range(0, len(texts), chunksize)]
+            extract_chunk = partial(_extract_datetimes_chunk,
+                                    anchorDate=anchorDate, lang=lang_code,
+                                    default_time=default_time)
+            return [result for chunk in pool.imap(extract_chunk, chunks)
+                    for result in chunk]
+        return _extract_datetimes_chunk(texts, anchorDate, lang_code,
+                                        default_time)
+
+
+def _extract_datetimes_chunk(texts, anchorDate, lang, default_time):
+    extract = get_localized_caller("parse", "extract_datetime", lang)
+    return [extract(text, anchorDate, default_time) for text in texts]
+
+
+def _warm_up(lang):
+    # fills the lexicon caches before the first chunk
+    _extract_datetimes_chunk(["tomorrow"], datetime.now(), lang, None)
+
+
+# the end of a sentence: punctuation followed by a space, or a new line
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+
+def _read_chunks(stream, chunk_size):
+    if isinstance(stream, str):
+        yield stream
+    elif hasattr(stream, "read"):
+        chunk = stream.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = stream.read(chunk_size)
+    else:
+        for chunk in stream:
+            yield chunk
+
+
+def _iter_sentences(stream, chunk_size, max_sentence):
+    # (offset, sentence) for each sentence of the stream, holding at most
+    # max_sentence characters and a chunk in memory
+    buffer, offset = "", 0
+    for chunk in chain(_read_chunks(stream, chunk_size), [None]):
+        if chunk is None:
+            # the end of the stream ends the last sentence
+            if buffer.strip():
+                yield offset, buffer
+            return
+        buffer += chunk
+        start = 0
+        while True:
+            match = _SENTENCE_END.search(buffer, start)
+            end = match.end() if match else len(buffer) + 1
+            if end - start > max_sentence:
+                if len(buffer) - start <= max_sentence:
+                    break
+                # too long for a sentence, cut it after a space
+                space = buffer.rfind(" ", start + 1, start + max_sentence)
+                end = space + 1 if space > 0 else start + max_sentence
+            elif not match:
+                break
+            if buffer[start:end].strip():
+                yield offset + start, buffer[start:end]
+            start = end
+        buffer = buffer[start:]
+        offset += start
+
+
+def _stripped_bounds(offset, sentence):
+    # the offsets of the sentence, without its surrounding spaces
+    start = offset + len(sentence) - len(sentence.lstrip())
+    return start, offset + len(sentence.rstrip())
+
+
+def _iter_localized(lang, spans_name, name, handle_sentence, stream,
+                    chunk_size, max_sentence):
+    from lingua_franca.batch import language_loaded
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    with language_loaded(lang_code, config.load_langs_on_demand):
+        try:
+            get_localized_function("parse", spans_name, lang_code)
+            with_spans = True
+        except FunctionNotLocalizedError:
+            # fails here, rather than on the first sentence, if the
+            # language has neither
+            get_localized_function("parse", name, lang_code)
+            with_spans = False
+        for offset, sentence in _iter_sentences(stream, chunk_size,
+                                                max_sentence):
+            for span in handle_sentence(offset, sentence, lang_code,
+                                        with_spans):
+                yield span
+
+
+def iter_numbers(stream, short_scale=True, ordinals=False, lang='',
+                 chunk_size=65536, max_sentence=10000):
+    """
+    Extract the numbers of a text too large to be held in memory.
+
+    The text is read chunk by chunk and cut into sentences, which are
+    passed to extract_numbers_spans() one at a time, so that the memory
+    used is bounded by `chunk_size` and `max_sentence`, and the time is
+    linear in the length of the text. A number pronounced across two
+    chunks is found as if the text was read at once.
+
+        >>> transcript = io.StringIO("We met at the station. Twenty two "
+        ...                          "people came!\nThe next train leaves "
+        ...                          "in five minutes.")
+        >>> for span in iter_numbers(transcript, lang='en'):
+        ...     print(span)
+        Span(value=22.0, start=23, end=33)
+        Span(value=5.0, start=72, end=76)
+
+    A sentence ends with '.', '!' or '?' followed by a space, or at a new
+    line. A sentence longer than `max_sentence` characters is cut after a
+    space, which can split a number pronounced at the cut.
+
+    In a language without extract_numbers_spans(), the numbers are those
+    of extract_numbers(), and `start` and `end` delimit the sentence they
+    were found in.
+
+    Args:
+        stream (file, iterable(str) or str): a text file, or the chunks of
+            the text
+        short_scale (bool): use "short scale" or "long scale" for large
+            numbers, see extract_numbers()
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of
+            1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        chunk_size (int): the number of characters read from a file at a
+            time
+        max_sentence (int): the maximum number of characters of a sentence
+    Returns:
+        iterator(Span): the value of each number, with `start` and `end`
+                        character offsets into the whole text
+    """
+    def handle_sentence(offset, sentence, lang_code, with_spans):
+        if with_spans:
+            for span in extract_numbers_spans(sentence, short_scale,
+                                              ordinals, lang=lang_code):
+                yield Span(span.value, offset + span.start,
+                           offset + span.end)
+            return
+        start, end = _stripped_bounds(offset, sentence)
+        for value in extract_numbers(sentence, short_scale, ordinals,
+                                     lang=lang_code):
+            yield Span(value, start, end)
+
+    return _iter_localized(lang, "extract_numbers_spans", "extract_numbers",
+                           handle_sentence, stream, chunk_size,
+                           max_sentence)
+
+
+def iter_datetimes(stream, anchorDate=None, lang='', default_time=None,
+                   chunk_size=65536, max_sentence=10000):
+    """
+    Extract the dates and times of a text too large to be held in memory.
+
+    The text is read and cut into sentences as by iter_numbers(), and
+    extract_datetime_spans() is run on each sentence, against the same
+    anchor date. A sentence yields at most one datetime.
+
+        >>> with open("minutes.txt") as minutes:
+        ...     for span in iter_datetimes(minutes,
+        ...                                datetime(2017, 6, 27, 13, 4)):
+        ...         print(span)
+        Span(value=datetime.datetime(2017, 6, 28, 12, 0), start=1042,
+             end=1058)
+
+    In a language without extract_datetime_spans(), the datetimes are
+    those of extract_datetime(), and `start` and `end` delimit the
+    sentence they were found in.
+
+    Args:
+        stream (file, iterable(str) or str): a text file, or the chunks of
+            the text
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating. Defaults to the current local date/time,
+            taken once for the whole text.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            a sentence.
+        chunk_size (int): the number of characters read from a file at a
+            time
+        max_sentence (int): the maximum number of characters of a sentence
+    Returns:
+        iterator(Span): the datetime of each sentence which has one, with
+                        `start` and `end` character offsets into the whole
+                        text, from the first to the last word consumed
+    """
+    anchorDate = anchorDate or datetime.now()
+
+    def handle_sentence(offset, sentence, lang_code, with_spans):
+        start, end = _stripped_bounds(offset, sentence)
+        if with_spans:
+            result = extract_datetime_spans(sentence, anchorDate,
+                                            lang=lang_code,
+                                            default_time=default_time)
+            if result and result[2]:
+                start = offset + result[2][0].start
+                end = offset + result[2][-1].end
+        else:
+            result = extract_datetime(sentence, anchorDate, lang=lang_code,
+                                      default_time=default_time)
+        if result:
+            yield Span(result[0], start, end)
+
+    return _iter_localized(lang, "extract_datetime_spans",
+                           "extract_datetime", handle_sentence, stream,
+                           chunk_size, max_sentence)
+
+
 @localized_function()
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
@@ -0,0 +1,96 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Preparing a process which forks workers, such as a pre-fork web server.
+
+Much of what a language needs is built the first time it is used: number
+lexicons, normalizer configurations, date and time formats, compiled
+regexes. Built in each worker, they take memory in each worker.
+preload_for_fork() builds them once in the parent, then moves every
+object into the garbage collector's permanent generation: collections in
+the workers no longer write to these objects, so their memory pages stay
+shared with the parent.
+
+    >>> lingua_franca.preload_for_fork(['en', 'de'])
+    >>> # then fork the workers, e.g. gunicorn with preload_app = True
+"""
+import gc
+from datetime import datetime
+
+from lingua_franca import format, parse
+from lingua_franca.internal import get_active_langs, load_languages
+
+# inputs for the format functions, the parse functions get the numbers
+# and durations pronounced in the language
+_SAMPLE_NUMBERS = (22, 1.5, 1000000)
+_SAMPLE_DATETIME = datetime(2017, 6, 27, 13, 4)
+_SAMPLE_DURATION = 5400
+
+
+def _try(func, *args, **kwargs):
+    # not every function is localized in every language
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        return None
+
+
+def _warm_up(lang):
+    texts = [_try(format.pronounce_number, number, lang=lang)
+             for number in _SAMPLE_NUMBERS]
+    texts += [_try(format.nice_duration, _SAMPLE_DURATION, lang=lang),
+              _try(format.nice_time, _SAMPLE_DATETIME, lang=lang)]
+    for number in _SAMPLE_NUMBERS:
+        _try(format.nice_number, number, lang=lang)
+    # the date and time formats of the language
+    _try(format.nice_date_time, _SAMPLE_DATETIME, lang=lang,
+         now=_SAMPLE_DATETIME)
+    _try(format.nice_year, _SAMPLE_DATETIME, lang=lang)
+
+    text = " ".join(text for text in texts if text)
+    word = text.split()[0] if text else ""
+    for name in parse._REGISTERED_FUNCTIONS:
+        func = getattr(parse, name)
+        if name in ("get_gender", "is_fractional", "is_ordinal"):
+            _try(func, word, lang=lang)
+        elif name.startswith("extract_datetime"):
+            _try(func, text, _SAMPLE_DATETIME, lang=lang)
+        else:
+            _try(func, text, lang=lang)
+
+
+def preload_for_fork(langs=None, freeze=True):
+    """ Load languages and build their tables before forking workers
+
+    Call it in the parent process, right before forking. The languages are
+    loaded, and each of their parse and format functions is called once,
+    so that the workers find everything built.
+
+    Args:
+        langs (list(str), optional): the languages the workers will use, by
+                                     default the languages already loaded
+        freeze (bool, optional): move every object into the permanent
+                                 generation of the garbage collector (from
+                                 Python 3.7; gc.unfreeze() undoes it)
+    """
+    langs = list(langs) if langs else get_active_langs()
+    load_languages(langs)
+    for lang in langs:
+        _warm_up(lang)
+    # collect the garbage of the warm up before freezing what is left
+    gc.collect()
+    if freeze and hasattr(gc, "freeze"):
+        gc.freeze()
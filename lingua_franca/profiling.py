@@ -0,0 +1,295 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+A profiler for Lingua Franca's own code.
+
+Only the functions of the lingua_franca package are recorded; the time
+spent in other code (the standard library, dateutil...) is attributed to
+the Lingua Franca function which called it. Calls are recorded with their
+stack, from the public function down to the internal helpers:
+
+    >>> with lingua_franca.profile() as p:
+    ...     parse.extract_datetime("in two hours", lang='en')
+    >>> print(p.report())         # time per function
+    >>> print(p.tree())           # time per call path
+    >>> print(p.collapsed())      # input for flamegraph.pl or speedscope
+
+Threads are profiled too: those started during the profile and, from
+Python 3.12, those already running.
+"""
+import os
+import sys
+import threading
+from time import perf_counter
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_PROFILER_FILE = os.path.abspath(__file__)
+_INTERNAL_FILE = os.path.join(_PACKAGE_DIR, 'internal.py')
+_NOT_RECORDED = None
+# The localized_function wrapper is recorded under the name of the
+# function it wraps, "parse.extract_number"; the rest of the dispatcher
+# counts as its own time.
+_WRAPPER = 'call_localized_function'
+_DISPATCHER = frozenset(('_dispatch', '_dispatch_instrumented',
+                         '_call_localized_function', '_call_localized',
+                         '_call_cached', 'call_localized'))
+
+
+def _wrapped_name(frame):
+    dispatch = frame.f_locals.get('_dispatch')
+    try:
+        cell = dispatch.__closure__[
+            dispatch.__code__.co_freevars.index('func')]
+        func = cell.cell_contents
+    except (AttributeError, ValueError):
+        return 'internal.' + _WRAPPER
+    return _module_name(func.__module__) + '.' + func.__name__
+
+
+def _module_name(module):
+    if module.startswith('lingua_franca.'):
+        return module[len('lingua_franca.'):]
+    return module
+
+
+class Profile:
+    """
+    Call stacks of lingua_franca functions, with the time spent in each.
+
+    Use it through lingua_franca.profile(), or call start() and stop().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # one (stacks, functions) pair per thread, merged in the reports
+        self._threads = []
+        self._names = {}
+        self._running = False
+        self._previous = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """ Start recording calls """
+        self._running = True
+        self._previous = sys.getprofile()
+        if hasattr(threading, 'setprofile_all_threads'):
+            threading.setprofile_all_threads(self._callback)
+        else:
+            threading.setprofile(self._callback)
+        sys.setprofile(self._callback)
+
+    def stop(self):
+        """ Stop recording calls, restoring any previous profiler """
+        self._running = False
+        previous, self._previous = self._previous, None
+        if hasattr(threading, 'setprofile_all_threads'):
+            threading.setprofile_all_threads(previous)
+        else:
+            threading.setprofile(previous)
+        sys.setprofile(previous)
+
+    def _name(self, code, frame):
+        name = self._names.get(code, False)
+        if name is False:
+            filename = os.path.abspath(code.co_filename)
+            if not filename.startswith(_PACKAGE_DIR) or \
+                    filename == _PROFILER_FILE:
+                name = _NOT_RECORDED
+            elif filename == _INTERNAL_FILE and code.co_name == _WRAPPER:
+                name = _WRAPPER
+            elif filename == _INTERNAL_FILE and code.co_name in _DISPATCHER:
+                name = _NOT_RECORDED
+            else:
+                # co_qualname tells methods apart, from Python 3.11
+                qualname = getattr(code, 'co_qualname', code.co_name)
+                name = _module_name(frame.f_globals.get('__name__', '')) + \
+                    '.' + qualname.replace('<locals>.', '')
+            self._names[code] = name
+        if name is _WRAPPER:
+            return _wrapped_name(frame)
+        return name
+
+    def _thread_state(self):
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            # call stack, stacks -> [calls, own time],
+            # function -> [calls, own time, cumulative time]
+            state = self._local.state = ([], {}, {})
+            with self._lock:
+                self._threads.append(state)
+        return state
+
+    def _callback(self, frame, event, arg):
+        if event == 'call':
+            name = self._name(frame.f_code, frame)
+            if name is _NOT_RECORDED or not self._running:
+                return
+            call_stack = self._thread_state()[0]
+            # frame, name, start, time spent in recorded callees
+            call_stack.append([frame, name, perf_counter(), 0.0])
+        elif event == 'return':
+            state = getattr(self._local, 'state', None)
+            if not state or not state[0] or state[0][-1][0] is not frame:
+                return
+            call_stack, stacks, functions = state
+            now = perf_counter()
+            _, name, start, callees = call_stack[-1]
+            elapsed = now - start
+            key = tuple(entry[1] for entry in call_stack)
+            call_stack.pop()
+            if call_stack:
+                call_stack[-1][3] += elapsed
+            own = elapsed - callees
+            stack_record = stacks.get(key)
+            if stack_record is None:
+                stacks[key] = [1, own]
+            else:
+                stack_record[0] += 1
+                stack_record[1] += own
+            record = functions.get(name)
+            if record is None:
+                record = functions[name] = [0, 0.0, 0.0]
+            record[0] += 1
+            record[1] += own
+            # recursive calls are counted once in the cumulative time
+            if name not in key[:-1]:
+                record[2] += elapsed
+
+    def _merged(self):
+        stacks = {}
+        functions = {}
+        with self._lock:
+            threads = list(self._threads)
+        for thread_stacks, thread_functions in \
+                ((state[1], state[2]) for state in threads):
+            for key, (calls, own) in list(thread_stacks.items()):
+                record = stacks.setdefault(key, [0, 0.0])
+                record[0] += calls
+                record[1] += own
+            for name, (calls, own, cumulative) in \
+                    list(thread_functions.items()):
+                record = functions.setdefault(name, [0, 0.0, 0.0])
+                record[0] += calls
+                record[1] += own
+                record[2] += cumulative
+        return stacks, functions
+
+    def functions(self):
+        """ Time spent per function, in seconds
+
+        Returns:
+            (dict): function name -> (calls, own time, cumulative time)
+        """
+        return {name: tuple(record)
+                for name, record in self._merged()[1].items()}
+
+    def stacks(self):
+        """ Time spent per call stack, in seconds
+
+        Returns:
+            (dict): tuple of function names, outermost first ->
+                    (calls, own time)
+        """
+        return {key: tuple(record)
+                for key, record in self._merged()[0].items()}
+
+    def report(self, limit=30):
+        """ Time spent per function, the most expensive ones first
+
+        Args:
+            limit (int, optional): the number of functions to list
+        Returns:
+            (str): a table of calls, own and cumulative times in ms
+        """
+        functions = sorted(self.functions().items(),
+                           key=lambda item: item[1][1], reverse=True)
+        lines = ["{:>9} {:>10} {:>10}  {}".format("calls", "own (ms)",
+                                                  "cum (ms)", "function")]
+        for name, (calls, own, cumulative) in functions[:limit]:
+            lines.append("{:>9} {:>10.2f} {:>10.2f}  {}".format(
+                calls, own * 1000, cumulative * 1000, name))
+        return "\n".join(lines)
+
+    def tree(self, min_fraction=0.01):
+        """ Time spent per call path, from the public functions down
+
+        Args:
+            min_fraction (float, optional): leave out the paths taking less
+                                            than this part of the total
+        Returns:
+            (str): an indented tree of cumulative times in ms
+        """
+        stacks = self.stacks()
+        inclusive = {}
+        for key, (calls, own) in stacks.items():
+            for depth in range(1, len(key) + 1):
+                inclusive[key[:depth]] = \
+                    inclusive.get(key[:depth], 0.0) + own
+        total = sum(time for key, time in inclusive.items()
+                    if len(key) == 1) or 1.0
+        calls = {key: record[0] for key, record in stacks.items()}
+        lines = []
+
+        def add(prefix):
+            children = sorted((key for key in inclusive
+                               if len(key) == len(prefix) + 1 and
+                               key[:-1] == prefix),
+                              key=lambda key: inclusive[key], reverse=True)
+            for key in children:
+                if inclusive[key] / total < min_fraction:
+                    continue
+                lines.append("{:>10.2f} {:>6}  {}{}".format(
+                    inclusive[key] * 1000, calls.get(key, 0),
+                    "  " * (len(key) - 1), key[-1]))
+                add(key)
+
+        add(())
+        return "\n".join(["{:>10} {:>6}  {}".format("cum (ms)", "calls",
+                                                     "function")] + lines)
+
+    def collapsed(self):
+        """ Own time per call stack in the "collapsed stack" format
+
+        Each line is a stack, outermost function first, separated by ';',
+        then a space and the own time in microseconds, as read by
+        flamegraph.pl and speedscope.
+
+        Returns:
+            (str)
+        """
+        return "\n".join("{} {}".format(";".join(key), int(own * 1e6))
+                         for key, (calls, own) in sorted(
+                             self.stacks().items()))
+
+
+def profile():
+    """ Profile Lingua Franca's functions in a with block
+
+        >>> with lingua_franca.profile() as p:
+        ...     parse.extract_number("twenty two", lang='en')
+        >>> print(p.report())
+
+    Returns:
+        (Profile): started on entering the block, stopped when leaving it
+    """
+    return Profile()
@@ -0,0 +1,257 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Run parse functions over every utterance of a file, in a pool of processes.
+
+    python -m lingua_franca scan corpus.jsonl --lang en \\
+        --functions normalize,extract_numbers --output results.jsonl
+
+The input is either plain text, one utterance per line, or JSON Lines,
+each line an object with the utterance in its `--field` ("utterance" by
+default). Each line gives a line of output: for plain text, an object with
+the `offset` of the line in the file, in bytes, and its `text`; for JSON
+Lines, the input object. The result of each function is added under its
+name, and the errors it raised under `errors`. Datetimes are written in ISO
+format, durations in seconds.
+
+The file is memory-mapped: the parent process only splits it into ranges
+of about `chunk_bytes`, at line ends, and each worker reads its ranges
+from the mapping itself.
+"""
+import json
+import mmap
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import partial
+
+from lingua_franca import parse
+from lingua_franca.batch import language_loaded, worker_pool
+from lingua_franca.internal import get_default_lang, get_primary_lang_code
+
+# the functions which can be run, all take the utterance as first argument
+SCAN_FUNCTIONS = ("normalize", "extract_number", "extract_numbers",
+                  "extract_duration", "extract_datetime")
+DEFAULT_FUNCTIONS = ("normalize", "extract_numbers")
+_ANCHOR_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d")
+
+# what the workers need to know, besides their range of the file
+_Settings = namedtuple("_Settings", "path input_format field functions "
+                                    "lang kwargs")
+
+
+def _json_default(value):
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (date, datetime, dt_time)):
+        return value.isoformat()
+    raise TypeError("{} is not JSON serializable".format(
+        type(value).__name__))
+
+
+def _input_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    return "jsonl" if extension in (".jsonl", ".ndjson") else "text"
+
+
+def _ranges(mapping, chunk_bytes):
+    # (start, end) ranges of whole lines, of at least chunk_bytes
+    start, size = 0, len(mapping)
+    while start < size:
+        end = mapping.find(b"\n", min(start + chunk_bytes, size) - 1)
+        end = size if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+def _run_functions(record, text, settings):
+    for name in settings.functions:
+        try:
+            record[name] = getattr(parse, name)(
+                text, lang=settings.lang, **settings.kwargs.get(name, {}))
+        except Exception as e:
+            record.setdefault("errors", {})[name] = "{}: {}".format(
+                type(e).__name__, e)
+
+
+def _scan_line(line, offset, settings):
+    field = settings.field
+    text = line.decode("utf8", errors="replace")
+    if settings.input_format == "text":
+        record = {"offset": offset, "text": text}
+        _run_functions(record, text, settings)
+        return record
+    try:
+        record = json.loads(text)
+    except ValueError as e:
+        return {"offset": offset, "errors": {"input": str(e)}}
+    if isinstance(record, str):
+        record = {field: record}
+    if not isinstance(record, dict) or \
+            not isinstance(record.get(field), str):
+        return {"offset": offset, "errors": {
+            "input": "no {!r} string in the line".format(field)}}
+    _run_functions(record, record[field], settings)
+    return record
+
+
+def _scan_range(settings, byte_range):
+    # runs in the workers: the output lines of a range of the file
+    start, end = byte_range
+    with open(settings.path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        data = mapping[start:end]
+    lines = []
+    offset = start
+    for line in data.split(b"\n"):
+        stripped = line.rstrip(b"\r")
+        if stripped.strip():
+            lines.append(json.dumps(_scan_line(stripped, offset, settings),
+                                    default=_json_default,
+                                    ensure_ascii=False))
+        offset += len(line) + 1
+    return lines
+
+
+def _warm_up(settings):
+    # the first call of each function fills the lexicon caches
+    _run_functions({}, "twenty two minutes past noon", settings)
+
+
+def scan(path, output, functions=DEFAULT_FUNCTIONS, lang='',
+         input_format=None, field="utterance", workers=None,
+         chunk_bytes=1 << 20, anchorDate=None):
+    """ Run parse functions over every utterance of a file
+
+    Args:
+        path (str): the file to read
+        output (file): a text file the JSON Lines results are written to
+        functions (list(str)): the functions to run, from SCAN_FUNCTIONS
+        lang (str, optional): the BCP-47 code for the language to use,
+                              None uses default
+        input_format (str, optional): "text" or "jsonl", by default
+                                      "jsonl" for .jsonl and .ndjson files
+        field (str): the key of the utterance in JSON Lines objects
+        workers (int, optional): number of processes, by default one per
+                                 CPU. With 1 or less, everything is done in
+                                 this process.
+        chunk_bytes (int): the size of the ranges sent to a process
+        anchorDate (datetime, optional): the anchor of extract_datetime,
+                                         by default the time of the call
+    Returns:
+        (dict): the number of `utterances` and `bytes` read, and the
+                `seconds` it took
+    Raises:
+        ValueError: if a function isn't one of SCAN_FUNCTIONS
+    """
+    functions = list(functions)
+    for name in functions:
+        if name not in SCAN_FUNCTIONS:
+            raise ValueError("{} can't be scanned, use one of {}".format(
+                name, ", ".join(SCAN_FUNCTIONS)))
+    lang_code = get_primary_lang_code(lang) if lang else get_default_lang()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    kwargs = {"extract_datetime": {
+        "anchorDate": anchorDate or datetime.now()}}
+    settings = _Settings(os.path.abspath(path),
+                         input_format or _input_format(path), field,
+                         functions, lang_code, kwargs)
+
+    start_time = time.perf_counter()
+    stats = {"utterances": 0, "bytes": os.path.getsize(path)}
+    if not stats["bytes"]:
+        ranges = []
+    else:
+        with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            ranges = list(_ranges(mapping, max(1, chunk_bytes)))
+    scan_range = partial(_scan_range, settings)
+    with language_loaded(lang_code), \
+            worker_pool(min(workers, len(ranges)), lang_code, _warm_up,
+                        (settings,)) as pool:
+        if pool is not None:
+            results = pool.imap(scan_range, ranges)
+        else:
+            results = (scan_range(byte_range) for byte_range in ranges)
+        for lines in results:
+            for line in lines:
+                output.write(line + "\n")
+            stats["utterances"] += len(lines)
+    stats["seconds"] = time.perf_counter() - start_time
+    return stats
+
+
+def add_arguments(parser):
+    """ Add the arguments of the scan command to an argparse parser """
+    parser.add_argument("path", help="a text file, one utterance per line, "
+                                     "or a JSON Lines file")
+    parser.add_argument("--lang", default="en",
+                        help="the language code (default en)")
+    parser.add_argument("--functions", default=",".join(DEFAULT_FUNCTIONS),
+                        help="comma separated functions, from " +
+                             ", ".join(SCAN_FUNCTIONS))
+    parser.add_argument("--format", choices=("text", "jsonl"),
+                        help="the input format, by default jsonl for "
+                             ".jsonl and .ndjson files, text otherwise")
+    parser.add_argument("--field", default="utterance",
+                        help="the key of the utterance in JSON Lines "
+                             "objects (default utterance)")
+    parser.add_argument("--workers", type=int,
+                        help="number of processes, default one per CPU")
+    parser.add_argument("--chunk-bytes", type=int, default=1 << 20,
+                        help="bytes of input sent to a process at a time")
+    parser.add_argument("--anchor", help="the anchor date of "
+                                         "extract_datetime, in ISO format, "
+                                         "default now")
+    parser.add_argument("--output", help="write the results to this file "
+                                         "instead of the standard output")
+
+
+def _parse_anchor(text):
+    for anchor_format in _ANCHOR_FORMATS:
+        try:
+            return datetime.strptime(text, anchor_format)
+        except ValueError:
+            pass
+    raise ValueError("{!r} isn't a date in ISO format".format(text))
+
+
+def main(args):
+    """ Run the scan command with parsed arguments """
+    functions = [name for name in args.functions.split(",") if name]
+    try:
+        anchor = _parse_anchor(args.anchor) if args.anchor else None
+    except ValueError as e:
+        raise SystemExit("error: {}".format(e))
+    output = open(args.output, "w", encoding="utf8") \
+        if args.output else sys.stdout
+    try:
+        stats = scan(args.path, output, functions, args.lang, args.format,
+                     args.field, args.workers, args.chunk_bytes, anchor)
+    except ValueError as e:
+        raise SystemExit("error: {}".format(e))
+    finally:
+        if args.output:
+            output.close()
+    seconds = max(stats["seconds"], 1e-9)
+    print("{} utterances, {:.1f} MB in {:.2f} s: {:.0f} utterances/s, "
+          "{:.2f} MB/s".format(stats["utterances"], stats["bytes"] / 1e6,
+                               seconds, stats["utterances"] / seconds,
+                               stats["bytes"] / 1e6 / seconds),
+          file=sys.stderr)
@@ -0,0 +1,321 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Serve the parse and format functions on a Unix socket, with languages loaded.
+
+A short-lived process calling lingua_franca pays for starting Python,
+importing the package and loading a language on every call. The server
+pays for them once:
+
+    python -m lingua_franca serve --socket /tmp/lingua_franca.sock \\
+        --langs en,de --workers 4
+
+The protocol is JSON Lines: a client sends a request per line, and the
+server answers each with a line, in order. A request names a function,
+as batch.map() does, and its arguments:
+
+    {"id": 1, "function": "extract_number", "args": ["twenty two"],
+     "kwargs": {"lang": "en"}}
+    {"id": 1, "result": 22}
+
+A failed call is answered with {"id": ..., "error": {"type": ...,
+"message": ...}}. Datetimes, dates, times and timedeltas are sent as
+{"datetime": "2017-06-27T13:04:00"}, {"date": ...}, {"time": ...} and
+{"timedelta": seconds}, in both directions. Client speaks the protocol
+from Python; from a shell, any tool which writes to a Unix socket will do:
+
+    echo '{"function": "nice_duration", "args": [90]}' | \\
+        socat - UNIX-CONNECT:/tmp/lingua_franca.sock
+
+Each connection is served by a thread. With --workers, the languages are
+loaded and warmed up by preload_for_fork(), then that many processes are
+forked, which accept connections on the same socket.
+"""
+import itertools
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+from datetime import date, datetime, time, timedelta
+
+from dateutil.parser import parse as parse_datetime
+
+from lingua_franca import config
+from lingua_franca.batch import _MODULES, _resolve_function
+from lingua_franca.preload import preload_for_fork
+
+
+class ServerError(Exception):
+    """ A call which raised an exception in the server
+
+    Attributes:
+        type (str): the name of the exception's class
+    """
+
+    def __init__(self, type_name, message):
+        super().__init__("{}: {}".format(type_name, message))
+        self.type = type_name
+
+
+def _encode(value):
+    # the JSON form of the values of the parse and format functions
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, time):
+        return {"time": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"timedelta": value.total_seconds()}
+    raise TypeError("{} is not JSON serializable".format(
+        type(value).__name__))
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        (key, item), = value.items()
+        if key == "datetime":
+            return parse_datetime(item)
+        if key == "date":
+            return parse_datetime(item).date()
+        if key == "time":
+            return parse_datetime(item).timetz()
+        if key == "timedelta":
+            return timedelta(seconds=item)
+    return {key: _decode(item) for key, item in value.items()}
+
+
+def _dumps(message):
+    return (json.dumps(message, default=_encode, ensure_ascii=False) +
+            "\n").encode("utf8")
+
+
+def handle_request(line):
+    """ Answer a request of the protocol
+
+    Args:
+        line (bytes): a JSON request
+    Returns:
+        (bytes): the JSON response, with its line end
+    """
+    request_id = None
+    try:
+        request = json.loads(line.decode("utf8"))
+        if not isinstance(request, dict):
+            raise ValueError("a request is a JSON object")
+        request_id = request.get("id")
+        module_name, name = _resolve_function(
+            str(request.get("function", "")))
+        args = _decode(request.get("args", []))
+        kwargs = _decode(request.get("kwargs", {}))
+        result = getattr(_MODULES[module_name], name)(*args, **kwargs)
+        return _dumps({"id": request_id, "result": result})
+    except Exception as e:
+        return _dumps({"id": request_id, "error": {
+            "type": type(e).__name__, "message": str(e)}})
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_request(line))
+                self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _remove_stale_socket(path):
+    # a socket left by a server which didn't exit cleanly
+    if not os.path.exists(path):
+        return
+    if not stat.S_ISSOCK(os.stat(path).st_mode):
+        raise FileExistsError("{} exists and isn't a socket".format(path))
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise FileExistsError("a server is already listening on {}".format(
+        path))
+
+
+def _serve_forked(server, workers):
+    # the workers accept on the same socket, a non-blocking one, so that
+    # a worker losing the race for a connection goes back to waiting
+    server.socket.setblocking(False)
+    children = []
+    try:
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+        while children:
+            pid, _ = os.wait()
+            if pid in children:
+                children.remove(pid)
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
+def serve(path, langs=None, workers=1, ready=None):
+    """ Serve the parse and format functions on a Unix socket
+
+    Blocks until interrupted, then removes the socket.
+
+    Args:
+        path (str): the path of the socket
+        langs (list(str), optional): the languages to load, by default the
+                                     languages already loaded
+        workers (int): the number of processes. With more than one, they
+                       are forked once the languages are loaded.
+        ready (callable, optional): called once the socket is listening
+                                    and the languages are loaded
+    Raises:
+        FileExistsError: if a server already listens on the path
+    """
+    _remove_stale_socket(path)
+    server = _Server(path, _Handler)
+    try:
+        preload_for_fork(langs, freeze=workers > 1)
+        if ready is not None:
+            ready()
+        if workers > 1:
+            _serve_forked(server, workers)
+        else:
+            server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+class Client:
+    """ A connection to a server started by serve()
+
+        >>> with Client("/tmp/lingua_franca.sock") as client:
+        ...     client.call("extract_number", "twenty two", lang="en")
+        22
+
+    A client sends one request at a time, use one per thread.
+
+    Args:
+        path (str): the path of the server's socket
+        timeout (float, optional): the timeout of each call, in seconds
+    """
+
+    def __init__(self, path, timeout=None):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(path)
+        except Exception:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile("rwb")
+        self._ids = itertools.count()
+
+    def call(self, function, *args, **kwargs):
+        """ Call a function in the server
+
+        Args:
+            function (str): a registered function, such as 'extract_number'
+                            or 'format.nice_duration'
+            *args, **kwargs: its arguments, including `lang`
+        Returns:
+            what the function returned
+        Raises:
+            ServerError: if the call raised an exception in the server
+            ConnectionError: if the server closed the connection
+        """
+        request_id = next(self._ids)
+        self._file.write(_dumps({"id": request_id, "function": function,
+                                 "args": args, "kwargs": kwargs}))
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("the server closed the connection")
+        response = json.loads(line.decode("utf8"))
+        if "error" in response:
+            raise ServerError(response["error"]["type"],
+                              response["error"]["message"])
+        return _decode(response["result"])
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def add_arguments(parser):
+    """ Add the arguments of the serve command to an argparse parser """
+    parser.add_argument("--socket", required=True,
+                        help="the path of the Unix socket")
+    parser.add_argument("--langs", default="en",
+                        help="comma separated language codes to load "
+                             "(default en)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of processes (default 1)")
+    parser.add_argument("--load-on-demand", action="store_true",
+                        help="load other languages when they are requested")
+
+
+def main(args):
+    """ Run the serve command with parsed arguments """
+    langs = [lang for lang in args.langs.split(",") if lang]
+    config.load_langs_on_demand = args.load_on_demand
+    # exit through the finally clauses, which remove the socket
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        serve(args.socket, langs, args.workers,
+              ready=lambda: print("serving on {}".format(args.socket),
+                                  file=sys.stderr, flush=True))
+    except FileExistsError as e:
+        raise SystemExit("error: {}".format(e))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,175 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from importlib import import_module
+
+from lingua_franca import parse
+from lingua_franca.internal import get_active_langs, get_default_lang, \
+    get_primary_lang_code
+from lingua_franca.lang.parse_common import Normalizer, sharing_results
+
+
+class ParseSession:
+    """
+    Parse results for a transcript which grows word by word, such as the
+    partial hypotheses of a streaming speech recognizer.
+
+    Running the extractors on each partial transcript parses its beginning
+    again and again. A session keeps the words, and the numbers found in
+    them, from one partial to the next: the numbers are found again only
+    when the words which changed can be part of a number.
+
+        >>> session = ParseSession(lang='en')
+        >>> session.update("remind me at")
+        >>> session.update("remind me at five thirty")
+        >>> session.extract_numbers()
+        [5.0, 30.0]
+        >>> session.append("tomorrow")
+        >>> session.extract_datetime(datetime(2017, 6, 27, 13, 4))
+        [datetime.datetime(2017, 6, 28, 5, 30), 'remind me']
+
+    The extractors see the transcript as its words joined by single
+    spaces, see `text`, and return what the functions of lingua_franca.parse
+    return for it. The rest of the work of extract_duration and
+    extract_datetime is done on the whole transcript, for a fraction of the
+    cost.
+
+    The numbers are kept in the languages providing
+    _incremental_numbers_xx (English), see parse_common.IncrementalNumbers.
+    In the other languages, a session simply runs the extractors on the
+    transcript.
+    """
+
+    def __init__(self, lang='', short_scale=True, ordinals=False):
+        """
+        Args:
+            lang (str, optional): an optional BCP-47 language code, if
+                                  omitted the default language will be used.
+            short_scale (bool): use short scale if True, long scale if False,
+                                for extract_numbers and extract_number
+            ordinals (bool): consider ordinal numbers, third=3 instead of 1/3,
+                             for extract_numbers and extract_number
+        """
+        self.lang = lang
+        self.short_scale = short_scale
+        self.ordinals = ordinals
+        self._words = []
+        # (short_scale, ordinals) -> IncrementalNumbers
+        self._numbers = {}
+
+    def __repr__(self):
+        return "{n}({t!r}, lang={l!r})".format(n=self.__class__.__name__,
+                                               t=self.text, l=self.lang)
+
+    @property
+    def words(self):
+        """ tuple(str): the words of the transcript """
+        return tuple(self._words)
+
+    @property
+    def text(self):
+        """ str: the transcript passed to the extractors """
+        return " ".join(self._words)
+
+    def append(self, text):
+        """ Add words at the end of the transcript
+
+        Args:
+            text (str): the new words
+        """
+        words = Normalizer.tokenize(text)
+        self._words.extend(words)
+        for numbers in self._numbers.values():
+            numbers.extend(words)
+
+    def update(self, text):
+        """ Replace the transcript with a new hypothesis
+
+        The words it shares with the previous one, from the start, are
+        kept; the following ones are replaced.
+
+        Args:
+            text (str): the whole transcript
+        """
+        words = Normalizer.tokenize(text)
+        common = 0
+        limit = min(len(words), len(self._words))
+        while common < limit and words[common] == self._words[common]:
+            common += 1
+        if common < len(self._words):
+            del self._words[common:]
+            for numbers in self._numbers.values():
+                numbers.truncate(common)
+        self._words.extend(words[common:])
+        for numbers in self._numbers.values():
+            numbers.extend(words[common:])
+
+    def reset(self):
+        """ Start a new, empty transcript """
+        self._words = []
+        self._numbers = {}
+
+    def _incremental_numbers(self, short_scale, ordinals):
+        key = (short_scale, ordinals)
+        if key not in self._numbers:
+            lang_code = get_primary_lang_code(self.lang) if self.lang \
+                else get_default_lang()
+            if lang_code not in get_active_langs():
+                return None
+            module = import_module(".lang.parse_" + lang_code,
+                                   "lingua_franca")
+            factory = getattr(module, "_incremental_numbers_" + lang_code,
+                              None)
+            if factory is None:
+                return None
+            self._numbers[key] = factory(short_scale, ordinals)
+            self._numbers[key].extend(self._words)
+        return self._numbers[key]
+
+    def _shared(self, *keys):
+        # the results the extractors share, with the numbers of the
+        # session for each (short_scale, ordinals)
+        shared = {}
+        text = self.text
+        for key in keys:
+            numbers = self._incremental_numbers(*key)
+            if numbers is not None:
+                numbers.share(shared, text)
+        return shared
+
+    def extract_numbers(self):
+        """ See lingua_franca.parse.extract_numbers() """
+        with sharing_results(self._shared((self.short_scale,
+                                           self.ordinals))):
+            return parse.extract_numbers(self.text, self.short_scale,
+                                         self.ordinals, lang=self.lang)
+
+    def extract_number(self):
+        """ See lingua_franca.parse.extract_number() """
+        return parse.extract_number(self.text, self.short_scale,
+                                    self.ordinals, lang=self.lang)
+
+    def extract_duration(self):
+        """ See lingua_franca.parse.extract_duration() """
+        with sharing_results(self._shared((True, False))):
+            return parse.extract_duration(self.text, lang=self.lang)
+
+    def extract_datetime(self, anchorDate=None, default_time=None):
+        """ See lingua_franca.parse.extract_datetime() """
+        # ordinals=None is how the datetime parser converts numbers
+        with sharing_results(self._shared((True, None))):
+            return parse.extract_datetime(self.text, anchorDate,
+                                          lang=self.lang,
+                                          default_time=default_time)
@@ -13,20 +13,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime
+import sys
+import time as _time
+from datetime import datetime, timedelta
 from dateutil.tz import gettz, tzlocal
 
+# resolved once: older versions of dateutil read the zoneinfo file on each
+# call of gettz
+_UTC = gettz("UTC")
+# (the settings of the time module it was made from, the local timezone)
+_local = (None, None)
+_HOUR = timedelta(hours=1)
+
+
+def _time_settings():
+    return _time.timezone, _time.altzone, _time.daylight, _time.tzname
+
 
 def default_timezone():
     """ Get the default timezone
 
-    default system value
+    default system value, made once and again when the settings of the
+    time module change (see refresh_timezone)
 
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    # Just go with system default timezone
-    return tzlocal()
+    global _local
+    settings = _time_settings()
+    cached_settings, tz = _local
+    if tz is None or settings != cached_settings:
+        # Just go with system default timezone
+        tz = tzlocal()
+        _local = (settings, tz)
+    return tz
+
+
+def refresh_timezone():
+    """ Take a change of the system timezone into account
+
+    Python reads the timezone from the TZ environment variable, or the
+    system configuration, when it starts. After changing either, call this
+    for default_timezone(), now_local() and to_local() to use the new one.
+    """
+    global _local
+    if hasattr(_time, "tzset"):
+        _time.tzset()
+    _local = (None, None)
 
 
 def now_utc():
@@ -60,11 +93,10 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
-    tzUTC = gettz("UTC")
     if dt.tzinfo:
-        return dt.astimezone(tzUTC)
+        return dt.astimezone(_UTC)
     else:
-        return dt.replace(tzinfo=gettz("UTC")).astimezone(tzUTC)
+        return dt.replace(tzinfo=_UTC)
 
 
 def to_local(dt):
@@ -79,4 +111,86 @@ def to_local(dt):
     if dt.tzinfo:
         return dt.astimezone(tz)
     else:
-        return dt.replace(tzinfo=gettz("UTC")).astimezone(tz)
+        return dt.replace(tzinfo=_UTC).astimezone(tz)
+
+
+def _is_datetime64_array(values):
+    # without importing NumPy, which is optional: an array can only have
+    # been made if it is imported
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray) and \
+        values.dtype.kind == "M"
+
+
+def to_utc_many(dts):
+    """ Convert many datetimes to UTC, see to_utc()
+
+    Args:
+        dts (iterable or numpy.ndarray): datetimes, or a NumPy array of
+            datetime64 values. These have no timezone, and are taken as UTC.
+    Returns:
+        (list(datetime) or numpy.ndarray): the datetimes converted to UTC,
+            or a copy of the array
+    """
+    if _is_datetime64_array(dts):
+        return dts.copy()
+    return [dt.astimezone(_UTC) if dt.tzinfo else dt.replace(tzinfo=_UTC)
+            for dt in dts]
+
+
+def to_local_many(dts):
+    """ Convert many datetimes to the user's local timezone, see to_local()
+
+    Args:
+        dts (iterable or numpy.ndarray): datetimes (if no timezone, defaults
+            to UTC), or a NumPy array of datetime64 values, in UTC
+    Returns:
+        (list(datetime) or numpy.ndarray): the datetimes converted to the
+            local timezone, or an array of the local times of the values,
+            without timezone like any datetime64 array
+    """
+    tz = default_timezone()
+    if _is_datetime64_array(dts):
+        return _local_times(dts, tz)
+    return [(dt if dt.tzinfo else dt.replace(tzinfo=_UTC)).astimezone(tz)
+            for dt in dts]
+
+
+def _utc_offset(utc_time, tz):
+    # in seconds, at a naive UTC datetime
+    return int(utc_time.replace(tzinfo=_UTC).astimezone(tz)
+               .utcoffset().total_seconds())
+
+
+def _local_times(values, tz):
+    # the offset of the timezone is looked up once per hour of the values,
+    # and once per value in the hours at the end of which it changes
+    numpy = sys.modules["numpy"]
+    flat = values.ravel()
+    hours, bucket = numpy.unique(flat.astype("datetime64[h]"),
+                                 return_inverse=True)
+    bucket = bucket.reshape(-1)
+    offsets = numpy.zeros(len(hours), dtype="timedelta64[s]")
+    changing = numpy.zeros(len(hours), dtype=bool)
+    hours = hours.astype(object)
+    # at the start of each hour, then of the next one, which is usually
+    # the following hour of the values
+    starts = [None if hour is None else _utc_offset(hour, tz)
+              for hour in hours]
+    for index, hour in enumerate(hours):
+        if hour is None:
+            # NaT, which stays NaT
+            continue
+        next_hour = hour + _HOUR
+        if index + 1 < len(hours) and hours[index + 1] == next_hour:
+            end = starts[index + 1]
+        else:
+            end = _utc_offset(next_hour, tz)
+        offsets[index] = starts[index]
+        changing[index] = starts[index] != end
+    result = flat + offsets[bucket]
+    for index in numpy.flatnonzero(changing[bucket]):
+        value = flat[index].astype("datetime64[us]").astype(object)
+        result[index] = flat[index] + numpy.timedelta64(
+            _utc_offset(value, tz), "s")
+    return result.reshape(values.shape)
@@ -0,0 +1,148 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+from lingua_franca import aio, config, get_active_langs, get_default_lang, \
+    load_language, set_default_lang, unload_language
+
+
+def setUpModule():
+    load_language("en")
+
+
+def tearDownModule():
+    unload_language("en")
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """ Counts the batches, and can make them slow """
+
+    def __init__(self, delay=0):
+        super().__init__(1)
+        self.delay = delay
+        self.batches = []
+
+    def submit(self, fn, *args):
+        self.batches.append(len(args[2]))
+
+        def slow():
+            time.sleep(self.delay)
+            return fn(*args)
+        return super().submit(slow)
+
+
+class TestAsyncFunctions(unittest.TestCase):
+    def tearDown(self):
+        executor = aio.get_executor()
+        aio.set_executor(None)
+        if executor:
+            executor.shutdown()
+
+    def test_results(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(run(aio.extract_number("twenty two", lang="en")),
+                         22)
+        self.assertEqual(run(aio.extract_datetime("tomorrow at noon",
+                                                  anchor, lang="en")),
+                         [datetime(2017, 6, 28, 12, 0), ""])
+        self.assertEqual(run(aio.nice_duration(60, lang="en")),
+                         "one minute")
+
+    def test_micro_batches(self):
+        executor = CountingExecutor()
+        aio.set_executor(executor)
+        texts = ["number {}".format(idx) for idx in range(10)]
+
+        async def concurrent_calls():
+            return await asyncio.gather(
+                *[aio.extract_number(text, lang="en") for text in texts])
+        self.assertEqual(run(concurrent_calls()), list(range(10)))
+        self.assertEqual(executor.batches, [10])
+
+        config.aio_max_batch = 4
+        try:
+            run(concurrent_calls())
+        finally:
+            config.aio_max_batch = 64
+        self.assertEqual(executor.batches[1:], [4, 4, 2])
+
+    def test_exceptions(self):
+        async def concurrent_calls():
+            return await asyncio.gather(
+                aio.nice_number(1.5, lang="en"),
+                aio.nice_number("x", lang="en"),
+                return_exceptions=True)
+        results = run(concurrent_calls())
+        self.assertEqual(results[0], "1 and a half")
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_timeout(self):
+        aio.set_executor(CountingExecutor(delay=0.2))
+        with self.assertRaises(asyncio.TimeoutError):
+            run(aio.extract_number("two", lang="en", timeout=0.01))
+        config.aio_timeout = 0.01
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                run(aio.extract_number("two", lang="en"))
+        finally:
+            config.aio_timeout = None
+        self.assertEqual(run(aio.extract_number("two", lang="en",
+                                                timeout=5)), 2)
+
+    def test_thread_executor_keeps_languages(self):
+        aio.set_executor(CountingExecutor(delay=0.2))
+
+        async def call_then(change):
+            future = asyncio.ensure_future(aio.extract_number("two"))
+            # the batch is flushed, and runs after the change
+            await asyncio.sleep(0.05)
+            change()
+            return await future
+        load_language("de")
+        try:
+            self.assertEqual(run(call_then(lambda: set_default_lang("de"))),
+                             2)
+            self.assertEqual(get_default_lang(), "de")
+            set_default_lang("en")
+            self.assertEqual(run(call_then(lambda: unload_language("de"))),
+                             2)
+            self.assertNotIn("de", get_active_langs())
+        finally:
+            set_default_lang("en")
+            unload_language("de")
+
+    def test_process_executor(self):
+        aio.set_executor(ProcessPoolExecutor(1))
+        self.assertEqual(run(aio.extract_number("twenty two", lang="en")),
+                         22)
+        with self.assertRaises(ValueError):
+            run(aio.nice_number("x", lang="en"))
+
+
+if __name__ == "__main__":
+    unittest.main()
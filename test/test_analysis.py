@@ -0,0 +1,72 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from lingua_franca import analyze, load_language, unload_language, \
+    set_default_lang
+from lingua_franca.lang import parse_en
+from lingua_franca.parse import extract_datetime, extract_duration, \
+    extract_number, extract_numbers, normalize
+
+
+def setUpModule():
+    load_language('en')
+    set_default_lang('en')
+
+
+def tearDownModule():
+    unload_language('en')
+
+
+class TestAnalysis(unittest.TestCase):
+    def test_same_results(self):
+        text = "remind me in two hours and 5 minutes to buy three apples"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        analysis = analyze(text)
+        self.assertEqual(analysis.normalize(), normalize(text))
+        self.assertEqual(analysis.extract_number(), extract_number(text))
+        self.assertEqual(analysis.extract_numbers(), extract_numbers(text))
+        self.assertEqual(analysis.extract_duration(), extract_duration(text))
+        self.assertEqual(analysis.extract_datetime(anchor),
+                         extract_datetime(text, anchor))
+        self.assertEqual(analysis.tokens[0].word, "remind")
+
+    def test_results_are_memoized(self):
+        analysis = analyze("in two hours", lang="en-us")
+        self.assertIs(analysis.extract_numbers(), analysis.extract_numbers())
+        self.assertIsNot(analysis.extract_numbers(),
+                         analysis.extract_numbers(ordinals=True))
+
+    def test_number_conversion_is_shared(self):
+        text = "remind me in two hours to buy 3 apples"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        analysis = analyze(text)
+        with patch.object(parse_en, "tokenize",
+                          wraps=parse_en.tokenize) as tokenize:
+            analysis.extract_numbers()
+            analysis.extract_duration()
+            analysis.extract_datetime(anchor)
+            analysis.normalize()
+            analysis.extract_datetime(anchor)
+        # extract_numbers and extract_duration share one conversion,
+        # normalize shares the one done by extract_datetime
+        self.assertEqual(tokenize.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
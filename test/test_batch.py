@@ -0,0 +1,106 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pickle
+import time
+import unittest
+from datetime import datetime
+from itertools import islice
+from multiprocessing.pool import RemoteTraceback
+
+from dateutil.tz import tzlocal
+
+from lingua_franca import batch, get_active_langs, load_language, \
+    unload_language
+from lingua_franca.lang.parse_common import tokenize
+from lingua_franca.lang.parse_en import _extract_numbers_with_text_en
+
+
+class TestBatchMap(unittest.TestCase):
+    def test_order(self):
+        texts = ["number {}".format(idx) for idx in range(25)]
+        for workers in (1, 2):
+            self.assertEqual(list(batch.map("extract_number", texts,
+                                            lang="en", workers=workers,
+                                            chunksize=4)),
+                             list(range(25)))
+
+    def test_functions(self):
+        self.assertEqual(list(batch.map("format.nice_duration", [60, 7200],
+                                        lang="en", workers=2)),
+                         ["one minute", "two hours"])
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(list(batch.map("extract_datetime",
+                                        ["tomorrow at noon"], lang="en",
+                                        workers=2, anchorDate=anchor)),
+                         [[datetime(2017, 6, 28, 12, 0), ""]])
+        with self.assertRaises(ValueError):
+            batch.map("fuzzy_match", ["a"], lang="en")
+
+    def test_exceptions(self):
+        results = batch.map("nice_number", [1.5, "x", 2], lang="en",
+                            workers=2, chunksize=1)
+        self.assertEqual(next(results), "1 and a half")
+        with self.assertRaises(ValueError) as context:
+            next(results)
+        self.assertIsInstance(context.exception.__cause__, RemoteTraceback)
+
+        results = list(batch.map("nice_number", [1.5, "x", 2], lang="en",
+                                 workers=2, return_exceptions=True))
+        self.assertEqual(results[0], "1 and a half")
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], "2")
+
+    def test_inputs_read_lazily(self):
+        read = []
+
+        def inputs():
+            for idx in range(1000):
+                read.append(idx)
+                yield "number {}".format(idx)
+
+        results = batch.map("extract_number", inputs(), lang="en",
+                            workers=2, chunksize=2)
+        self.assertEqual(next(results), 0)
+        time.sleep(0.2)
+        # the first chunk, and two chunks in flight per worker
+        self.assertLessEqual(len(read), 2 * (1 + 2 * 2))
+        self.assertEqual(list(islice(results, 9)), list(range(1, 10)))
+        self.assertLessEqual(len(read), 10 + 2 * (1 + 2 * 2))
+        results.close()
+
+    def test_language_not_kept(self):
+        unload_language("en")
+        self.assertEqual(list(batch.map("extract_number", ["two"],
+                                        lang="en", workers=2)), [2])
+        self.assertNotIn("en", get_active_langs())
+
+    def test_results_picklable(self):
+        load_language("en")
+        try:
+            numbers = _extract_numbers_with_text_en(tokenize("one and two"))
+            copies = pickle.loads(pickle.dumps(numbers))
+            self.assertEqual([(number.value, number.tokens)
+                              for number in copies],
+                             [(number.value, number.tokens)
+                              for number in numbers])
+        finally:
+            unload_language("en")
+        now = datetime.now(tzlocal())
+        self.assertEqual(pickle.loads(pickle.dumps(now)), now)
+
+
+if __name__ == "__main__":
+    unittest.main()
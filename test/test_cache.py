@@ -0,0 +1,140 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime, timedelta
+
+from dateutil.tz import gettz, tzoffset
+
+from lingua_franca import config, load_language, unload_language, \
+    cache_info, clear_cache
+from lingua_franca.cache import ResultCache
+from lingua_franca.format import nice_numbers, nice_time, \
+    pronounce_number
+from lingua_franca.parse import extract_datetime, extract_datetimes, \
+    extract_numbers, extract_duration_spans
+
+
+def setUpModule():
+    load_language("en")
+    config.cache_results = True
+
+
+def tearDownModule():
+    config.cache_results = False
+    clear_cache()
+    unload_language("en")
+
+
+class TestResultCache(unittest.TestCase):
+    def test_eviction(self):
+        result_cache = ResultCache(max_entries=2)
+        for key in "abc":
+            result_cache.put(key, key.upper())
+        self.assertEqual(result_cache.get("a"), (False, None))
+        self.assertEqual(result_cache.get("b"), (True, "B"))
+        result_cache.put("d", "D")
+        self.assertEqual(result_cache.get("b"), (True, "B"))
+        self.assertEqual(result_cache.get("c"), (False, None))
+        info = result_cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions,
+                          info.entries), (2, 2, 2, 2))
+
+    def test_max_size(self):
+        result_cache = ResultCache(max_size=1000)
+        result_cache.put("small", "x")
+        result_cache.put("big", "x" * 2000)
+        self.assertEqual(result_cache.get("big"), (False, None))
+        self.assertLessEqual(result_cache.info().size, 1000)
+
+
+class TestLocalizedFunctionCache(unittest.TestCase):
+    def setUp(self):
+        clear_cache()
+
+    def test_hits(self):
+        self.assertEqual(pronounce_number(5), "five")
+        self.assertEqual(pronounce_number(5, lang="en-us", places=2),
+                         "five")
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_argument_types(self):
+        self.assertEqual(pronounce_number(1), "one")
+        self.assertEqual(pronounce_number(1.5), "one point five")
+        self.assertEqual(cache_info().hits, 0)
+
+    def test_results_are_copied(self):
+        numbers = extract_numbers("one two three")
+        numbers.append(4)
+        self.assertEqual(extract_numbers("one two three"), [1, 2, 3])
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_nested_results_are_copied(self):
+        spans = extract_duration_spans("wait five minutes")[-1]
+        self.assertEqual(len(spans), 1)
+        spans.clear()
+        self.assertEqual(len(extract_duration_spans("wait five minutes")[-1]),
+                         1)
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_time_dependent(self):
+        extract_datetime("tomorrow")
+        extract_datetime("tomorrow")
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.uncached), (0, 0, 2))
+        anchor = datetime(2017, 6, 27)
+        self.assertEqual(extract_datetime("tomorrow", anchor),
+                         extract_datetime("tomorrow", anchor))
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_time_zones(self):
+        utc = datetime(2017, 6, 27, 12, 0, tzinfo=gettz("UTC"))
+        paris = datetime(2017, 6, 27, 14, 0, tzinfo=tzoffset(None, 7200))
+        self.assertEqual(utc, paris)
+        self.assertEqual(
+            extract_datetime("tomorrow at 5pm", utc)[0].utcoffset(),
+            timedelta(0))
+        self.assertEqual(
+            extract_datetime("tomorrow at 5pm", paris)[0].utcoffset(),
+            timedelta(hours=2))
+        self.assertEqual(nice_time(paris), "two o'clock")
+        self.assertEqual(nice_time(utc), "noon")
+        self.assertEqual(cache_info().hits, 0)
+        extract_datetime("tomorrow at 5pm", paris)
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_batches(self):
+        anchor = datetime(2017, 6, 27)
+        self.assertEqual(extract_datetimes(["tomorrow", "tomorrow"], anchor,
+                                           lang="en"),
+                         [extract_datetime("tomorrow", anchor, lang="en")] *
+                         2)
+        nice_numbers([1.5, 1.5], lang="en")
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 2))
+
+    def test_disabled(self):
+        config.cache_results = False
+        try:
+            pronounce_number(5)
+            pronounce_number(5)
+        finally:
+            config.cache_results = True
+        self.assertEqual(cache_info().misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
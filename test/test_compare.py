@@ -0,0 +1,102 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.compare import compare, failures, main
+
+
+def _run(results):
+    # a benchmarks.suite document, results: function -> warm_us or status
+    records = []
+    for function, result in results.items():
+        record = {"lang": "en", "module": "parse", "function": function,
+                  "status": "ok"}
+        if isinstance(result, str):
+            record["status"] = result
+        else:
+            record["warm_us"] = result
+            record["warm_samples_us"] = [result] * 10
+        records.append(record)
+    return {"languages": [{"lang": "en", "calibration_us": 1000.0}],
+            "results": records}
+
+
+BASELINE = _run({"extract_number": 100.0, "extract_numbers": 100.0,
+                 "extract_duration": 100.0, "extract_datetime": 100.0,
+                 "normalize": 100.0})
+
+
+class TestCompare(unittest.TestCase):
+    def verdicts(self, candidate):
+        return {row["function"]: row["verdict"]
+                for row in compare(BASELINE, _run(candidate))}
+
+    def test_verdicts(self):
+        self.assertEqual(
+            self.verdicts({"extract_number": 150.0,
+                           "extract_numbers": 50.0,
+                           "extract_duration": 105.0,
+                           "extract_datetime": "error",
+                           "nice_number": 10.0}),
+            {"extract_number": "regression",
+             "extract_numbers": "improvement",
+             "extract_duration": "ok",
+             "extract_datetime": "regression",
+             "normalize": "gone",
+             "nice_number": "new"})
+
+    def test_failures(self):
+        rows = compare(BASELINE, _run({"extract_number": 50.0,
+                                       "nice_number": 10.0}))
+        self.assertEqual(sorted(row["function"] for row in failures(rows)),
+                         ["extract_datetime", "extract_duration",
+                          "extract_numbers", "normalize"])
+
+    def exit_status(self, candidate):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, run in (("baseline", BASELINE),
+                              ("candidate", _run(candidate))):
+                paths.append(os.path.join(directory, name + ".json"))
+                with open(paths[-1], "w") as f:
+                    json.dump(run, f)
+            with redirect_stdout(io.StringIO()), \
+                    self.assertRaises(SystemExit) as exit:
+                main(paths)
+        return exit.exception.code
+
+    def test_exit_status(self):
+        unchanged = {"extract_number": 100.0, "extract_numbers": 100.0,
+                     "extract_duration": 100.0,
+                     "extract_datetime": 100.0, "normalize": 100.0}
+        self.assertEqual(self.exit_status(unchanged), 0)
+        self.assertEqual(self.exit_status(dict(unchanged,
+                                               extract_number=50.0,
+                                               nice_number=10.0)), 0)
+        self.assertEqual(self.exit_status(dict(unchanged,
+                                               extract_number=150.0)), 1)
+        gone = dict(unchanged)
+        del gone["normalize"]
+        self.assertEqual(self.exit_status(gone), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,7 @@ from lingua_franca import load_languages, unload_languages, set_default_lang, \
     get_primary_lang_code, get_active_langs, get_supported_langs
 from lingua_franca.internal import UnsupportedLanguageError
 from lingua_franca.format import nice_number
+from lingua_franca.format import nice_numbers
 from lingua_franca.format import nice_time
 from lingua_franca.format import nice_date
 from lingua_franca.format import nice_date_time
@@ -129,6 +130,35 @@ class TestNiceNumberFormat(unittest.TestCase):
         self.assertWarns(UserWarning, bypass_warning)
 
 
+class TestNiceNumbers(unittest.TestCase):
+    def test_same_as_nice_number(self):
+        numbers = list(NUMBERS_FIXTURE_EN) + [6.777, 2.333, -0.25, 10 ** 30]
+        for lang in ('en', 'de', 'fr'):
+            for speech in (True, False):
+                for denominators in (None, [1, 2, 3]):
+                    self.assertEqual(
+                        nice_numbers(numbers, lang=lang, speech=speech,
+                                     denominators=denominators),
+                        [nice_number(number, lang=lang, speech=speech,
+                                     denominators=denominators)
+                         for number in numbers])
+
+    def test_numpy_array(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("needs NumPy")
+        self.assertEqual(nice_numbers(numpy.array([0.5, 1.25, 3]),
+                                      lang='en'),
+                         ['a half', '1 and a forth', '3'])
+
+    def test_unknown_language(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertEqual(nice_numbers([5.5, 2], lang='as-df'),
+                             ['5.5', '2'])
+
+
 class TestPronounceNumber(unittest.TestCase):
     def test_convert_int(self):
         self.assertEqual(pronounce_number(0), "zero")
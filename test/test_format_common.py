@@ -16,7 +16,10 @@
 #
 
 import unittest
+from unittest.mock import patch
+
 from lingua_franca.lang.format_common import convert_to_mixed_fraction as cmf
+from lingua_franca.lang.format_common import convert_to_mixed_fractions
 
 
 class TestMixedFraction(unittest.TestCase):
@@ -26,3 +29,15 @@ class TestMixedFraction(unittest.TestCase):
         self.assertEqual(cmf(8.5), (8, 1, 2))
         self.assertEqual(cmf(8.587465135), None)
         self.assertEqual(cmf(8.587465135, range(1, 101)), (8, 47, 80))
+
+    def test_convert_many(self):
+        numbers = [8, 8.00001, 8.5, 8.587465135, -2.75, 0.333, True]
+        for denominators in (range(1, 21), [2, 4], range(1, 101)):
+            expected = [cmf(number, denominators) for number in numbers]
+            self.assertEqual(
+                convert_to_mixed_fractions(numbers, denominators), expected)
+            with patch("lingua_franca.lang.format_common._numpy",
+                       lambda: None):
+                self.assertEqual(
+                    convert_to_mixed_fractions(numbers, denominators),
+                    expected)
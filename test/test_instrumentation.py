@@ -0,0 +1,133 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import unittest
+from datetime import datetime
+
+from lingua_franca import load_language, unload_language, enable_stats, \
+    disable_stats, stats, export_stats
+from lingua_franca.format import nice_numbers, pronounce_number
+from lingua_franca.instrumentation import add_call_hook, remove_call_hook
+from lingua_franca.parse import extract_datetimes, extract_number
+
+
+def setUpModule():
+    load_language("en")
+    # calls in German fail, as it isn't loaded
+    unload_language("de")
+
+
+def tearDownModule():
+    unload_language("en")
+
+
+class TestCallHooks(unittest.TestCase):
+    def test_hook(self):
+        calls = []
+
+        def hook(*call):
+            calls.append(call)
+
+        add_call_hook(hook)
+        try:
+            pronounce_number(5, lang="en-us")
+            with self.assertRaises(ModuleNotFoundError):
+                extract_number("zwei", lang="de")
+        finally:
+            remove_call_hook(hook)
+        pronounce_number(5, lang="en")
+
+        self.assertEqual([call[:3] for call in calls],
+                         [("format", "pronounce_number", "en"),
+                          ("parse", "extract_number", "de")])
+        self.assertIsNone(calls[0][4])
+        self.assertIsInstance(calls[1][4], ModuleNotFoundError)
+        self.assertGreater(calls[0][3], 0)
+
+    def test_batches(self):
+        calls = []
+
+        def hook(*call):
+            calls.append(call)
+
+        add_call_hook(hook)
+        try:
+            extract_datetimes(["tomorrow", "no date"], datetime(2017, 6, 27),
+                              lang="en")
+            nice_numbers([1.5], lang="en-us")
+        finally:
+            remove_call_hook(hook)
+
+        self.assertEqual([call[:3] for call in calls],
+                         [("parse", "extract_datetime", "en")] * 2 +
+                         [("format", "nice_number", "en")])
+
+    def test_failing_hook(self):
+        def hook(*call):
+            raise KeyError("hook")
+
+        add_call_hook(hook)
+        try:
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual(pronounce_number(5, lang="en"), "five")
+            with self.assertWarns(RuntimeWarning), \
+                    self.assertRaises(ModuleNotFoundError):
+                extract_number("zwei", lang="de")
+        finally:
+            remove_call_hook(hook)
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        stats(reset=True)
+        enable_stats()
+
+    def tearDown(self):
+        disable_stats()
+        stats(reset=True)
+
+    def test_stats(self):
+        for _ in range(10):
+            extract_number("twenty two", lang="en")
+        with self.assertRaises(ModuleNotFoundError):
+            extract_number("zwei", lang="de")
+
+        snapshot = stats(reset=True)
+        call_stats = snapshot[("parse", "extract_number", "en")]
+        self.assertEqual(call_stats.calls, 10)
+        self.assertEqual(call_stats.errors, {})
+        self.assertLessEqual(call_stats.p50, call_stats.p99)
+        self.assertLessEqual(call_stats.p99, call_stats.max)
+        self.assertAlmostEqual(call_stats.mean * 10, call_stats.total)
+        self.assertEqual(snapshot[("parse", "extract_number", "de")].errors,
+                         {"ModuleNotFoundError": 1})
+        self.assertEqual(stats(), {})
+
+        records = json.loads(export_stats(snapshot))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(
+            {(record["function"], record["lang"], record["calls"])
+             for record in records},
+            {("extract_number", "en", 10), ("extract_number", "de", 1)})
+
+    def test_disabled(self):
+        disable_stats()
+        extract_number("twenty two", lang="en")
+        self.assertEqual(stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+import unittest
+import warnings
+from datetime import datetime
+
+from lingua_franca import budget, cache_info, clear_cache, config, \
+    load_languages, unload_languages
+from lingua_franca.internal import PartialResultWarning
+from lingua_franca.limits import Budget
+from lingua_franca.parse import extract_datetime, extract_datetimes, \
+    extract_number, extract_numbers
+
+
+def setUpModule():
+    load_languages(["en", "de"])
+
+
+def tearDownModule():
+    unload_languages(["en", "de"])
+
+
+class TestBudget(unittest.TestCase):
+    def test_limit_text(self):
+        limits = Budget(max_chars=10)
+        self.assertEqual(limits.limit_text("one two"), "one two")
+        self.assertFalse(limits.truncated)
+        self.assertEqual(limits.limit_text("one two three four"), "one two")
+        self.assertEqual(limits.limit_text("one two th four"), "one two th")
+        self.assertTrue(limits.truncated)
+
+    def test_max_chars(self):
+        with budget(max_chars=13) as limits:
+            self.assertEqual(extract_numbers("one two three four",
+                                             lang="en"), [1, 2, 3])
+            self.assertTrue(limits.partial)
+        with budget(max_chars=100) as limits:
+            self.assertEqual(extract_number("twenty two", lang="en"), 22)
+            self.assertFalse(limits.partial)
+
+    def test_deadline(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        for lang, text in (("en", "one " * 800), ("de", "eins zwei " * 400)):
+            with budget(seconds=0.02) as limits:
+                start = time.perf_counter()
+                numbers = extract_numbers(text, lang=lang)
+                extract_datetime(text, anchor, lang=lang)
+                self.assertLess(time.perf_counter() - start, 1)
+            self.assertTrue(limits.timed_out)
+            self.assertGreater(len(numbers), 0)
+            self.assertLess(len(numbers), 800)
+
+    def test_config(self):
+        config.max_input_chars = 7
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(extract_numbers("one two three",
+                                                 lang="en"), [1, 2])
+            self.assertTrue(any(issubclass(warning.category,
+                                           PartialResultWarning)
+                                for warning in caught))
+        finally:
+            config.max_input_chars = None
+        self.assertEqual(extract_numbers("one two three", lang="en"),
+                         [1, 2, 3])
+
+    def test_config_batches(self):
+        anchor = datetime(2017, 6, 27)
+        config.max_input_chars = 4
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(extract_datetimes(["soon, tomorrow"],
+                                                   anchor, lang="en"),
+                                 [None])
+            self.assertTrue(any(issubclass(warning.category,
+                                           PartialResultWarning)
+                                for warning in caught))
+        finally:
+            config.max_input_chars = None
+        self.assertIsNotNone(extract_datetimes(["soon, tomorrow"], anchor,
+                                               lang="en")[0])
+
+    def test_cache(self):
+        # complete results are cached, partial ones aren't
+        config.cache_results = True
+        config.max_input_chars = 100
+        clear_cache()
+        try:
+            self.assertEqual(extract_number("twenty two", lang="en"), 22)
+            self.assertEqual(extract_number("twenty two", lang="en"), 22)
+            self.assertEqual((cache_info().hits, cache_info().entries),
+                             (1, 1))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                extract_numbers("one " * 30, lang="en")
+            self.assertEqual((cache_info().uncached, cache_info().entries),
+                             (1, 1))
+            config.max_input_chars = None
+            with budget(seconds=0.02) as limits:
+                extract_numbers("one " * 800, lang="en")
+                self.assertTrue(limits.timed_out)
+                self.assertEqual(extract_numbers("one two", lang="en"),
+                                 [1, 2])
+            self.assertTrue(limits.partial)
+            self.assertEqual(cache_info().entries, 2)
+            self.assertEqual(extract_numbers("one two", lang="en"), [1, 2])
+            self.assertEqual(cache_info().hits, 2)
+        finally:
+            config.cache_results = False
+            config.max_input_chars = None
+            clear_cache()
+
+
+if __name__ == "__main__":
+    unittest.main()
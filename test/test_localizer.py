@@ -1,4 +1,7 @@
+import subprocess
+import sys
 import unittest
+import weakref
 
 from sys import version
 
@@ -182,6 +185,41 @@ class TestLanguageLoading(unittest.TestCase):
         with self.assertRaises(TypeError):
             lingua_franca._set_active_langs(157.75)
 
+    def test_unload_releases_modules(self):
+        unload_all_languages()
+        lingua_franca.load_languages(['en', 'de'])
+        self.assertEqual(lingua_franca.parse.extract_number('zwei',
+                                                            lang='de'), 2)
+        self.assertIn('lingua_franca.lang.parse_de', sys.modules)
+        parse_de = weakref.ref(sys.modules['lingua_franca.lang.parse_de'])
+
+        lingua_franca.unload_language('de', release_modules=True)
+        self.assertNotIn('lingua_franca.lang.parse_de', sys.modules)
+        self.assertNotIn('lingua_franca.lang.format_de', sys.modules)
+        self.assertIsNone(parse_de())
+        # Calls in the unloaded language don't import it back
+        with self.assertRaises(ModuleNotFoundError):
+            lingua_franca.parse.extract_number('zwei', lang='de')
+        self.assertNotIn('lingua_franca.lang.parse_de', sys.modules)
+
+        lingua_franca.load_language('de')
+        self.assertEqual(lingua_franca.parse.extract_number('zwei',
+                                                            lang='de'), 2)
+        lingua_franca.unload_language('de')
+        self.assertIn('lingua_franca.lang.parse_de', sys.modules)
+        unload_all_languages()
+
+    def test_language_footprint(self):
+        unload_all_languages()
+        lingua_franca.load_language('en')
+        lingua_franca.parse.extract_number('one')
+        report = lingua_franca.get_language_footprint()
+        self.assertIn('lingua_franca.lang.parse_en', report['en']['modules'])
+        self.assertGreater(report['en']['bytes'], 0)
+        self.assertEqual(lingua_franca.get_language_footprint(['tr']),
+                         {'tr': {'modules': [], 'bytes': 0}})
+        unload_all_languages()
+
 
 class TestLocalizerEdgeCases(unittest.TestCase):
     def test_pass_lang_code_positionally(self):
@@ -199,6 +237,23 @@ class TestLocalizerEdgeCases(unittest.TestCase):
             lingua_franca.parse.is_ordinal("twelve")
         unload_all_languages()
 
+    def test_get_localized_function(self):
+        from lingua_franca.internal import get_localized_function
+        from lingua_franca.lang.parse_en import extract_number_en
+        unload_all_languages()
+        with self.assertRaises(ModuleNotFoundError):
+            get_localized_function("parse", "extract_number", "en")
+        lingua_franca.load_language('en')
+        self.assertIs(get_localized_function("parse", "extract_number"),
+                      extract_number_en)
+        self.assertIs(get_localized_function("parse", "extract_number",
+                                             "en-us"),
+                      extract_number_en)
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            get_localized_function("parse", "is_ordinal", "en")
+        unload_all_languages()
+
 
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
@@ -239,3 +294,26 @@ class TestGetter(unittest.TestCase):
 #                lingua_franca.internal.UnsupportedLanguageError):
 #            lingua_franca.get_full_lang_code("bob robertson")
         unload_all_languages()
+
+
+class TestPackage(unittest.TestCase):
+    @unittest.skipIf(sys.version_info < (3, 7), "no module __getattr__")
+    def test_import_is_lazy(self):
+        code = ("import sys, lingua_franca; "
+                "print(sorted(name for name in sys.modules if name in "
+                "('lingua_franca.parse', 'lingua_franca.format', "
+                "'lingua_franca.batch', 'multiprocessing')))")
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.decode().strip(), "[]")
+
+    def test_lazy_attributes(self):
+        from lingua_franca import ParseSession, analyze, batch, profile
+        from lingua_franca.analysis import analyze as analysis_analyze
+        from lingua_franca.session import ParseSession as SessionClass
+        self.assertIs(ParseSession, SessionClass)
+        self.assertIs(analyze, analysis_analyze)
+        self.assertIs(batch, sys.modules["lingua_franca.batch"])
+        self.assertTrue(callable(profile))
+        self.assertIn("preload_for_fork", dir(lingua_franca))
+        with self.assertRaises(AttributeError):
+            lingua_franca.not_an_attribute
@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import io
+import random
 import unittest
 from datetime import datetime, timedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.lang.parse_common import TrackedText
+from lingua_franca.lang.parse_en import _clean_datetime_string_en
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
@@ -25,6 +29,10 @@ from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
+from lingua_franca.parse import extract_numbers_spans, extract_number_spans, \
+    extract_duration_spans, extract_datetime_spans, extract_datetime_plan
+from lingua_franca.parse import extract_datetimes
+from lingua_franca.parse import iter_numbers, iter_datetimes
 
 
 def setUpModule():
@@ -322,6 +330,9 @@ class TestNormalize(unittest.TestCase):
                          (timedelta(seconds=10.0), ""))
         self.assertEqual(extract_duration("5-minutes"),
                          (timedelta(minutes=5), ""))
+        # removing "3-hours" brings "two" next to "weeks"
+        self.assertEqual(extract_duration("two 3-hours weeks a"),
+                         (timedelta(weeks=2, hours=3), "a"))
 
     def test_extract_duration_case_en(self):
         self.assertEqual(extract_duration("Set a timer for 30 minutes"),
@@ -1067,5 +1078,208 @@ class TestNormalize(unittest.TestCase):
                           get_gender, "person", None)
 
 
+class TestExtractSpans(unittest.TestCase):
+    def _substrings(self, text, spans):
+        return [text[span.start:span.end] for span in spans]
+
+    def test_extract_numbers_spans(self):
+        text = "I have two hundred dogs, 3 cats and two point five fish"
+        spans = extract_numbers_spans(text)
+        self.assertEqual([span.value for span in spans], [200.0, 3.0, 2.5])
+        self.assertEqual(self._substrings(text, spans),
+                         ["two hundred", "3", "two point five"])
+        self.assertEqual(extract_numbers_spans("no numbers"), [])
+
+    def test_extract_number_spans(self):
+        text = "It costs Twenty Two dollars"
+        spans = extract_number_spans(text)
+        self.assertEqual([span.value for span in spans], [22])
+        self.assertEqual(self._substrings(text, spans), ["Twenty Two"])
+        self.assertEqual(extract_number_spans("nothing"), [])
+
+        # lowercasing 'İ' adds a character, offsets stay on the input
+        text = "İİ twenty"
+        spans = extract_number_spans(text)
+        self.assertEqual(spans[0].start, 3)
+        self.assertEqual(self._substrings(text, spans), ["twenty"])
+
+    def test_extract_duration_spans(self):
+        text = "Set a timer for three weeks, two days and 5-minutes please"
+        duration, remainder, spans = extract_duration_spans(text)
+        self.assertEqual((duration, remainder), extract_duration(text))
+        self.assertEqual([span.value for span in spans],
+                         [timedelta(weeks=3), timedelta(days=2),
+                          timedelta(minutes=5)])
+        self.assertEqual(self._substrings(text, spans),
+                         ["three weeks", "two days", "5-minutes"])
+        self.assertEqual(extract_duration_spans("nothing"),
+                         (None, "nothing", []))
+
+    def test_extract_datetime_spans(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        text = "Set up an appointment 2 weeks from Sunday at 5 pm please"
+        date, leftover, spans = extract_datetime_spans(text, anchor)
+        self.assertEqual([date, leftover], extract_datetime(text, anchor))
+        self.assertEqual(self._substrings(text, spans),
+                         ["2 weeks from Sunday at 5 pm"])
+        self.assertEqual(spans[0].value, date)
+
+        text = "What's the weather like tomorrow, and on Friday morning?"
+        date, leftover, spans = extract_datetime_spans(text, anchor)
+        self.assertEqual([date, leftover], extract_datetime(text, anchor))
+        self.assertEqual(self._substrings(text, spans),
+                         ["tomorrow, and on Friday morning"])
+
+        self.assertIsNone(extract_datetime_spans("no date here", anchor))
+
+
+def _clean_datetime_string_chained_en(s):
+    # extract_datetime_en's cleanup as the chain of str.replace it was
+    for old, new in (('?', ''), ('.', ''), (',', ''),
+                     (' the ', ' '), (' a ', ' '), (' an ', ' '),
+                     ("o' clock", "o'clock"), ("o clock", "o'clock"),
+                     ("o ' clock", "o'clock"), ("o 'clock", "o'clock"),
+                     ("oclock", "o'clock"), ("couple", "2"),
+                     ("centuries", "century"), ("decades", "decade"),
+                     ("millenniums", "millennium")):
+        s = s.replace(old, new)
+    return s
+
+
+class TestDatetimeCleanup(unittest.TestCase):
+    WORDS = ("the", "a", "an", "the,", "a?", "an.", "o", "'", "o'", "clock",
+             "'clock", "oclock", "couple", "couples", "centuries", "decades",
+             "millenniums", "tuesday", "last", "of", "evening", "5", "1999",
+             "ago", "at", "?", ".", ",", "then", "man", "ana")
+
+    def test_same_as_replace_chain(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            words = [rng.choice(self.WORDS)
+                     for _ in range(rng.randrange(1, 9))]
+            text = rng.choice(("", " ")).join(words) if \
+                rng.random() < 0.1 else " ".join(words)
+            expected = _clean_datetime_string_chained_en(text)
+            self.assertEqual(_clean_datetime_string_en(text), expected,
+                             text)
+            self.assertEqual(
+                _clean_datetime_string_en(TrackedText(text)).text, expected,
+                text)
+
+    def test_articles_before_punctuation(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            extract_datetime("last the, tuesday first 1999 5 ago", anchor,
+                             lang='en'),
+            [datetime(2017, 7, 4, 5, 0), 'first 1999'])
+        self.assertEqual(
+            extract_datetime("of a? evening", anchor, lang='en')[1], '')
+
+
+class TestDatetimePlan(unittest.TestCase):
+    def test_resolve(self):
+        anchors = [datetime(2017, 6, 27, 13, 4), datetime(2017, 6, 28, 23, 0),
+                   datetime(2020, 1, 3, 8, 30)]
+        for text in ["every tuesday at 4pm", "in two weeks",
+                     "remind me in 10 minutes to call mom",
+                     "what is the weather on June 5th, 2025",
+                     "the day after tomorrow at noon", "no date here", ""]:
+            plan = extract_datetime_plan(text)
+            for anchor in anchors:
+                self.assertEqual(plan.resolve(anchor),
+                                 extract_datetime(text, anchor), text)
+                self.assertEqual(
+                    plan.resolve(anchor, default_time=anchor.time()),
+                    extract_datetime(text, anchor,
+                                     default_time=anchor.time()), text)
+
+    def test_resolve_is_repeatable(self):
+        plan = extract_datetime_plan("next friday at 5 pm")
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(plan.resolve(anchor), plan.resolve(anchor))
+
+
+class TestExtractDatetimes(unittest.TestCase):
+    texts = ["every tuesday at 4pm", "in two weeks", "nothing here",
+             "remind me in 10 minutes", "the day after tomorrow at noon"]
+
+    def test_same_as_extract_datetime(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(extract_datetimes(self.texts, anchor),
+                         [extract_datetime(text, anchor)
+                          for text in self.texts])
+        self.assertEqual(extract_datetimes([], anchor), [])
+
+    def test_workers(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        texts = self.texts * 3
+        self.assertEqual(extract_datetimes(texts, anchor, workers=2,
+                                           chunksize=4),
+                         extract_datetimes(texts, anchor))
+
+
+class TestIterNumbers(unittest.TestCase):
+    text = ("I have twenty two dogs. And three hundred cats!\n"
+            "We meet tomorrow at noon. Nothing here.\n  Then 42")
+
+    def test_numbers_across_chunks(self):
+        expected = list(iter_numbers(self.text))
+        self.assertEqual([self.text[span.start:span.end]
+                          for span in expected],
+                         ["twenty two", "three hundred", "42"])
+        for size in (1, 5, 16):
+            chunks = [self.text[i:i + size]
+                      for i in range(0, len(self.text), size)]
+            self.assertEqual(list(iter_numbers(chunks)), expected)
+
+    def test_file(self):
+        stream = io.StringIO("one " * 5000 + "and twenty one")
+        spans = list(iter_numbers(stream, chunk_size=100, max_sentence=500))
+        self.assertEqual(len(spans), 5001)
+        self.assertEqual(spans[-1], (21, 20004, 20014))
+
+    def test_datetimes(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        spans = list(iter_datetimes(io.StringIO(self.text), anchor,
+                                    chunk_size=7))
+        self.assertEqual(spans[-1].value, datetime(2017, 6, 28, 12, 0))
+        self.assertEqual(self.text[spans[-1].start:spans[-1].end],
+                         "tomorrow at noon")
+
+    def test_datetimes_default_anchor(self):
+        # naive, as the default anchor of extract_datetime
+        span = next(iter_datetimes("We meet tomorrow.", lang='en'))
+        self.assertIsNone(span.value.tzinfo)
+        self.assertEqual(span.value,
+                         extract_datetime("We meet tomorrow.", lang='en')[0])
+
+    def test_without_spans(self):
+        load_language('de')
+        try:
+            spans = list(iter_numbers(["Ich habe zw", "ei Hunde. Drei"],
+                                      lang='de'))
+        finally:
+            unload_language('de')
+        self.assertEqual(spans, [(2, 0, 20), (3, 21, 25)])
+
+
+class TestNumberLexicons(unittest.TestCase):
+    def test_lexicons_are_shared(self):
+        from lingua_franca.lang.parse_en import _initialize_number_data_en
+        self.assertIs(_initialize_number_data_en(True, True),
+                      _initialize_number_data_en(True, True))
+        self.assertIsNot(_initialize_number_data_en(True, True),
+                         _initialize_number_data_en(False, True))
+
+    def test_lexicons_are_read_only(self):
+        from lingua_franca.lang.parse_en import _initialize_number_data_en
+        _, ordinals, scale = _initialize_number_data_en(True, True)
+        with self.assertRaises(TypeError):
+            scale["foo"] = 1
+        with self.assertRaises(TypeError):
+            ordinals["foo"] = 1
+        self.assertAlmostEqual(extract_number("three fifths"), 0.6)
+
+
 if __name__ == "__main__":
     unittest.main()
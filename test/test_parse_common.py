@@ -13,9 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime, time
+import pickle
+import random
+import re
 import unittest
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from lingua_franca.lang.parse_common import tokenize, Token, \
+    tokenize_with_offsets, TrackedText, ReplaceableNumber, DatetimeVocabulary, \
+    compile_duration_regexes, consume_durations, resolve_datetime, \
+    datetime_remainder
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +40,189 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+    def test_tokenize_with_offsets(self):
+        text = ' I am  #1, 15%'
+        tokens, offsets = tokenize_with_offsets(text)
+        self.assertEqual(tokens, tokenize(text))
+        self.assertEqual([text[start:end] for start, end in offsets],
+                         ['I', 'am', '#', '1,', '15', '%'])
+
+    def test_tokenize_with_offsets_lowercase(self):
+        # 'İ' lowercases to two characters, the offsets must not shift
+        text = 'İİ Twenty'
+        tokens, offsets = tokenize_with_offsets(text, lowercase=True)
+        self.assertEqual([token.word for token in tokens],
+                         ['i\u0307i\u0307', 'twenty'])
+        self.assertEqual(offsets, [(0, 2), (3, 9)])
+
+
+class TestReplaceableNumber(unittest.TestCase):
+    def test_attributes(self):
+        number = ReplaceableNumber(205, tokenize("two hundred five"))
+        self.assertEqual(number.text, "two hundred five")
+        self.assertEqual(number.start_index, 0)
+        self.assertEqual(number.end_index, 2)
+        self.assertTrue(number)
+        self.assertFalse(ReplaceableNumber(None, []))
+        self.assertFalse(hasattr(number, '__dict__'))
+
+    def test_immutable(self):
+        number = ReplaceableNumber(5, [Token("five", 0)])
+        with self.assertRaises(Exception):
+            number.value = 6
+        with self.assertRaises(Exception):
+            del number.tokens
+        self.assertEqual(number.value, 5)
+
+    def test_pickle(self):
+        number = ReplaceableNumber(5, [Token("five", 3)])
+        copy = pickle.loads(pickle.dumps(number))
+        self.assertEqual(copy.value, 5)
+        self.assertEqual(copy.tokens, [Token("five", 3)])
+        self.assertEqual(copy.text, "five")
+        self.assertEqual(copy.start_index, 3)
+
+
+class TestDatetimeVocabulary(unittest.TestCase):
+    def test_lookup(self):
+        vocabulary = DatetimeVocabulary(
+            weekdays=('monday', 'tuesday'), months=('may', 'june'),
+            months_short=('may', 'jun'), qualifiers_am=('morning',),
+            followups=('today',), date_words=('tomorrow',))
+        self.assertEqual(vocabulary.lookup('tuesday'),
+                         (DatetimeVocabulary.WEEKDAY, 1))
+        self.assertEqual(vocabulary.lookup('may'),
+                         (DatetimeVocabulary.MONTH, 0))
+        self.assertEqual(vocabulary.lookup('jun'),
+                         (DatetimeVocabulary.MONTH_SHORT, 1))
+        self.assertEqual(vocabulary.lookup('morning'),
+                         (DatetimeVocabulary.DATE_WORD, None))
+        self.assertEqual(vocabulary.lookup('dogs'),
+                         DatetimeVocabulary.NO_KEYWORD)
+        self.assertIn('today', vocabulary.followups)
+        self.assertIn('jun', vocabulary.followups)
+        with self.assertRaises(TypeError):
+            vocabulary.index['dogs'] = None
+
+
+class TestResolveDatetime(unittest.TestCase):
+    anchor = datetime(2017, 6, 27, 13, 4, 30, 5)
+
+    def test_nothing_found(self):
+        self.assertIsNone(resolve_datetime(self.anchor))
+        self.assertIsNone(resolve_datetime(self.anchor, dayOffset=False))
+
+    def test_explicit_date(self):
+        self.assertEqual(resolve_datetime(self.anchor, datestr="july 4"),
+                         datetime(2017, 7, 4))
+        self.assertEqual(resolve_datetime(self.anchor, datestr="may 4"),
+                         datetime(2018, 5, 4))
+        self.assertEqual(resolve_datetime(self.anchor, datestr="may 4 2016",
+                                          hasYear=True),
+                         datetime(2016, 5, 4))
+
+    def test_offsets(self):
+        self.assertEqual(resolve_datetime(self.anchor, found=True,
+                                          dayOffset=1, monthOffset=1),
+                         datetime(2017, 7, 28))
+        self.assertEqual(resolve_datetime(self.anchor, hrOffset=2,
+                                          hrAbs=-1, minAbs=-1),
+                         datetime(2017, 6, 27, 15, 4, 30))
+
+    def test_time(self):
+        self.assertEqual(resolve_datetime(self.anchor, found=True,
+                                          default_time=time(8, 15)),
+                         datetime(2017, 6, 28, 8, 15))
+        self.assertEqual(resolve_datetime(self.anchor, hrAbs=8,
+                                          daySpecified=True),
+                         datetime(2017, 6, 27, 8, 0))
+        self.assertEqual(resolve_datetime(self.anchor, hrAbs=18, minAbs=30),
+                         datetime(2017, 6, 27, 18, 30))
+        self.assertEqual(resolve_datetime(self.anchor, hrOffset=1, hrAbs=18,
+                                          replace_time=True),
+                         datetime(2017, 6, 27, 19, 0, 30))
+
+    def test_remainder(self):
+        words = ['', 'and', '', 'what', 'and', 'why', '']
+        self.assertEqual(datetime_remainder(words, 'and'),
+                         'what and why')
+        self.assertEqual(words, ['', '', '', 'what', 'and', 'why', ''])
+
+
+class TestTrackedText(unittest.TestCase):
+    def test_replace(self):
+        text = TrackedText("it is five o' clock, isn't it?")
+        text = text.replace("o' clock", "o'clock").replace(",", "")
+        self.assertEqual(text.text, "it is five o'clock isn't it?")
+        words, offsets = text.split()
+        self.assertEqual(words[3], "o'clock")
+        self.assertEqual(offsets[3], (11, 19))
+        self.assertEqual(offsets[4], (21, 26))
+
+    def test_sub(self):
+        text = TrackedText("it's 5 o clock.")
+        text = text.sub(re.compile(r"o clock|\."),
+                        lambda match: {"o clock": "o'clock"}.get(
+                            match.group(), ""))
+        self.assertEqual(text.text, "it's 5 o'clock")
+        self.assertEqual(text.span(7, 14), (7, 14))
+
+    def test_from_words(self):
+        original = "two hundred dogs"
+        text = TrackedText.from_words([("200", 0, 11), ("dogs", 12, 16)])
+        self.assertEqual(text.text, "200 dogs")
+        self.assertEqual(text.span(0, 3), (0, 11))
+        self.assertEqual(original[slice(*text.span(4, 8))], "dogs")
+        text = text.remove([(0, 4)])
+        self.assertEqual(text.text, "dogs")
+        self.assertEqual(text.span(0, 4), (12, 16))
+
+
+def _consume_durations_per_unit(text, units):
+    # extract_duration_en as it was: a re.sub per unit, in order
+    time_units = dict.fromkeys(units.values(), 0)
+    for word, unit in units.items():
+        def repl(match):
+            time_units[unit] += float(match.group(1))
+            return ''
+        text = re.sub(r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){}s?".format(
+            word), repl, text)
+    return time_units, text
+
+
+class TestConsumeDurations(unittest.TestCase):
+    UNITS = {'second': 'seconds', 'minute': 'minutes', 'hour': 'hours',
+             'day': 'days', 'week': 'weeks'}
+    WORDS = ("2", "3", "1.5", "3-hours", "2-day", "weeks", "hours", "minute",
+             "seconds", "day", "a", "and", "-", "hou", "rs")
+
+    def test_same_as_per_unit_passes(self):
+        regexes = compile_duration_regexes(self.UNITS, suffix="s?")
+        rng = random.Random(0)
+        for _ in range(5000):
+            text = " ".join(rng.choice(self.WORDS)
+                            for _ in range(rng.randrange(1, 8)))
+            time_units, remainder = consume_durations(text, regexes,
+                                                      self.UNITS)
+            expected = _consume_durations_per_unit(text, self.UNITS)
+            self.assertEqual(({unit: time_units[unit]
+                               for unit in self.UNITS.values()}, remainder),
+                             expected, text)
+            spans = []
+            tracked_units, tracked = consume_durations(
+                TrackedText(text), regexes, self.UNITS, spans)
+            self.assertEqual((tracked_units, tracked.text),
+                             (time_units, remainder))
+            self.assertEqual(sum(value for unit, value, start, end in spans),
+                             sum(time_units.values()))
+
+    def test_removal_brings_number_to_unit(self):
+        regexes = compile_duration_regexes(self.UNITS, suffix="s?")
+        spans = []
+        time_units, text = consume_durations(
+            TrackedText("2 3-hours weeks a"), regexes, self.UNITS, spans)
+        self.assertEqual((time_units['hours'], time_units['weeks']), (3, 2))
+        self.assertEqual(text.text.split(), ['a'])
+        self.assertEqual(spans, [('hours', 3.0, 2, 9),
+                                 ('weeks', 2.0, 0, 15)])
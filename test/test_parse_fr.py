@@ -367,6 +367,10 @@ class TestNormalize_fr(unittest.TestCase):
                              "film dure"))
         self.assertEqual(extract_duration("10-secondes", lang="fr-fr"),
                          (timedelta(seconds=10.0), ""))
+        # removing "10 minutes" brings "5" next to "heure"
+        self.assertEqual(extract_duration("5 dix minutes heure",
+                                          lang="fr-fr"),
+                         (timedelta(hours=5, minutes=10), ""))
         self.assertEqual(extract_duration("5-minutes", lang="fr-fr"),
                          (timedelta(minutes=5), ""))
 
@@ -443,6 +447,9 @@ class TestNormalize_fr(unittest.TestCase):
                          "1000e millésime")
         self.assertEqual(normalize("le trentième anniversaire", lang="fr-fr"),
                          "30e anniversaire")
+        self.assertEqual(normalize("je fête le trentième anniversaire",
+                                   lang="fr-fr"),
+                         "je fête 30e anniversaire")
 
     # TODO function not localized
     def test_gender_fr(self):
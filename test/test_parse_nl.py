@@ -19,6 +19,7 @@ from datetime import datetime, time, timedelta
 
 from lingua_franca import load_language, set_default_lang, unload_language
 from lingua_franca.parse import extract_datetime, extract_number, normalize, extract_duration
+from lingua_franca.parse import extract_numbers_spans
 
 
 LANG = "nl-nl"
@@ -213,6 +214,13 @@ class TestParsing(unittest.TestCase):
         self.assertEqual(extract_duration("een uurtje", LANG),
                          (timedelta(seconds=3600), ""))
 
+    def test_extract_numbers_spans(self):
+        text = "twee honden en drie katten"
+        spans = extract_numbers_spans(text, lang=LANG)
+        self.assertEqual([s.value for s in spans], [2.0, 3.0])
+        self.assertEqual([text[s.start:s.end] for s in spans],
+                         ["twee", "drie"])
+
 
 if __name__ == "__main__":
     unittest.main()
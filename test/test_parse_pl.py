@@ -155,6 +155,8 @@ class TestNormalize(unittest.TestCase):
                          (timedelta(seconds=10.0), ""))
         self.assertEqual(extract_duration("5-minut"),
                          (timedelta(minutes=5), ""))
+        self.assertEqual(extract_duration("2 tygodnie i 1 tydzień"),
+                         (timedelta(weeks=3), "i"))
 
     def test_extractdatetime_pl(self):
         def extractWithFormat(text):
@@ -0,0 +1,89 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import gc
+import os
+import unittest
+from datetime import datetime
+
+from lingua_franca import get_active_langs, load_language, \
+    unload_language, preload_for_fork
+from lingua_franca.format import nice_date_time, nice_duration
+from lingua_franca.parse import extract_datetime, extract_number, normalize
+
+SMAPS = "/proc/self/smaps_rollup"
+
+
+def private_kib():
+    total = 0
+    with open(SMAPS) as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def worker():
+    anchor = datetime(2017, 6, 27, 13, 4)
+    for _ in range(3):
+        extract_number("twenty two", lang="en")
+        extract_datetime("tomorrow at noon", anchor, lang="en")
+        normalize("it's twenty two", lang="en")
+        nice_duration(5400, lang="en")
+        nice_date_time(anchor, lang="en", now=anchor)
+    gc.collect()
+
+
+def private_growth_of_forked_worker():
+    """ The private memory a forked worker gains while it works, in KiB """
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            before = private_kib()
+            worker()
+            os.write(write_end, str(private_kib() - before).encode())
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as result:
+        growth = result.read()
+    os.waitpid(pid, 0)
+    return int(growth)
+
+
+class TestPreloadForFork(unittest.TestCase):
+    def tearDown(self):
+        if hasattr(gc, "unfreeze"):
+            gc.unfreeze()
+        unload_language("en")
+
+    def test_loads_languages(self):
+        preload_for_fork(["en"], freeze=False)
+        self.assertIn("en", get_active_langs())
+
+    @unittest.skipUnless(hasattr(os, "fork") and hasattr(gc, "freeze") and
+                         os.path.exists(SMAPS),
+                         "needs fork, gc.freeze and Linux")
+    def test_private_memory_of_workers(self):
+        load_language("en")
+        cold = private_growth_of_forked_worker()
+        preload_for_fork(["en"])
+        preloaded = private_growth_of_forked_worker()
+        self.assertLess(preloaded, cold)
+
+
+if __name__ == "__main__":
+    unittest.main()
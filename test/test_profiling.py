@@ -0,0 +1,78 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import sys
+import threading
+import unittest
+from datetime import datetime
+
+from lingua_franca import load_language, unload_language, profile
+from lingua_franca.parse import extract_datetime, extract_number
+
+
+def setUpModule():
+    load_language("en")
+
+
+def tearDownModule():
+    unload_language("en")
+
+
+class TestProfile(unittest.TestCase):
+    def test_stacks(self):
+        with profile() as p:
+            extract_datetime("in two hours", datetime(2017, 6, 27),
+                             lang="en")
+        self.assertIsNone(sys.getprofile())
+
+        stacks = p.stacks()
+        self.assertIn(("parse.extract_datetime",
+                       "lang.parse_en.extract_datetime_en"), stacks)
+        self.assertTrue(all(key[0] == "parse.extract_datetime"
+                            for key in stacks))
+        functions = p.functions()
+        calls, own, cumulative = functions["parse.extract_datetime"]
+        self.assertEqual(calls, 1)
+        self.assertLessEqual(own, cumulative)
+        self.assertAlmostEqual(cumulative,
+                               sum(own for _, own in stacks.values()))
+
+    def test_reports(self):
+        with profile() as p:
+            extract_number("twenty two", lang="en")
+        self.assertIn("lang.parse_en.extract_number_en", p.report())
+        self.assertIn("  lang.parse_en.extract_number_en", p.tree(0))
+        for line in p.collapsed().splitlines():
+            stack, own = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("parse.extract_number"))
+            self.assertGreaterEqual(int(own), 0)
+
+    def test_threads(self):
+        with profile() as p:
+            thread = threading.Thread(
+                target=lambda: extract_number("twenty two", lang="en"))
+            thread.start()
+            thread.join()
+        self.assertEqual(p.functions()["parse.extract_number"][0], 1)
+
+    def test_stopped(self):
+        with profile() as p:
+            pass
+        extract_number("twenty two", lang="en")
+        self.assertEqual(p.functions(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+from lingua_franca.scan import scan
+
+TEXT = "I have twenty two dogs\n\nwake me tomorrow at noon\r\nfor 5 minutes"
+
+
+class TestScan(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def scan(self, path, **kwargs):
+        output = io.StringIO()
+        stats = scan(path, output, lang="en", **kwargs)
+        return stats, [json.loads(line)
+                       for line in output.getvalue().splitlines()]
+
+    def test_text(self):
+        path = self.write("utterances.txt", TEXT)
+        functions = ["extract_number", "extract_duration", "extract_datetime"]
+        stats, records = self.scan(
+            path, functions=functions,
+            anchorDate=datetime(2017, 6, 27, 13, 4), workers=1)
+        self.assertEqual(stats["utterances"], 3)
+        self.assertEqual(stats["bytes"], len(TEXT))
+        self.assertEqual([record["offset"] for record in records],
+                         [0, 24, 50])
+        self.assertEqual(records[1]["text"], "wake me tomorrow at noon")
+        self.assertEqual(records[0]["extract_number"], 22)
+        self.assertEqual(records[1]["extract_datetime"],
+                         ["2017-06-28T12:00:00", "wake me"])
+        self.assertEqual(records[2]["extract_duration"], [300.0, "for"])
+
+    def test_workers(self):
+        path = self.write("utterances.txt", TEXT * 20)
+        self.assertEqual(self.scan(path, workers=2, chunk_bytes=100)[1],
+                         self.scan(path, workers=1)[1])
+
+    def test_jsonl(self):
+        path = self.write("utterances.jsonl",
+                          '{"id": 1, "utterance": "three cats"}\n'
+                          '"two hours"\nnot json\n{"text": "one"}\n')
+        records = self.scan(path, functions=["normalize"])[1]
+        self.assertEqual(records[0], {"id": 1, "utterance": "three cats",
+                                      "normalize": "3 cats"})
+        self.assertEqual(records[1]["normalize"], "2 hours")
+        self.assertIn("input", records[2]["errors"])
+        self.assertIn("input", records[3]["errors"])
+        self.assertEqual(self.scan(path, functions=["normalize"],
+                                   field="text")[1][3]["normalize"], "1")
+
+    def test_errors(self):
+        path = self.write("empty.txt", "")
+        self.assertEqual(self.scan(path)[1], [])
+        with self.assertRaises(ValueError):
+            self.scan(path, functions=["nice_number"])
+
+    def test_command(self):
+        path = self.write("utterances.txt", TEXT)
+        process = subprocess.run(
+            [sys.executable, "-m", "lingua_franca", "scan", path,
+             "--functions", "extract_numbers", "--workers", "1"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+            universal_newlines=True)
+        self.assertEqual([json.loads(line)["extract_numbers"]
+                          for line in process.stdout.splitlines()],
+                         [[22.0], [], [5.0]])
+        self.assertIn("3 utterances", process.stderr)
+
+    def test_command_bad_anchor(self):
+        path = self.write("utterances.txt", TEXT)
+        process = subprocess.run(
+            [sys.executable, "-m", "lingua_franca", "scan", path,
+             "--anchor", "notadate", "--workers", "1"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(process.stderr,
+                         "error: 'notadate' isn't a date in ISO format\n")
@@ -0,0 +1,128 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from threading import Thread
+
+from lingua_franca import load_language, unload_language
+from lingua_franca.serve import Client, ServerError, handle_request
+
+
+def setUpModule():
+    load_language('en')
+
+
+def tearDownModule():
+    unload_language('en')
+
+
+class TestHandleRequest(unittest.TestCase):
+    def call(self, request):
+        return json.loads(handle_request(json.dumps(request).encode("utf8")))
+
+    def test_result(self):
+        self.assertEqual(self.call({"id": 3, "function": "extract_number",
+                                    "args": ["twenty two"],
+                                    "kwargs": {"lang": "en"}}),
+                         {"id": 3, "result": 22})
+        self.assertEqual(self.call({"function": "extract_datetime",
+                                    "args": ["tomorrow at noon", {
+                                        "datetime": "2017-06-27T13:04:00"}],
+                                    "kwargs": {"lang": "en"}})["result"],
+                         [{"datetime": "2017-06-28T12:00:00"}, ""])
+        self.assertEqual(self.call({"function": "format.nice_duration",
+                                    "args": [{"timedelta": 90}],
+                                    "kwargs": {"lang": "en"}})["result"],
+                         "one minute thirty seconds")
+
+    def test_errors(self):
+        self.assertEqual(self.call({"id": 1, "function": "fuzzy_match"})
+                         ["error"]["type"], "ValueError")
+        self.assertEqual(self.call({"function": "nice_number",
+                                    "args": ["x"]})["error"]["type"],
+                         "ValueError")
+        response = json.loads(handle_request(b"not json"))
+        self.assertIsNone(response["id"])
+        self.assertIn("error", response)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix sockets")
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "lf.sock")
+        self.server = subprocess.Popen(
+            [sys.executable, "-m", "lingua_franca", "serve", "--socket",
+             self.path, "--langs", "en", "--workers", "2"],
+            stderr=subprocess.PIPE)
+        # the server says it is ready once the languages are loaded
+        self.assertIn(b"serving", self.server.stderr.readline())
+
+    def tearDown(self):
+        self.server.terminate()
+        self.server.wait(10)
+        self.server.stderr.close()
+        self.assertFalse(os.path.exists(self.path))
+        self.directory.cleanup()
+
+    def test_calls(self):
+        with Client(self.path, timeout=10) as client:
+            self.assertEqual(client.call("extract_number", "twenty two",
+                                         lang="en"), 22)
+            self.assertEqual(
+                client.call("extract_datetime", "tomorrow at noon",
+                            datetime(2017, 6, 27, 13, 4), lang="en"),
+                [datetime(2017, 6, 28, 12, 0), ""])
+            self.assertEqual(client.call("extract_duration", "90 seconds",
+                                         lang="en"),
+                             [timedelta(seconds=90), ""])
+            with self.assertRaises(ServerError) as context:
+                client.call("extract_number", "un", lang="fr")
+            self.assertEqual(context.exception.type, "ModuleNotFoundError")
+            # the connection is still usable after an error
+            self.assertEqual(client.call("format.nice_number", 1.5,
+                                         lang="en"), "1 and a half")
+
+    def test_concurrent_clients(self):
+        results = {}
+
+        def run(index):
+            with Client(self.path, timeout=10) as client:
+                results[index] = [client.call("extract_number",
+                                              "number {}".format(number),
+                                              lang="en")
+                                  for number in range(index, index + 20)]
+
+        threads = [Thread(target=run, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {index: list(range(index, index + 20))
+                                   for index in range(4)})
+
+    def test_socket_in_use(self):
+        process = subprocess.run(
+            [sys.executable, "-m", "lingua_franca", "serve", "--socket",
+             self.path], stderr=subprocess.PIPE, timeout=30)
+        self.assertNotEqual(process.returncode, 0)
+        self.assertIn(b"already listening", process.stderr)
@@ -0,0 +1,140 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from lingua_franca import ParseSession, load_language, unload_language
+from lingua_franca.parse import extract_datetime, extract_duration, \
+    extract_number, extract_numbers
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+PARTIALS = ["remind me at", "remind me at five", "remind me at five thirty",
+            "remind me at five thirty tomorrow",
+            "remind me at six", "remind me at six in twenty two minutes",
+            "you are the 1st one", "set a timer for two hours and 5"]
+
+
+def _result(function, *args, **kwargs):
+    # the result of the call, or the type of the exception it raised
+    try:
+        return function(*args, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+def setUpModule():
+    load_language('en')
+
+
+def tearDownModule():
+    unload_language('en')
+
+
+class TestParseSession(unittest.TestCase):
+    def test_same_as_extractors(self):
+        session = ParseSession(lang='en')
+        for partial in PARTIALS:
+            session.update(partial)
+            self.assertEqual(session.text, partial)
+            self.assertEqual(session.extract_numbers(),
+                             extract_numbers(partial, lang='en'))
+            self.assertEqual(session.extract_datetime(ANCHOR),
+                             extract_datetime(partial, ANCHOR, lang='en'))
+            self.assertEqual(session.extract_duration(),
+                             extract_duration(partial, lang='en'))
+
+    def test_append(self):
+        session = ParseSession(lang='en')
+        for word in "wake me in twenty two minutes".split():
+            session.append(word)
+        self.assertEqual(session.words,
+                         ("wake", "me", "in", "twenty", "two", "minutes"))
+        self.assertEqual(session.extract_number(), 22)
+        self.assertEqual(session.extract_duration(),
+                         (timedelta(minutes=22), "wake me in"))
+        session.reset()
+        self.assertEqual(session.extract_number(), False)
+
+    def test_numbers_found_again_for_number_words(self):
+        from lingua_franca.lang import parse_en
+        calls = []
+        helper = parse_en._extract_numbers_from_text_en
+
+        def counting(text, *args):
+            calls.append(text)
+            return helper(text, *args)
+
+        with patch.object(parse_en, "_extract_numbers_from_text_en",
+                          counting):
+            numbers = parse_en._incremental_numbers_en()
+        numbers.extend("at five thirty".split())
+        self.assertEqual([number.value for number in numbers.numbers],
+                         [5, 30])
+        numbers.extend("to call mom".split())
+        self.assertEqual([number.value for number in numbers.numbers],
+                         [5, 30])
+        self.assertEqual(calls, ["at five thirty"])
+        # a revised hypothesis
+        numbers.truncate(2)
+        numbers.extend(["six"])
+        self.assertEqual([number.value for number in numbers.numbers],
+                         [5, 6])
+        self.assertEqual(calls[-1], "at five six")
+
+    def test_random_partials(self):
+        # the session gives what the extractors give, whatever the
+        # revisions of the transcript
+        vocabulary = ("remind me in at the a an and half two three five "
+                      "twenty hundred thousand third first second days "
+                      "minutes hours one point tomorrow quarter past noon "
+                      "of cup minus 5 12 3/4 weeks next monday ago pm "
+                      "dozen 1st 2nd 25th 1.5").split()
+        rng = random.Random(48)
+        for _ in range(150):
+            session = ParseSession(lang='en')
+            words = []
+            for _ in range(rng.randint(1, 8)):
+                if words and rng.random() < 0.2:
+                    del words[rng.randint(0, len(words)):]
+                words.append(rng.choice(vocabulary))
+                partial = " ".join(words)
+                session.update(partial)
+                self.assertEqual(session.extract_numbers(),
+                                 extract_numbers(partial, lang='en'),
+                                 partial)
+                self.assertEqual(session.extract_number(),
+                                 extract_number(partial, lang='en'),
+                                 partial)
+                self.assertEqual(_result(session.extract_duration),
+                                 _result(extract_duration, partial,
+                                         lang='en'), partial)
+                self.assertEqual(_result(session.extract_datetime, ANCHOR),
+                                 _result(extract_datetime, partial, ANCHOR,
+                                         lang='en'), partial)
+
+    def test_other_languages(self):
+        load_language('de')
+        try:
+            session = ParseSession(lang='de')
+            session.update("ich habe zwei")
+            session.update("ich habe zwei Hunde und drei")
+            self.assertEqual(session.extract_numbers(),
+                             extract_numbers("ich habe zwei Hunde und drei",
+                                             lang='de'))
+        finally:
+            unload_language('de')
@@ -0,0 +1,86 @@
+#
+# Copyright 2018 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from dateutil.tz import gettz
+
+from lingua_franca.time import default_timezone, refresh_timezone, \
+    to_local, to_local_many, to_utc, to_utc_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# around the start of daylight saving time in New York, 2020-03-08 7:00 UTC
+TIMES = [datetime(2020, 3, 8, 6, 59), datetime(2020, 3, 8, 7),
+         datetime(2020, 3, 8, 7, 0, tzinfo=gettz("Europe/Paris")),
+         datetime(2020, 7, 1, 12, 30)]
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+class TestLocalTimezone(unittest.TestCase):
+    def setUp(self):
+        environ = patch.dict(os.environ, {"TZ": "America/New_York"})
+        environ.start()
+        self.addCleanup(refresh_timezone)
+        self.addCleanup(environ.stop)
+        refresh_timezone()
+
+    def test_cached(self):
+        self.assertIs(default_timezone(), default_timezone())
+
+    def test_refresh(self):
+        self.assertEqual(to_local(datetime(2020, 1, 1, 12)).utcoffset(),
+                         timedelta(hours=-5))
+        os.environ["TZ"] = "Asia/Kolkata"
+        refresh_timezone()
+        self.assertEqual(to_local(datetime(2020, 1, 1, 12)).utcoffset(),
+                         timedelta(hours=5, minutes=30))
+
+    def test_many(self):
+        self.assertEqual(to_utc_many(TIMES), [to_utc(dt) for dt in TIMES])
+        local = to_local_many(iter(TIMES))
+        self.assertEqual(local, [to_local(dt) for dt in TIMES])
+        self.assertEqual([dt.utcoffset() for dt in local],
+                         [timedelta(hours=-5), timedelta(hours=-4),
+                          timedelta(hours=-5), timedelta(hours=-4)])
+
+    @unittest.skipIf(numpy is None, "needs NumPy")
+    def test_numpy_array(self):
+        # New York and Newfoundland change at 2am local time, in the middle
+        # of an hour in UTC for the latter
+        values = numpy.arange("2020-03-08T05:00", "2020-03-08T08:00",
+                              dtype="datetime64[m]").reshape(2, -1)
+        for zone in ("America/New_York", "America/St_Johns"):
+            os.environ["TZ"] = zone
+            refresh_timezone()
+            local = to_local_many(values)
+            self.assertEqual(local.shape, values.shape)
+            expected = [to_local(dt).replace(tzinfo=None)
+                        for dt in values.ravel().astype(object)]
+            self.assertEqual(list(local.ravel().astype(object)), expected)
+        self.assertTrue((to_utc_many(values) == values).all())
+        self.assertTrue(numpy.isnat(to_local_many(
+            numpy.array(["NaT"], dtype="datetime64[s]"))).all())
+
+
+if __name__ == "__main__":
+    unittest.main()